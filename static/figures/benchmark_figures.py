@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Per-figure benchmark suite with regression baselines.
+
+Runs every registered figure (see figure_registry.py) in a fresh Python
+process, so import costs are real, and records for each one:
+
+    import_s      importing the producer's top-level modules (numpy, matplotlib, scipy...)
+    compute_s     everything outside savefig: NumPy work plus building artists
+    draw_s        FigureCanvasAgg.draw - drawing artists and Agg rasterization
+    encode_s      rest of savefig: tight-bbox measurement, PNG encode, file write
+    dark_s        the dark-theme copy save_figure() renders after the PNG (0 in draft mode)
+    total_s       import_s + script wall time
+    peak_rss_mb   peak resident memory of the process
+    output_bytes  size of the PNG files written
+
+Figures are rendered into a temporary directory, so benchmarking never
+touches the committed PNGs. Each run is appended to a JSON history file in
+the build cache; --save-baseline stores the run as the committed baseline,
+and --compare flags metrics that got worse than the baseline by more than a
+noise threshold (exit status 1 when anything regressed).
+
+USAGE:
+------
+    cd static/figures
+    python benchmark_figures.py                       # all figures, append to history
+    python benchmark_figures.py mcmc clt -r 5         # selected figures, median of 5 runs
+    python benchmark_figures.py --save-baseline
+    python benchmark_figures.py --compare --threshold 0.15
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from figure_registry import FIGURES_DIR, cache_dir, select
+from figure_runner import failure
+
+BASELINE_FILE = FIGURES_DIR / 'benchmark_baseline.json'
+METRICS = ('import_s', 'compute_s', 'draw_s', 'encode_s', 'dark_s', 'total_s', 'peak_rss_mb', 'output_bytes')
+# Absolute slack per metric, so tiny figures are not flagged for sub-noise changes
+NOISE_FLOOR = {'import_s': 0.05, 'compute_s': 0.02, 'draw_s': 0.02, 'encode_s': 0.02, 'dark_s': 0.02,
+               'total_s': 0.05, 'peak_rss_mb': 5.0, 'output_bytes': 1024}
+
+
+def history_file():
+    return cache_dir('bench') / 'history.json'
+
+
+def run_once(job):
+    """Benchmark job in a fresh interpreter; returns its metrics dict."""
+    with tempfile.TemporaryDirectory(prefix='figbench-') as workdir:
+        result = Path(workdir) / 'result.json'
+        proc = subprocess.run(
+            [sys.executable, str(FIGURES_DIR / 'figure_runner.py'), job.key,
+             '--workdir', workdir, '--result', str(result)],
+            cwd=FIGURES_DIR, capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(f'{job.key} failed: {failure(proc)}')
+        return json.loads(result.read_text())
+
+
+def benchmark(jobs, repeats):
+    """Return {job key: median metrics over repeats}; failures are reported and skipped."""
+    results = {}
+    for job in jobs:
+        try:
+            runs = [run_once(job) for _ in range(repeats)]
+        except RuntimeError as err:
+            print(f"✗ {err}", file=sys.stderr)
+            continue
+        results[job.key] = {m: statistics.median(run[m] for run in runs) for m in METRICS}
+        r = results[job.key]
+        print(f"  {job.name:<32} total {r['total_s']:6.2f}s  compute {r['compute_s']:6.2f}s  "
+              f"draw {r['draw_s']:5.2f}s  encode {r['encode_s']:5.2f}s  dark {r['dark_s']:5.2f}s  "
+              f"rss {r['peak_rss_mb']:6.0f}MB  {r['output_bytes'] / 1024:6.0f}KB")
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=FIGURES_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def make_record(results, repeats):
+    import matplotlib
+    import numpy
+
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'matplotlib': matplotlib.__version__,
+        'numpy': numpy.__version__,
+        'machine': platform.machine(),
+        'repeats': repeats,
+        'figures': results,
+    }
+
+
+def load_json(path, default):
+    try:
+        return json.loads(Path(path).read_text())
+    except FileNotFoundError:
+        return default
+
+
+def compare(results, baseline, threshold):
+    """Return a list of (figure, metric, old, new) that regressed beyond the noise threshold."""
+    regressions = []
+    for key, metrics in results.items():
+        old = baseline['figures'].get(key)
+        if old is None:
+            continue
+        for metric in METRICS:
+            before, after = old.get(metric), metrics[metric]
+            if before is None:
+                continue
+            if after > before * (1 + threshold) and after - before > NOISE_FLOOR[metric]:
+                regressions.append((key, metric, before, after))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark figure generators.')
+    parser.add_argument('figures', nargs='*', help='figure names or keys (default: all)')
+    parser.add_argument('-r', '--repeats', type=int, default=3, help='runs per figure, median is kept (default: 3)')
+    parser.add_argument('--save-baseline', action='store_true', help=f'store this run as {BASELINE_FILE.name}')
+    parser.add_argument('--compare', action='store_true', help='flag regressions against the baseline')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='relative slowdown tolerated as noise (default: 0.10)')
+    args = parser.parse_args()
+
+    jobs = select(args.figures)
+    print(f"Benchmarking {len(jobs)} figures ({args.repeats} runs each)...\n")
+    results = benchmark(jobs, args.repeats)
+    record = make_record(results, args.repeats)
+
+    history = load_json(history_file(), [])
+    history.append(record)
+    history_file().write_text(json.dumps(history, indent=1))
+    print(f"\n✓ Appended run to {history_file()}")
+
+    if args.save_baseline:
+        BASELINE_FILE.write_text(json.dumps(record, indent=1, sort_keys=True) + '\n')
+        print(f"✓ Saved baseline to {BASELINE_FILE.name}")
+
+    if args.compare:
+        baseline = load_json(BASELINE_FILE, None)
+        if baseline is None:
+            raise SystemExit("No baseline yet; run with --save-baseline first")
+        regressions = compare(results, baseline, args.threshold)
+        for key, metric, before, after in regressions:
+            change = f" (+{(after / before - 1) * 100:.0f}%)" if before else ''
+            print(f"✗ {key}: {metric} {before:.3f} → {after:.3f}{change}")
+        if regressions:
+            sys.exit(1)
+        print(f"✓ No regressions against baseline {baseline.get('revision')} (threshold {args.threshold:.0%})")
+
+
+if __name__ == '__main__':
+    main()
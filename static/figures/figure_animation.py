@@ -0,0 +1,144 @@
+"""
+Animated figures: sequential processes (MCMC chains, optimizer paths) as WebP or MP4.
+
+With FIGURES_ANIMATE=webp or mp4 (generate_figures.py --animate), the
+generators that show a process also export it as an animation next to
+their PNG:
+
+    def init():                      # like FuncAnimation's init_func
+        trace.set_data([], [])
+        return [trace]
+    def update(i):                   # like FuncAnimation's func with blit=True
+        trace.set_data(t[:i], x[:i])
+        return [trace]
+    save_animation('mcmc_sampling.webp', fig, update, frames=200, init=init)
+
+Animation.save() redraws the whole figure for every frame, blit or not,
+and PillowWriter keeps every frame in memory until the end. Here the
+artists init() returns are marked animated and the rest of the figure
+(contours, target densities, axes, labels) is drawn once; every frame
+restores that cached background, draws only the artists update() returns
+and goes straight to the encoder, so a frame costs a few artists and no
+frame is kept:
+
+    ffmpeg        frames piped as raw RGBA (MP4 with libx264, WebP with libwebp_anim)
+    Pillow        WebP only, when ffmpeg is not installed: the animated WebP
+                  encoder pulls the frames one at a time as it encodes them
+
+Files are written next to their destination and moved into place when
+complete; the suffix follows FIGURES_ANIMATE.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+import matplotlib
+from PIL import Image
+
+FPS = 20
+WEBP_QUALITY = 80
+FFMPEG_CODECS = {
+    '.mp4': ['-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-c:v', 'libx264', '-pix_fmt', 'yuv420p', '-crf', '23'],
+    '.webp': ['-c:v', 'libwebp_anim', '-loop', '0', '-quality', str(WEBP_QUALITY)],
+}
+
+
+def animation_format():
+    """'webp' or 'mp4' when animations are exported, else ''."""
+    return os.environ.get('FIGURES_ANIMATE', '').lower().lstrip('.')
+
+
+def blit_frames(fig, update, frames, init=None):
+    """Yield the RGBA bytes of every frame, redrawing only the animated artists over a cached background."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    canvas = FigureCanvasAgg(fig)
+    animated = list(init() if init else update(0))
+    for artist in animated:
+        artist.set_animated(True)
+    canvas.draw()
+    background = canvas.copy_from_bbox(fig.bbox)
+    for i in range(frames):
+        canvas.restore_region(background)
+        for artist in update(i):
+            fig.draw_artist(artist)
+        yield bytes(canvas.buffer_rgba())
+
+
+class _FrameStream(Image.Image):
+    """An RGBA multi-frame image whose frames are pulled from an iterator as Pillow seeks through them.
+
+    Frames are read once and in order; seeking back keeps the current frame,
+    which is all Pillow's animated encoders do after the last frame.
+    """
+
+    def __init__(self, frames, size, n_frames):
+        super().__init__()
+        self._frames = iter(frames)
+        self._mode, self._size = 'RGBA', size
+        self.n_frames, self.is_animated = n_frames, n_frames > 1
+        self._position = -1
+        self.seek(0)
+
+    def seek(self, frame):
+        if frame <= self._position:
+            return
+        self.im = Image.frombuffer('RGBA', self.size, next(self._frames), 'raw', 'RGBA', 0, 1).im
+        self._position = frame
+
+    def tell(self):
+        return self._position
+
+
+def _encode_ffmpeg(frames, path, size, fps):
+    command = [matplotlib.rcParams['animation.ffmpeg_path'], '-y', '-loglevel', 'error',
+               '-f', 'rawvideo', '-pix_fmt', 'rgba', '-s', f'{size[0]}x{size[1]}', '-r', str(fps), '-i', '-',
+               *FFMPEG_CODECS[path.suffix], '-f', path.suffix.lstrip('.'), str(path)]
+    with subprocess.Popen(command, stdin=subprocess.PIPE) as proc:
+        for frame in frames:
+            proc.stdin.write(frame)
+        proc.stdin.close()
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, command)
+
+
+def _encode_pillow(frames, path, size, fps, n_frames):
+    _FrameStream(frames, size, n_frames).save(path, format='WEBP', save_all=True, duration=1000 / fps, loop=0,
+                                              quality=WEBP_QUALITY, minimize_size=True)
+
+
+def save_animation(fname, fig, update, frames, init=None, fps=FPS):
+    """Export frames update(0..frames-1) of fig as an animation (see the module docstring); returns the path.
+
+    The suffix of fname is replaced by the FIGURES_ANIMATE format; relative
+    names are saved under the output root like save_figure().
+    """
+    from figure_io import output_path
+
+    path = output_path(fname).with_suffix(f'.{animation_format() or "webp"}')
+    if path.suffix not in FFMPEG_CODECS:
+        raise ValueError(f"Unsupported animation format '{path.suffix}' (use webp or mp4)")
+    ffmpeg = shutil.which(matplotlib.rcParams['animation.ffmpeg_path'])
+    if not ffmpeg and path.suffix != '.webp':
+        print(f"⚠ ffmpeg not found; writing {path.with_suffix('.webp').name} instead of {path.name}")
+        path = path.with_suffix('.webp')
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.stem}.', suffix=path.suffix)
+    os.close(fd)
+    size = tuple(int(round(v)) for v in fig.bbox.size)
+    stream = blit_frames(fig, update, frames, init)
+    try:
+        if ffmpeg:
+            _encode_ffmpeg(stream, Path(tmp), size, fps)
+        else:
+            _encode_pillow(stream, tmp, size, fps, frames)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return path
@@ -0,0 +1,63 @@
+"""
+Figure book: every figure of the notes in one multi-page vector PDF, in page order.
+
+    python generate_figures.py --book ml_figures.pdf
+
+The book is a by-product of a build, not a second run of the generators:
+inside figure_book(), save_figure() also appends the Figure it has just
+saved to one PdfPages, before the generator closes it. Pages are streamed
+to the file as they come, so memory stays at one figure whatever the page
+count. The book is a single PdfFile, which tracks the glyphs every page
+uses per font and embeds one subset of each font when it is closed: a font
+used on all pages is stored once, with only the glyphs the book needs.
+Fonts are embedded as TrueType (pdf.fonttype 42), so text stays selectable
+and searchable. The file is written next to its destination and moved into
+place only once complete.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+import matplotlib
+from matplotlib.backends.backend_pdf import PdfPages
+
+from figure_hooks import rerender
+
+BOOK_RC = {'pdf.fonttype': 42}  # read both when a page is drawn and when the fonts are embedded at close
+
+_book = None
+
+
+@contextmanager
+def figure_book(path, title='Figures'):
+    """Collect every figure saved inside the block as a page of the PDF at path; yields the PdfPages."""
+    global _book
+    from figure_io import NORMALIZED_METADATA
+
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    os.close(fd)
+    _book = PdfPages(tmp, metadata={**NORMALIZED_METADATA['pdf'], 'Title': title})
+    try:
+        yield _book
+        with matplotlib.rc_context(BOOK_RC):
+            _book.close()
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    finally:
+        _book = None
+
+
+def add_page(fig, **kwargs):
+    """Append fig to the open book, if any, with save_figure()'s options; returns True if added."""
+    if _book is None:
+        return False
+    kwargs.pop('metadata', None)
+    with matplotlib.rc_context(BOOK_RC), rerender('save_book', fig):
+        _book.savefig(fig, **kwargs)
+    return True
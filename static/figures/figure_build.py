@@ -0,0 +1,115 @@
+"""
+Parallel figure build with memory-capped concurrency (generate_figures.py -j N).
+
+Every figure renders in its own process (figure_runner.py), so one script's
+rcParams or leaked figures cannot affect another. A figure is only started
+when its expected peak RSS fits next to the figures already running: the
+expectations come from figure_memory's estimates file, refreshed with the
+peak RSS the kernel reports for every finished worker. A figure larger than
+the whole budget still runs, but alone.
+
+Figures are dispatched longest-first, using the durations figure_schedule
+predicts from benchmark history and earlier builds; the predicted and the
+actual makespan are printed so a stale history is easy to spot.
+
+Workers render into a scratch directory, on tmpfs when one is available
+($FIGURES_SCRATCH, else /dev/shm), one subdirectory per figure. A figure's
+files are committed into the output only once its worker has exited
+cleanly, each file atomically and only if its bytes changed, so a failed
+or interrupted build never leaves a half-written or partial figure behind.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from figure_io import commit_tree
+from figure_memory import estimate_mb, load_estimates, memory_budget_mb, save_estimates
+from figure_registry import FIGURES_DIR
+from figure_schedule import lpt_order, makespan, predict, save_durations
+
+
+SCRATCH_ROOT = Path('/dev/shm')
+
+
+def scratch_root():
+    """Parent of the build's scratch directory: $FIGURES_SCRATCH, /dev/shm (RAM-backed) or the temp dir."""
+    if os.environ.get('FIGURES_SCRATCH'):
+        return os.environ['FIGURES_SCRATCH']
+    if SCRATCH_ROOT.is_dir() and os.access(SCRATCH_ROOT, os.W_OK):
+        return str(SCRATCH_ROOT)
+    return None
+
+
+def _ru_maxrss_mb(usage):
+    return usage.ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+def _last_line(stream):
+    stream.seek(0)
+    lines = stream.read().decode('utf-8', errors='replace').strip().splitlines()
+    return lines[-1] if lines else 'no output'
+
+
+def build(jobs, workdir, max_workers, budget_mb=None, trace_dir=None):
+    """Render jobs into workdir with at most max_workers processes; returns the failed job keys.
+
+    Figures are rendered in scratch_root() and committed into workdir as their workers succeed.
+    """
+    budget_mb = memory_budget_mb() if budget_mb is None else budget_mb
+    estimates = load_estimates()
+    predicted = predict(jobs)
+    pending, running, failed, observed, durations = lpt_order(jobs, predicted), {}, [], {}, {}
+    expected = makespan([predicted[job.key] for job in pending], max_workers)
+    print(f"Building with up to {max_workers} workers within {budget_mb:.0f}MB, "
+          f"longest first (predicted makespan {expected:.1f}s)\n")
+    build_start = time.perf_counter()
+    scratch = Path(tempfile.mkdtemp(prefix='figbuild-', dir=scratch_root()))
+    committed = 0
+
+    try:
+        while pending or running:
+            in_use = sum(estimate_mb(job, estimates) for job, _, _, _ in running.values())
+            while pending and len(running) < max_workers:
+                job = next((j for j in pending if in_use + estimate_mb(j, estimates) <= budget_mb), None)
+                if job is None:
+                    if running:
+                        break  # wait for memory to free up
+                    job = pending[0]  # too big for the budget: run it on its own
+                pending.remove(job)
+                command = [sys.executable, str(FIGURES_DIR / 'figure_runner.py'), job.key,
+                           '--workdir', str(scratch / job.name)]
+                if trace_dir:
+                    command += ['--trace', str(Path(trace_dir) / f'{job.name}.json')]
+                log = tempfile.TemporaryFile()
+                proc = subprocess.Popen(command, cwd=FIGURES_DIR, stdout=log, stderr=subprocess.STDOUT)
+                running[proc.pid] = (job, proc, log, time.perf_counter())
+                in_use += estimate_mb(job, estimates)
+
+            pid, status, usage = os.wait4(-1, 0)
+            if pid not in running:
+                continue
+            job, proc, log, start = running.pop(pid)
+            proc.returncode = os.waitstatus_to_exitcode(status)  # reaped here, so Popen must not wait again
+            observed[job.key] = _ru_maxrss_mb(usage)
+            durations[job.key] = time.perf_counter() - start
+            if proc.returncode == 0:
+                committed += commit_tree(scratch / job.name, workdir)
+                print(f"✓ {job.name:<32} {durations[job.key]:6.2f}s (predicted {predicted[job.key]:5.2f}s)"
+                      f"  rss {observed[job.key]:5.0f}MB")
+            else:
+                failed.append(job.key)
+                print(f"✗ {job.name:<32} {_last_line(log)}", file=sys.stderr)
+            log.close()
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    print(f"\nMakespan {time.perf_counter() - build_start:.1f}s (predicted {expected:.1f}s); "
+          f"{committed} files changed in {workdir}")
+    save_estimates(observed)
+    save_durations(durations)
+    return failed
@@ -0,0 +1,239 @@
+"""
+Declarative box-and-arrow diagrams: gates, operations, word boxes, graphs.
+
+Instead of drawing every box, circle and arrow with its own patch and
+annotate() call at hand-computed coordinates, a figure declares its nodes
+and the edges between them as data:
+
+    diagram = Diagram(STYLES)
+    diagram.node('forget', (3, 4), 'σ', style='gate')
+    diagram.node('forget_mul', (3, 7.5), '×', style='op')
+    diagram.edge('forget', 'forget_mul')         # clipped to both outlines
+    diagram.edge('input', 'input_mul', route='vh')  # up, then across
+    diagram.draw(ax)
+
+Edges run between node names or plain (x, y) points, optionally through
+via points or an 'hv'/'vh' elbow, and start and end on the outlines of the
+nodes they connect. The layout (outlines and clipped edge polylines)
+depends only on the declared geometry and is computed when the diagram is
+drawn. Every node outline at one zorder goes into
+one PatchCollection and every edge, arrowhead included, into one
+ArrowLayer; only the labels stay separate Text artists, as they may be
+mathtext.
+
+Styles are dicts of properties looked up by name; keyword arguments to
+node() and edge() override them for one element:
+
+    node  shape ('box', 'circle' or 'point'), width, height, radius,
+          boxstyle, facecolor, edgecolor, linewidth, linestyle, alpha,
+          zorder, and the label's fontsize, fontweight and color
+    edge  color, linewidth, linestyle, alpha, head ('->' or None),
+          gap (extra clearance from the nodes, in data units), shrink
+          (points cut off both ends, default 2 for arrows like annotate()
+          and 0 for plain lines, which usually join others), zorder
+"""
+
+from itertools import groupby
+
+import numpy as np
+from matplotlib import colors as mcolors
+from matplotlib import rcParams
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.patches import BoxStyle, Circle, FancyBboxPatch
+
+NODE_DEFAULTS = {
+    'shape': 'box', 'width': 1.0, 'height': 0.6, 'radius': 0.35, 'boxstyle': 'round,pad=0.05',
+    'facecolor': 'white', 'edgecolor': '#424242', 'linewidth': 1.5, 'linestyle': '-', 'alpha': None,
+    'zorder': 3, 'fontsize': 10, 'fontweight': 'bold', 'color': 'black',
+}
+EDGE_DEFAULTS = {
+    'color': '#424242', 'linewidth': 1.5, 'linestyle': '-', 'alpha': None, 'head': '->', 'gap': 0.0,
+    'shrink': None, 'zorder': 2,
+}
+SHRINK_POINTS = 2.0  # like annotate(), arrows stop this far short of their ends
+HEAD_LENGTH = 0.4    # '->' head length and half-width in units of the font size, like annotate()
+HEAD_WIDTH = 0.2
+
+
+def _extent(props):
+    """Half-extents of a node's outline: (w/2, h/2) for boxes, the radius for circles."""
+    if props['shape'] == 'box':
+        pad = BoxStyle(props['boxstyle']).pad
+        return props['width'] / 2 + pad, props['height'] / 2 + pad
+    if props['shape'] == 'circle':
+        return props['radius']
+    return 0.0
+
+
+def _boundary(shape, center, extent, toward, gap):
+    """Point where the ray from center toward `toward` leaves the node outline (plus gap)."""
+    direction = np.subtract(toward, center)
+    length = np.hypot(*direction)
+    if not length:
+        return np.asarray(center, float)
+    direction = direction / length
+    if shape == 'box':
+        reach = min(extent[0] / abs(direction[0]) if direction[0] else np.inf,
+                    extent[1] / abs(direction[1]) if direction[1] else np.inf)
+    elif shape == 'circle':
+        reach = extent
+    else:
+        reach = 0.0
+    return center + direction * (reach + gap)
+
+
+def _layout(nodes, edges):
+    """Edge polylines in data coordinates, clipped to the outlines of the nodes they join.
+
+    nodes is ((name, shape, center, extent), ...) and edges is
+    ((start, end, via, route, gap), ...), where start and end are node
+    names or (x, y) points.
+    """
+    outlines = {name: (shape, np.asarray(center, float), extent) for name, shape, center, extent in nodes}
+    polylines = []
+    for start, end, via, route, gap in edges:
+        a = outlines[start][1] if isinstance(start, str) else np.asarray(start, float)
+        b = outlines[end][1] if isinstance(end, str) else np.asarray(end, float)
+        if not via and route == 'hv':
+            via = ((b[0], a[1]),)
+        elif not via and route == 'vh':
+            via = ((a[0], b[1]),)
+        points = np.array([a, *via, b], float)
+        if isinstance(start, str):
+            shape, center, extent = outlines[start]
+            points[0] = _boundary(shape, center, extent, points[1], gap)
+        if isinstance(end, str):
+            shape, center, extent = outlines[end]
+            points[-1] = _boundary(shape, center, extent, points[-2], gap)
+        polylines.append(points)
+    return tuple(polylines)
+
+
+def _shrink(points, distance):
+    """Pull both ends of a polyline in along their segments by distance (skipped if too short)."""
+    points = points.copy()
+    for end, inner in ((0, 1), (-1, -2)):
+        step = points[inner] - points[end]
+        length = np.hypot(*step)
+        if length > 2 * distance:
+            points[end] += step / length * distance
+    return points
+
+
+class ArrowLayer(LineCollection):
+    """Data-coordinate polylines with '->' heads, drawn as one LineCollection.
+
+    Heads and end shrinks are sized in points like annotate() arrows, so
+    they are rebuilt from the current data-to-display transform at every
+    draw and keep their size and angle whatever the axes limits and aspect.
+    Each polyline with a head owns two segments: the shaft, then the head.
+    """
+
+    def __init__(self, polylines, heads, shrinks, colors, linewidths, linestyles, **kwargs):
+        self._polylines = [np.asarray(p, float) for p in polylines]
+        self._heads = [bool(head) for head in heads]
+        self._shrinks = list(shrinks)
+        self._widths = list(linewidths)
+        counts = [1 + head for head in self._heads]
+        segment_styles = [style for ls, head in zip(linestyles, self._heads)
+                          for style in ((ls, '-') if head else (ls,))]
+        super().__init__(self._segments(None), colors=np.repeat(colors, counts, axis=0),
+                         linewidths=np.repeat(linewidths, counts), linestyles=segment_styles, **kwargs)
+
+    def _segments(self, renderer):
+        if renderer is None:  # placeholder heads until the first draw
+            return [segment for points, head in zip(self._polylines, self._heads)
+                    for segment in ((points, points[-1:].repeat(2, axis=0)) if head else (points,))]
+        to_display = self.axes.transData
+        point = renderer.points_to_pixels(1.0)
+        size = rcParams['font.size'] * point
+        sin_t = HEAD_WIDTH / np.hypot(HEAD_LENGTH, HEAD_WIDTH)
+        segments = []
+        for points, head, shrink, width in zip(self._polylines, self._heads, self._shrinks, self._widths):
+            shaft = _shrink(to_display.transform(points), shrink * point)
+            if head:
+                direction = shaft[-1] - shaft[-2]
+                direction /= np.hypot(*direction) or 1.0
+                # pull the tip back by the overshoot of a mitred point, as annotate() does
+                tip = shaft[-1] - direction * 0.5 * width * point / sin_t
+                shaft[-1] = tip
+                normal = np.array([-direction[1], direction[0]])
+                base = tip - direction * HEAD_LENGTH * size
+                segments += [shaft, np.array([base + normal * HEAD_WIDTH * size, tip,
+                                              base - normal * HEAD_WIDTH * size])]
+            else:
+                segments.append(shaft)
+        to_data = to_display.inverted()
+        return [to_data.transform(segment) for segment in segments]
+
+    def draw(self, renderer):
+        self.set_segments(self._segments(renderer))
+        super().draw(renderer)
+
+
+def _patch(center, props):
+    kwargs = dict(facecolor=props['facecolor'], edgecolor=props['edgecolor'], linewidth=props['linewidth'],
+                  linestyle=props['linestyle'], alpha=props['alpha'])
+    if props['shape'] == 'circle':
+        return Circle(center, props['radius'], **kwargs)
+    width, height = props['width'], props['height']
+    return FancyBboxPatch((center[0] - width / 2, center[1] - height / 2), width, height,
+                          boxstyle=props['boxstyle'], **kwargs)
+
+
+class Diagram:
+    """Nodes and edges declared as data, laid out and drawn as collections."""
+
+    def __init__(self, styles=None):
+        self.styles = styles or {}
+        self.nodes = {}  # name -> (center, label, props)
+        self.edges = []  # (start, end, via, route, props)
+
+    def node(self, name, xy, label='', style='node', **props):
+        """Declare a node centred on xy; returns its name for use in edge()."""
+        self.nodes[name] = ((float(xy[0]), float(xy[1])), label,
+                            {**NODE_DEFAULTS, **self.styles.get(style, {}), **props})
+        return name
+
+    def edge(self, start, end, style='edge', via=(), route=None, **props):
+        """Declare an edge between node names or (x, y) points.
+
+        via lists intermediate points; without via, route='hv' goes
+        horizontally then vertically and route='vh' the other way round.
+        """
+        start, end = (p if isinstance(p, str) else (float(p[0]), float(p[1])) for p in (start, end))
+        via = tuple((float(x), float(y)) for x, y in via)
+        self.edges.append((start, end, via, route, {**EDGE_DEFAULTS, **self.styles.get(style, {}), **props}))
+
+    def layout(self):
+        """Clipped edge polylines, in declaration order."""
+        nodes = tuple((name, props['shape'], center, _extent(props))
+                      for name, (center, _, props) in self.nodes.items())
+        edges = tuple((start, end, via, route, props['gap']) for start, end, via, route, props in self.edges)
+        return _layout(nodes, edges)
+
+    def draw(self, ax):
+        """Add the diagram to ax; returns the node and edge collections."""
+        artists = []
+        shaped = sorted(((props['zorder'], center, props) for center, _, props in self.nodes.values()
+                         if props['shape'] != 'point'), key=lambda item: item[0])
+        for zorder, group in groupby(shaped, key=lambda item: item[0]):
+            patches = [_patch(center, props) for _, center, props in group]
+            artists.append(ax.add_collection(PatchCollection(patches, match_original=True, zorder=zorder),
+                                             autolim=False))
+        for center, label, props in self.nodes.values():
+            if label:
+                ax.text(*center, label, ha='center', va='center', fontsize=props['fontsize'],
+                        fontweight=props['fontweight'], color=props['color'], zorder=props['zorder'] + 0.5)
+
+        edges = sorted(zip(self.layout(), (props for *_, props in self.edges)), key=lambda item: item[1]['zorder'])
+        for zorder, group in groupby(edges, key=lambda item: item[1]['zorder']):
+            polylines, props = zip(*group)
+            colors = [mcolors.to_rgba(p['color'], p['alpha']) for p in props]
+            shrinks = [p['shrink'] if p['shrink'] is not None else SHRINK_POINTS if p['head'] else 0.0
+                       for p in props]
+            layer = ArrowLayer(polylines, [p['head'] for p in props], shrinks, colors,
+                               [p['linewidth'] for p in props], [p['linestyle'] for p in props],
+                               zorder=zorder, capstyle='round', joinstyle='round')
+            artists.append(ax.add_collection(layer, autolim=False))
+        return artists
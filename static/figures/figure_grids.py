@@ -0,0 +1,171 @@
+"""
+Grid-drawing primitives for tensor, feature-map and network diagrams.
+
+Drawing a grid with one patch and one ax.text() per cell costs a Python
+object, a transform and a draw call per cell, which is fine for 7×7 but
+takes seconds for a 64×64 feature map or 32×512 activations. The same goes
+for a dense layer drawn with one ax.plot() per edge. These helpers draw a
+whole grid as one artist:
+
+    cell_grid(ax, colors, inset=0.05, rounding=0.1)   # one PolyCollection
+    image_grid(ax, colors)                            # one imshow, no per-cell edges
+    text_layer(ax, cell_centers(shape), labels)       # one PathCollection of glyphs
+    dense_edges(ax, layer, next_layer, mask=kept)     # one LineCollection per layer pair
+
+Cell (row, col) is a size×size square whose lower-left corner is at
+origin + (col, n_rows - 1 - row) * size, so row 0 is drawn on top, the way a
+matrix is printed. Colours can be one colour for every cell or an array of
+shape (n_rows, n_cols) of colour specs, or (n_rows, n_cols, 3|4) RGB(A).
+Grids with more than DENSE_CELLS cells are drawn by image_grid(), because
+their insets, rounded corners and edges would be smaller than a pixel.
+The edges of a dense layer form an (n_from, n_to) grid of their own, and
+take colours, alphas and masks of that shape.
+"""
+
+import functools
+
+import numpy as np
+from matplotlib import colors as mcolors
+from matplotlib.collections import LineCollection, PathCollection, PolyCollection
+from matplotlib.font_manager import FontProperties
+from matplotlib.patches import BoxStyle
+from matplotlib.path import Path
+from matplotlib.textpath import TextPath, text_to_path
+from matplotlib.transforms import Affine2D
+
+from figure_theme import INK_LABEL
+
+DENSE_CELLS = 64 * 64
+
+
+def _rgba(colors, shape=None):
+    """(n_rows, n_cols, 4) RGBA array from a single colour or a grid of colours."""
+    if isinstance(colors, str) or (np.ndim(colors) == 1 and len(colors) in (3, 4)):
+        return np.broadcast_to(mcolors.to_rgba(colors), (*shape, 4))
+    colors = np.asarray(colors)
+    if colors.dtype.kind in 'fiu' and colors.ndim == 3:
+        return mcolors.to_rgba_array(colors.reshape(-1, colors.shape[-1])).reshape(*colors.shape[:2], 4)
+    return mcolors.to_rgba_array(colors.ravel()).reshape(*colors.shape, 4)
+
+
+def _corners(shape, origin, size):
+    """Lower-left corner of every cell, row-major, row 0 on top."""
+    rows, cols = np.indices(shape)
+    x = origin[0] + cols.ravel() * size
+    y = origin[1] + (shape[0] - 1 - rows.ravel()) * size
+    return np.column_stack([x, y])
+
+
+def cell_centers(shape, origin=(0, 0), size=1.0):
+    """(n_rows * n_cols, 2) centre of every cell, row-major."""
+    return _corners(shape, origin, size) + size / 2
+
+
+@functools.lru_cache(maxsize=None)
+def _cell_outline(size, inset, rounding):
+    """Vertices of one cell with its lower-left corner at the origin, curves flattened."""
+    side = size - 2 * inset
+    if not rounding:
+        return np.array([[inset, inset], [inset + side, inset], [inset + side, inset + side], [inset, inset + side]])
+    style = BoxStyle('round', pad=0.02 * size, rounding_size=rounding * size)
+    return style(inset, inset, side, side, 1.0).to_polygons(closed_only=True)[0]
+
+
+def image_grid(ax, colors, shape=None, origin=(0, 0), size=1.0, **kwargs):
+    """Draw the grid as one image (no gaps or edges); returns the AxesImage."""
+    rgba = _rgba(colors, shape)
+    n_rows, n_cols = rgba.shape[:2]
+    extent = (origin[0], origin[0] + n_cols * size, origin[1], origin[1] + n_rows * size)
+    kwargs.setdefault('interpolation', 'nearest')
+    return ax.imshow(rgba, extent=extent, origin='upper', aspect=ax.get_aspect(), **kwargs)
+
+
+def cell_grid(ax, colors, shape=None, origin=(0, 0), size=1.0, inset=0.0, rounding=0.0, mask=None, **kwargs):
+    """Draw every cell (or those where mask is true) as one PolyCollection; returns the artist.
+
+    shape is only needed when colors is a single colour. inset shrinks each
+    cell on every side, rounding is the corner radius as a fraction of size,
+    and kwargs go to PolyCollection (edgecolor, linewidth, alpha, zorder...).
+    """
+    rgba = _rgba(colors, shape if shape is not None else np.shape(mask) if mask is not None else None)
+    shape = rgba.shape[:2]
+    if mask is None and shape[0] * shape[1] > DENSE_CELLS:
+        return image_grid(ax, rgba, origin=origin, size=size, alpha=kwargs.get('alpha'),
+                          zorder=kwargs.get('zorder'))
+    keep = np.ones(shape[0] * shape[1], bool) if mask is None else np.asarray(mask, bool).ravel()
+    outline = _cell_outline(size, inset, rounding)
+    verts = outline[None, :, :] + _corners(shape, origin, size)[keep][:, None, :]
+    kwargs.setdefault('edgecolor', 'none')
+    collection = PolyCollection(verts, facecolors=rgba.reshape(-1, 4)[keep], **kwargs)
+    ax.add_collection(collection, autolim=False)
+    return collection
+
+
+@functools.lru_cache(maxsize=None)
+def _glyph(char, fontsize, family, weight):
+    """(outline in points, advance in points) of one character."""
+    prop = FontProperties(family=family, weight=weight, size=fontsize)
+    width = text_to_path.get_text_width_height_descent(char, prop, ismath=False)[0]
+    return TextPath((0, 0), char, prop=prop), width
+
+
+@functools.lru_cache(maxsize=4096)
+def _glyphs(label, fontsize, family, weight):
+    """Outline of label in points, centred on the origin.
+
+    Labels are assembled from cached per-character outlines (no kerning), so
+    thousands of distinct labels such as x12_34 cost one layout per character.
+    """
+    parts, x = [], 0.0
+    for char in label:
+        path, width = _glyph(char, fontsize, family, weight)
+        if len(path.vertices):
+            parts.append(Path(path.vertices + (x, 0), path.codes))
+        x += width
+    if not parts:
+        return Path(np.zeros((1, 2)), [Path.MOVETO])
+    path = Path.make_compound_path(*parts)
+    # centre on the advance box horizontally and the control-point box vertically;
+    # path.get_extents() would solve every Bézier segment for its extrema
+    bottom, top = path.vertices[:, 1].min(), path.vertices[:, 1].max()
+    return Path(path.vertices - (x / 2, (bottom + top) / 2), path.codes)
+
+
+def text_layer(ax, positions, labels, fontsize=8, color='black', family='sans-serif', weight='normal', **kwargs):
+    """Draw many short labels, centred on data-coordinate positions, as one PathCollection.
+
+    Each character is laid out once; the glyph outlines keep their size in
+    points whatever the axes limits, like ordinary text. Labels are plain
+    text: no mathtext, no kerning.
+    """
+    paths = [_glyphs(str(label), fontsize, family, weight) for label in labels]
+    points = Affine2D().scale(1 / 72) + ax.figure.dpi_scale_trans
+    layer = PathCollection(paths, offsets=np.asarray(positions, float), offset_transform=ax.transData,
+                           facecolors=color, edgecolors='none', label=INK_LABEL, **kwargs)
+    layer.set_transform(points)  # labelled as text, so the dark theme recolours it as ink
+    ax.add_collection(layer, autolim=False)
+    return layer
+
+
+def dense_edges(ax, sources, targets, colors='#888888', alpha=None, mask=None, gap=0.0, **kwargs):
+    """Draw every source→target edge of a dense layer as one LineCollection; returns the artist.
+
+    sources and targets are sequences of (x, y) node centres. colors and
+    alpha are one value for every edge or (n_from, n_to) arrays (weight
+    magnitudes, say); edges where mask is false (dropped units) are left
+    out. Edges start gap to the right of each source and end gap to the
+    left of each target, clear of left-to-right drawn nodes. kwargs go to
+    LineCollection (linewidth, zorder...).
+    """
+    sources = np.asarray(sources, float) + (gap, 0)
+    targets = np.asarray(targets, float) - (gap, 0)
+    shape = (len(sources), len(targets))
+    rgba = np.array(_rgba(colors, shape))
+    if alpha is not None:
+        rgba[..., 3] = alpha
+    keep = np.ones(shape, bool) if mask is None else np.asarray(mask, bool)
+    start, end = np.broadcast_arrays(sources[:, None, :], targets[None, :, :])
+    segments = np.stack([start[keep], end[keep]], axis=1)
+    edges = LineCollection(segments, colors=rgba[keep], **kwargs)
+    ax.add_collection(edges, autolim=False)
+    return edges
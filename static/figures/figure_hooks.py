@@ -0,0 +1,143 @@
+"""
+Opt-in timing hooks around matplotlib's render pipeline.
+
+instrument() temporarily wraps library methods and reports every call as
+listener(phase, start, end, obj), where obj is the instance the method was
+called on, so callers can tell where a figure spends its time without
+touching the generator scripts. Only the outermost call of each phase is
+reported (hist -> bar -> add_patch is one 'artists' event). A method is
+patched on the class that defines it (Figure.get_tightbbox lives on
+FigureBase, Axes.add_patch on _AxesBase), so inherited methods are timed
+too; a target this matplotlib does not have is reported with a warning.
+
+PHASE_HOOKS (cheap, used by the benchmark):
+    save     Figure.savefig            whole save, including the draws below
+    draw     FigureCanvasAgg.draw      artist drawing + Agg rasterization
+    encode   PIL.Image.Image.save      PNG zlib encode + file write
+
+TRACE_HOOKS adds (used by generate_figures.py --trace):
+    layout   tight_layout and the bbox_inches='tight' extent measurement
+    artists  Axes/Figure methods that create artists (plot, text, add_patch, ...)
+
+save_figure() renders a saved figure again for its dark copy, SVG copy and
+figure book page. Those run inside rerender(), which hides their hooked
+calls and reports each as one event of its own phase (RERENDER_PHASES), so
+'save' and the phases inside it stay the cost of one render per figure.
+
+Nothing is patched unless instrument() is active.
+"""
+
+import functools
+import importlib
+import time
+import warnings
+from contextlib import contextmanager
+
+PHASE_HOOKS = {
+    'save': [('matplotlib.figure', 'Figure', 'savefig')],
+    'draw': [('matplotlib.backends.backend_agg', 'FigureCanvasAgg', 'draw')],
+    'encode': [('PIL.Image', 'Image', 'save')],
+}
+
+ARTIST_METHODS = (
+    'plot', 'scatter', 'bar', 'barh', 'hist', 'hist2d', 'text', 'annotate', 'arrow', 'add_patch',
+    'add_artist', 'add_collection', 'add_line', 'imshow', 'pcolormesh', 'contour', 'contourf',
+    'clabel', 'fill', 'fill_between', 'fill_betweenx', 'axhline', 'axvline', 'axhspan', 'axvspan',
+    'hlines', 'vlines', 'errorbar', 'boxplot', 'violinplot', 'stem', 'step', 'pie', 'quiver',
+    'legend', 'set_title', 'set_xlabel', 'set_ylabel', 'bar_label', 'inset_axes',
+)
+
+TRACE_HOOKS = {
+    **PHASE_HOOKS,
+    'layout': [
+        ('matplotlib.figure', 'Figure', 'tight_layout'),
+        ('matplotlib.figure', 'Figure', 'get_tightbbox'),
+    ],
+    'artists': (
+        [('matplotlib.axes', 'Axes', method) for method in ARTIST_METHODS]
+        + [('matplotlib.figure', 'FigureBase', method)
+           for method in ('subplots', 'add_subplot', 'add_axes', 'text', 'suptitle', 'colorbar', 'legend')]
+        + [('mpl_toolkits.mplot3d.axes3d', 'Axes3D', 'plot_surface')]
+    ),
+}
+RERENDER_PHASES = ('save_dark', 'save_svg', 'save_book')
+
+_listeners = []  # listeners of the active instrument() blocks
+_muted = 0       # depth of rerender() blocks
+
+
+def _timed(phase, method, listener, depth):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        if _muted:
+            return method(*args, **kwargs)
+        depth[phase] += 1
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            depth[phase] -= 1
+            if depth[phase] == 0:
+                listener(phase, start, time.perf_counter(), args[0] if args else None)
+    return wrapper
+
+
+@contextmanager
+def instrument(listener, hooks=PHASE_HOOKS):
+    """Report every outermost hooked call to listener(phase, start, end, obj) while active."""
+    originals = []
+    depth = dict.fromkeys(hooks, 0)
+    _listeners.append(listener)
+    try:
+        for phase, targets in hooks.items():
+            for module, owner, attr in targets:
+                cls = next((c for c in getattr(importlib.import_module(module), owner).__mro__
+                            if attr in c.__dict__), None)
+                if cls is None:
+                    warnings.warn(f"{module}.{owner}.{attr} not found; its '{phase}' time is not recorded")
+                    continue
+                if any(c is cls and a == attr for c, a, _ in originals):  # listed under two names
+                    continue
+                method = cls.__dict__[attr]
+                originals.append((cls, attr, method))
+                setattr(cls, attr, _timed(phase, method, listener, depth))
+        yield
+    finally:
+        for cls, attr, method in reversed(originals):
+            setattr(cls, attr, method)
+        _listeners.remove(listener)
+
+
+@contextmanager
+def rerender(phase, obj=None):
+    """Hide the hooked calls inside the block from listeners and report the block as one phase event."""
+    global _muted
+    _muted += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _muted -= 1
+        if not _muted:
+            end = time.perf_counter()
+            for listener in list(_listeners):
+                listener(phase, start, end, obj)
+
+
+class PhaseEvents(list):
+    """Listener that records (phase, start, end) events, with helpers to total them."""
+
+    def __call__(self, phase, start, end, obj=None):
+        self.append((phase, start, end))
+
+    def total(self, phase, within=None):
+        """Seconds spent in phase, optionally only inside (or outside, within=False) save calls."""
+        saves = [(s, e) for p, s, e in self if p == 'save']
+        seconds = 0.0
+        for p, start, end in self:
+            if p != phase:
+                continue
+            inside = any(s <= start and end <= e for s, e in saves)
+            if within is None or within == inside:
+                seconds += end - start
+        return seconds
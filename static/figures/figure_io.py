@@ -0,0 +1,125 @@
+"""
+Reproducible figure saving.
+
+save_figure() is the drop-in replacement for plt.savefig() used by every
+generator. It renders into memory with normalized metadata (no matplotlib
+version string, creation date or random SVG ids), then replaces the target
+file atomically, and only if the bytes changed. A rebuild that changes
+nothing leaves every file and its mtime untouched, so git stays clean and
+the Hugo/Netlify resource caches stay warm. Each figure is also saved as
+`<name>.dark.<ext>` for the notes page's dark theme by recolouring the same
+figure (figure_theme). In draft mode (figure_quality) the DPI and tight-bbox
+options are replaced by the cheap preview ones and the dark copy is skipped.
+While a figure book is open (figure_book), the light figure is also added
+to it as a PDF page; in SVG export mode (figure_svg) it is also saved as a
+size-tuned `<name>.svg`.
+
+    from figure_io import save_figure
+    save_figure('roc_curve.png', dpi=150, bbox_inches='tight', facecolor='white')
+
+Relative file names are saved under the output root, not the working
+directory, so a generator writes to the same place wherever it is run from:
+
+    FIGURES_OUTPUT=DIR   output root (default: static/figures, next to the generators)
+"""
+
+import io
+import os
+import tempfile
+from pathlib import Path
+
+import matplotlib
+import matplotlib.pyplot as plt
+
+from figure_book import add_page
+from figure_hooks import rerender
+from figure_quality import dark_variant, save_options
+from figure_registry import FIGURES_DIR
+from figure_svg import svg_export, svg_ready
+from figure_theme import dark_fill, dark_ink, dark_path, dark_theme
+
+# Metadata keys matplotlib fills with version strings or timestamps, per format
+NORMALIZED_METADATA = {
+    'png': {'Software': None},
+    'pdf': {'Creator': None, 'Producer': None, 'CreationDate': None},
+    'svg': {'Creator': None, 'Date': None},
+}
+SVG_HASH_SALT = 'figures'  # fixed salt so SVG clip-path/glyph ids are stable across runs
+
+
+def output_root():
+    """Directory relative figure paths are saved under ($FIGURES_OUTPUT, default static/figures)."""
+    return Path(os.environ.get('FIGURES_OUTPUT') or FIGURES_DIR)
+
+
+def output_path(fname):
+    """Where save_figure() writes fname: under output_root() unless fname is absolute."""
+    return output_root() / fname
+
+
+def write_if_changed(path, data):
+    """Atomically write data to path unless it already holds exactly these bytes; returns True if written."""
+    path = Path(path)
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return True
+
+
+def commit_tree(source, target):
+    """Move every file under source to the same relative path under target, via write_if_changed().
+
+    Each file is replaced atomically and unchanged files keep their mtime;
+    returns the number of files that changed.
+    """
+    source, target = Path(source), Path(target)
+    written = 0
+    for path in sorted(source.rglob('*')):
+        if path.is_file():
+            destination = target / path.relative_to(source)
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            written += write_if_changed(destination, path.read_bytes())
+            path.unlink()
+    return written
+
+
+def render_figure(fig=None, format='png', **kwargs):
+    """Render fig (default: the current figure) to bytes with normalized metadata."""
+    fig = plt.gcf() if fig is None else fig
+    metadata = {**NORMALIZED_METADATA.get(format, {}), **kwargs.pop('metadata', {})}
+    buffer = io.BytesIO()
+    with matplotlib.rc_context({'svg.hashsalt': SVG_HASH_SALT}):
+        fig.savefig(buffer, format=format, metadata=metadata, **kwargs)
+    return buffer.getvalue()
+
+
+def save_figure(fname, fig=None, **kwargs):
+    """plt.savefig() replacement: reproducible bytes, written only when changed; returns True if written."""
+    fig = plt.gcf() if fig is None else fig
+    format = kwargs.pop('format', None) or Path(fname).suffix.lstrip('.').lower() or matplotlib.rcParams['savefig.format']
+    kwargs = save_options(kwargs)
+    fname = output_path(fname)
+    fname.parent.mkdir(parents=True, exist_ok=True)
+    written = write_if_changed(fname, render_figure(fig, format, **kwargs))
+    add_page(fig, **kwargs)
+    if svg_export() and format == 'png':
+        with svg_ready(fig), rerender('save_svg', fig):
+            written |= write_if_changed(fname.with_suffix('.svg'), render_figure(fig, 'svg', **kwargs))
+    if dark_variant():
+        for key, mapping in (('facecolor', dark_fill), ('edgecolor', dark_ink)):
+            if kwargs.get(key, 'auto') != 'auto':
+                kwargs[key] = mapping(kwargs[key])
+        with dark_theme(fig), rerender('save_dark', fig):
+            written |= write_if_changed(dark_path(fname), render_figure(fig, format, **kwargs))
+    return written
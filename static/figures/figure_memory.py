@@ -0,0 +1,223 @@
+"""
+Per-figure memory accounting (generate_figures.py --memory).
+
+Each figure runs in a fresh process under tracemalloc and reports:
+
+    peak_mb        tracemalloc peak of Python + NumPy heap allocations
+    numpy_mb       NumPy array data alive at the fullest snapshot
+    transient_mb   peak minus the highest traced size ever sampled: short-lived
+                   temporaries (e.g. the intermediate arrays of `a * b + c`)
+    peak_rss_mb    peak resident memory of the process (includes interpreter,
+                   imports and tracemalloc's own bookkeeping, so an upper bound)
+    sites          top allocation sites at the fullest snapshot, attributed to the
+                   innermost line of the generator script that led to them, or
+                   failing that (deep NumPy/matplotlib stacks) to the innermost
+                   helper or matplotlib line
+
+A background thread snapshots the heap whenever tracemalloc's current size
+reaches a new high, and again after every savefig; the snapshot holding the
+most memory is kept, so the sites describe the peak rather than the (mostly
+freed) end state. Modules imported lazily while the figure runs, and the
+profiler's own snapshot and traceback bookkeeping, are left out of the
+sites. Tracing makes a figure 5-10x slower, which is why this is a
+separate mode rather than part of the benchmark.
+
+The observed peak RSS of every figure is kept in the build cache
+(figures/memory/estimates.json); the parallel build reads it to keep the
+sum of running figures under the memory budget.
+"""
+
+import json
+import linecache
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+
+import matplotlib
+
+from figure_hooks import PHASE_HOOKS, instrument
+from figure_registry import FIGURES_DIR, cache_dir
+
+TRACE_FRAMES = 6  # deep enough to reach the generator line from most NumPy/SciPy calls; cost grows with depth
+SAMPLE_INTERVAL = 0.05
+SNAPSHOT_GROWTH = 1.2  # re-snapshot once traced memory grows 20% past the last snapshot
+TOP_SITES = 5
+NUMPY_DOMAIN = 389047  # numpy.lib.tracemalloc_domain
+DEFAULT_ESTIMATE_MB = 300  # peak RSS assumed for figures that were never measured
+MB = 1024 * 1024
+MATPLOTLIB_DIR = Path(matplotlib.__file__).parent
+
+
+def estimates_file():
+    return cache_dir('memory') / 'estimates.json'
+
+
+def load_estimates():
+    """{job key: peak RSS in MB} from earlier memory runs and builds."""
+    try:
+        return json.loads(estimates_file().read_text())
+    except FileNotFoundError:
+        return {}
+
+
+def save_estimates(observed):
+    """Merge {job key: peak RSS MB} into the estimates file (latest observation wins)."""
+    estimates = load_estimates()
+    estimates.update({key: round(mb, 1) for key, mb in observed.items()})
+    tmp = estimates_file().with_suffix('.tmp')
+    tmp.write_text(json.dumps(estimates, indent=1, sort_keys=True))
+    os.replace(tmp, estimates_file())
+
+
+def estimate_mb(job, estimates):
+    return estimates.get(job.key, DEFAULT_ESTIMATE_MB)
+
+
+def memory_budget_mb(fraction=0.8):
+    """Usable memory for figure workers: a fraction of the cgroup limit, or of physical RAM."""
+    for limit_file in ('/sys/fs/cgroup/memory.max', '/sys/fs/cgroup/memory/memory.limit_in_bytes'):
+        try:
+            limit = Path(limit_file).read_text().strip()
+        except OSError:
+            continue
+        if limit.isdigit() and int(limit) < 1 << 60:  # cgroup v1 reports "unlimited" as a huge number
+            return int(limit) / MB * fraction
+    return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') / MB * fraction
+
+
+class PeakSnapshotter(threading.Thread):
+    """Keeps the tracemalloc snapshot holding the most (non-import) memory seen while running.
+
+    The thread snapshots whenever traced memory grows past the last high;
+    capture(force=True) is also called after every savefig, when a figure
+    and the arrays behind it are fully built.
+    """
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.snapshot, self.size, self.current = None, 0, 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    def capture(self, force=False):
+        with self._lock:
+            current, _ = tracemalloc.get_traced_memory()
+            if not force and current <= self.current * SNAPSHOT_GROWTH:
+                return
+            self.current = max(self.current, current)
+            snapshot = _without_overhead(tracemalloc.take_snapshot())
+            size = sum(trace.size for trace in snapshot.traces)
+            if size > self.size:
+                self.snapshot, self.size = snapshot, size
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.capture()
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+def _without_overhead(snapshot):
+    """snapshot without lazy imports and the allocations tracemalloc and linecache make for the profiler."""
+    return snapshot.filter_traces([
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap*>', all_frames=True),
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, linecache.__file__),
+    ])
+
+
+def _site(traceback):
+    """Innermost generator-script frame of an allocation, else its innermost project or matplotlib frame."""
+    frames = list(reversed(traceback))  # innermost first
+    for frame in frames:
+        path = Path(frame.filename)
+        if path.parent == FIGURES_DIR and path.name.startswith('generate_'):
+            return f'{path.name}:{frame.lineno}'
+    for frame in frames:
+        path = Path(frame.filename)
+        if path.parent == FIGURES_DIR:
+            return f'{path.name}:{frame.lineno}'
+        if path.is_relative_to(MATPLOTLIB_DIR):
+            return f'{path.relative_to(MATPLOTLIB_DIR.parent)}:{frame.lineno}'
+    frame = frames[0]
+    return f'{Path(frame.filename).name}:{frame.lineno}'
+
+
+def allocation_sites(snapshot, limit=TOP_SITES):
+    """[(site, MB, NumPy MB)] with the most memory alive in snapshot."""
+    sizes = defaultdict(lambda: [0, 0])
+    for trace in snapshot.traces:
+        site = sizes[_site(trace.traceback)]
+        site[0] += trace.size
+        if trace.domain == NUMPY_DOMAIN:
+            site[1] += trace.size
+    ranked = sorted(sizes.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+    return [(site, total / MB, numpy / MB) for site, (total, numpy) in ranked]
+
+
+def measure_memory(job, workdir):
+    """Run job under tracemalloc and return its memory report (see module docstring)."""
+    from figure_runner import peak_rss_mb, preload, run_job
+
+    preload(job)  # import costs are shared by every figure; keep them out of the accounting
+    tracemalloc.start(TRACE_FRAMES)
+    watcher = PeakSnapshotter()
+    watcher.start()
+
+    def after_save(phase, start, end, obj):
+        watcher.capture(force=True)
+
+    try:
+        with instrument(after_save, {'save': PHASE_HOOKS['save']}):
+            run_job(job, workdir)
+    finally:
+        watcher.stop()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    snapshot = watcher.snapshot
+    numpy_bytes = sum(t.size for t in snapshot.traces if t.domain == NUMPY_DOMAIN) if snapshot else 0
+    return {
+        'peak_mb': peak / MB,
+        'numpy_mb': numpy_bytes / MB,
+        'transient_mb': (peak - watcher.current) / MB,
+        'peak_rss_mb': peak_rss_mb(),
+        'sites': allocation_sites(snapshot) if snapshot else [],
+    }
+
+
+def print_report(job, report):
+    print(f"  {job.name:<32} peak {report['peak_mb']:7.1f}MB  numpy {report['numpy_mb']:7.1f}MB  "
+          f"transient {report['transient_mb']:7.1f}MB  rss {report['peak_rss_mb']:6.0f}MB")
+    for site, total, numpy in report['sites']:
+        print(f"      {total:7.1f}MB  (numpy {numpy:6.1f}MB)  {site}")
+
+
+def account(jobs):
+    """Measure every job in its own process, print the reports and record RSS estimates."""
+    from figure_runner import failure
+
+    observed = {}
+    for job in jobs:
+        with tempfile.TemporaryDirectory(prefix='figmem-') as workdir:
+            result = Path(workdir) / 'result.json'
+            proc = subprocess.run(
+                [sys.executable, str(FIGURES_DIR / 'figure_runner.py'), job.key,
+                 '--workdir', workdir, '--result', str(result), '--memory'],
+                cwd=FIGURES_DIR, capture_output=True, text=True)
+            if proc.returncode != 0:
+                print(f"✗ {job.key} failed: {failure(proc)}", file=sys.stderr)
+                continue
+            report = json.loads(result.read_text())
+        print_report(job, report)
+        observed[job.key] = report['peak_rss_mb']
+    save_estimates(observed)
+    print(f"\n✓ Recorded peak RSS of {len(observed)} figures in {estimates_file()}")
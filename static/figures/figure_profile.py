@@ -0,0 +1,153 @@
+"""
+Profile one figure generator (generate_figures.py --profile NAME).
+
+Writes two files to the build cache (figures/profile/):
+    <name>.pstats      load with pstats / snakeviz
+    <name>.collapsed   'frame;frame;frame weight' lines for flamegraph.pl or speedscope
+
+With pyinstrument installed, the run is sampled (low overhead, weights in
+microseconds). Otherwise it runs under cProfile, and a small stack-sampling
+thread collects the collapsed stacks (weights in 1 ms samples; Python-heavy
+frames look somewhat slower than they are because cProfile is active too).
+
+The top cumulative hotspots are printed twice: once for code in this
+directory (the generator and the figure_* helpers it uses, leaving out
+the profiling harness) and once for matplotlib internals.
+"""
+
+import cProfile
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+from figure_registry import FIGURES_DIR, cache_dir
+
+TOP_N = 20
+SAMPLE_INTERVAL = 0.001
+HARNESS = {'figure_profile.py', 'figure_runner.py'}  # wrap the whole run, so they would top every list
+
+try:
+    from pyinstrument import Profiler as SamplingProfiler
+    from pyinstrument.renderers import PstatsRenderer
+except ImportError:
+    SamplingProfiler = None
+
+
+def _label(function, filename, line):
+    return f'{function} ({Path(filename).name}:{line})'.replace(';', ',')
+
+
+class StackSampler(threading.Thread):
+    """Samples the calling thread's stack every interval seconds into collapsed-stack counts."""
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.target_id = threading.get_ident()
+        self.stacks = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.target_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(_label(code.co_name, code.co_filename, code.co_firstlineno))
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        return self.stacks
+
+
+def _pyinstrument_stacks(frame, prefix=(), stacks=None):
+    """Collapse a pyinstrument frame tree into {stack: self time in microseconds}."""
+    stacks = Counter() if stacks is None else stacks
+    path = prefix if frame.is_synthetic else prefix + (_label(frame.function, frame.file_path, frame.line_no),)
+    if frame.total_self_time and path:
+        stacks[';'.join(path)] += int(frame.total_self_time * 1e6)
+    for child in frame.children:
+        _pyinstrument_stacks(child, path, stacks)
+    return stacks
+
+
+def _profile_sampled(run, stats_file):
+    profiler = SamplingProfiler(interval=SAMPLE_INTERVAL)
+    profiler.start()
+    try:
+        run()
+    finally:
+        session = profiler.stop()
+    stats = PstatsRenderer().render(session)
+    stats_file.write_bytes(stats.encode('utf-8', errors='surrogateescape'))
+    return _pyinstrument_stacks(session.root_frame())
+
+
+def _profile_deterministic(run, stats_file):
+    profiler, sampler = cProfile.Profile(), StackSampler()
+    sampler.start()
+    profiler.enable()
+    try:
+        run()
+    finally:
+        profiler.disable()
+        stacks = sampler.stop()
+    profiler.dump_stats(str(stats_file))
+    return stacks
+
+
+def _is_matplotlib(filename):
+    parts = Path(filename).parts
+    return 'matplotlib' in parts or 'mpl_toolkits' in parts
+
+
+def _is_project(filename):
+    path = Path(filename)
+    return (path.parent == FIGURES_DIR and path.name not in HARNESS
+            and path.name.startswith(('generate_', 'figure_')))
+
+
+def hotspots(stats_file, keep, limit=TOP_N):
+    """[(cumulative s, total s, calls, label)] for the top functions whose file passes keep()."""
+    stats = pstats.Stats(str(stats_file)).stats
+    rows = [(ct, tt, nc, _label(func, filename, line))
+            for (filename, line, func), (cc, nc, tt, ct, callers) in stats.items() if keep(filename)]
+    return sorted(rows, reverse=True)[:limit]
+
+
+def print_hotspots(title, rows):
+    print(f"\n{title}")
+    print(f"  {'cumulative':>10}  {'own':>8}  {'calls':>8}  function")
+    for ct, tt, nc, label in rows:
+        calls = str(nc) if nc >= 0 else '-'  # pyinstrument samples carry no call counts
+        print(f"  {ct:9.3f}s  {tt:7.3f}s  {calls:>8}  {label}")
+
+
+def profile(job, run):
+    """Profile run() (which renders job) and print where the time went; returns the output paths."""
+    out_dir = cache_dir('profile')
+    stats_file, collapsed_file = out_dir / f'{job.name}.pstats', out_dir / f'{job.name}.collapsed'
+
+    start = time.perf_counter()
+    if SamplingProfiler is not None:
+        mode = 'pyinstrument (sampling)'
+        stacks = _profile_sampled(run, stats_file)
+    else:
+        mode = 'cProfile'
+        stacks = _profile_deterministic(run, stats_file)
+    wall = time.perf_counter() - start
+    collapsed_file.write_text(''.join(f'{stack} {weight}\n' for stack, weight in sorted(stacks.items())))
+
+    print(f"\nProfiled {job.key} with {mode}: {wall:.2f}s wall")
+    print_hotspots(f"Top {TOP_N} cumulative hotspots - project code", hotspots(stats_file, _is_project))
+    print_hotspots(f"Top {TOP_N} cumulative hotspots - matplotlib internals", hotspots(stats_file, _is_matplotlib))
+    print(f"\n✓ Wrote {stats_file}")
+    print(f"✓ Wrote {collapsed_file}")
+    return stats_file, collapsed_file
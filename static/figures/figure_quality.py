@@ -0,0 +1,73 @@
+"""
+Render quality settings shared by every generator: final build vs draft preview.
+
+The settings travel in environment variables, so worker processes and the
+render daemon's children inherit them:
+
+    FIGURES_DRAFT=1   draft preview: DRAFT_DPI, no bbox_inches='tight' (saves the
+                      extra draw pass that measures extents), mathtext instead of
+                      usetex, Monte-Carlo sample counts scaled by DRAFT_SCALE,
+                      no dark-theme variant
+    FIGURES_SCALE=x   multiply sample counts by x (default 1, or DRAFT_SCALE in draft)
+
+usetex figures also fall back to mathtext when TeX is not installed, and
+otherwise render through the shared cache in tex_cache.py.
+
+Generators opt in through the knobs below; the final build (no variables
+set) renders exactly as before:
+
+    from figure_quality import scaled
+    n_samples = scaled(10000, minimum=500)
+"""
+
+import os
+import sys
+
+import tex_cache
+
+DRAFT_DPI = 60
+DRAFT_SCALE = 0.1
+
+
+def is_draft():
+    return os.environ.get('FIGURES_DRAFT', '') not in ('', '0')
+
+
+def sample_scale():
+    return float(os.environ.get('FIGURES_SCALE', DRAFT_SCALE if is_draft() else 1.0))
+
+
+def scaled(n, minimum=1):
+    """Sample-count knob: n in the final build, n * sample_scale() (at least minimum) otherwise."""
+    return max(minimum, int(round(n * sample_scale())))
+
+
+def use_tex():
+    """Whether text should go through LaTeX (usetex) rather than matplotlib's mathtext."""
+    return not is_draft() and tex_cache.tex_available()
+
+
+def tex_rc(preamble=''):
+    """rcParams for LaTeX-typeset figures, with a Computer Modern mathtext look when TeX is off."""
+    if use_tex():
+        tex_cache.configure()
+        return {'text.usetex': True, 'font.family': 'serif', 'font.serif': ['Computer Modern Roman'],
+                'text.latex.preamble': preamble}
+    if not is_draft():
+        print(f"⚠ {', '.join(tex_cache.missing_tools())} not found; typesetting math with mathtext", file=sys.stderr)
+    return {'text.usetex': False, 'mathtext.fontset': 'cm', 'font.family': 'serif',
+            'font.serif': ['cmr10'], 'axes.formatter.use_mathtext': True}
+
+
+def dark_variant():
+    """Whether save_figure() also writes the dark-theme copy (figure_theme)."""
+    return not is_draft()
+
+
+def save_options(kwargs):
+    """Adjust savefig keyword arguments for the current quality mode."""
+    if is_draft():
+        kwargs = {**kwargs, 'dpi': DRAFT_DPI}
+        kwargs.pop('bbox_inches', None)
+        kwargs.pop('pad_inches', None)
+    return kwargs
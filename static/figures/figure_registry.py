@@ -0,0 +1,163 @@
+"""
+Registry of every figure producer in this directory.
+
+Two kinds of producer exist:
+    generate_<name>.py               standalone script, run as __main__
+    generate_figures.generate_<x>()  one figure per function
+
+Discovery is static (AST only), so listing figures never imports matplotlib.
+Each FigureJob records the PNG files it writes, taken from the literal file
+names passed to save_figure() (or savefig()). Every output file has exactly
+one producer: discover() refuses a tree where two producers write the same
+file, since a full build would render it twice and keep whichever finished
+last. unreferenced() lists the jobs whose figures the notes page never
+shows, so dead renders can be pruned; in_notes_order() sorts the others
+by where the page shows them.
+"""
+
+import ast
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+FIGURES_DIR = Path(__file__).resolve().parent
+REPO_ROOT = FIGURES_DIR.parents[1]
+COLLECTION_SCRIPT = FIGURES_DIR / 'generate_figures.py'
+SAVE_FUNCTIONS = {'savefig', 'save_figure', 'save_animation'}
+NOTES_PAGE = REPO_ROOT / 'static' / 'ml_ai_notes.html'
+FIGURE_REF = re.compile(r'figures/([\w.-]+\.png)')
+
+
+@dataclass(frozen=True)
+class FigureJob:
+    name: str            # short name, e.g. 'mcmc' or 'attention_heatmap'
+    script: Path
+    function: str = None  # set for generate_figures.py functions
+    outputs: tuple = ()
+    imports: tuple = ()  # top-level modules the producer imports
+
+    @property
+    def key(self):
+        """Unique id, stable across runs: 'generate_mcmc.py' or 'generate_figures.py::generate_x'."""
+        if self.function:
+            return f'{self.script.name}::{self.function}'
+        return self.script.name
+
+
+def cache_dir(*parts):
+    """Return (and create) a directory in the build cache (override root with BUILD_CACHE_DIR)."""
+    path = Path(os.environ.get('BUILD_CACHE_DIR', REPO_ROOT / '.cache')).joinpath('figures', *parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _saved_files(node):
+    """Literal file names passed to save_figure() or savefig() anywhere under node."""
+    files = []
+    for call in ast.walk(node):
+        if not isinstance(call, ast.Call) or not call.args:
+            continue
+        func = call.func
+        name = func.attr if isinstance(func, ast.Attribute) else getattr(func, 'id', None)
+        first = call.args[0]
+        if name in SAVE_FUNCTIONS and isinstance(first, ast.Constant) and isinstance(first.value, str):
+            files.append(first.value)
+    return tuple(files)
+
+
+def _imports(tree):
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            modules.append(node.module)
+    return tuple(dict.fromkeys(modules))
+
+
+def module_imports(path):
+    """Top-level modules the Python file at path imports."""
+    path = Path(path)
+    return _imports(ast.parse(path.read_text(encoding='utf-8'), filename=str(path)))
+
+
+def producers(jobs):
+    """Map every output file to the one job that writes it; exits if two jobs write the same file."""
+    owners, collisions = {}, {}
+    for job in jobs:
+        for output in job.outputs:
+            if output in owners and owners[output] != job:
+                collisions.setdefault(output, [owners[output].key]).append(job.key)
+            owners.setdefault(output, job)
+    if collisions:
+        raise SystemExit('Figures with more than one producer (keep one of each):\n' + '\n'.join(
+            f"  {output}: {', '.join(keys)}" for output, keys in sorted(collisions.items())))
+    return owners
+
+
+def discover(directory=FIGURES_DIR):
+    """Return every FigureJob in directory, scripts first, in file-name order.
+
+    A script that does not parse (say, saved mid-edit) is still a job, with
+    no known outputs or imports, so running it reports its SyntaxError.
+    Exits if two jobs write the same output file (see producers()).
+    """
+    jobs, functions = [], []
+    for script in sorted(Path(directory).glob('generate_*.py')):
+        try:
+            tree = ast.parse(script.read_text(encoding='utf-8'), filename=str(script))
+        except SyntaxError as err:
+            print(f"⚠ {script.name}:{err.lineno}: {err.msg}")
+            tree = ast.Module(body=[], type_ignores=[])
+        imports = _imports(tree)
+        if script.name == COLLECTION_SCRIPT.name:
+            for node in tree.body:
+                if isinstance(node, ast.FunctionDef) and node.name.startswith('generate_'):
+                    functions.append(FigureJob(node.name[len('generate_'):], script, node.name,
+                                               _saved_files(node), imports))
+        else:
+            jobs.append(FigureJob(script.stem[len('generate_'):], script, None, _saved_files(tree), imports))
+    producers(jobs + functions)
+    return jobs + functions
+
+
+def select(names, jobs=None):
+    """Resolve names (short names or keys) to jobs; no names selects everything.
+
+    A job named twice (say by short name and by key) is selected once.
+    """
+    jobs = discover() if jobs is None else jobs
+    if not names:
+        return list(jobs)
+    selected = []
+    for name in names:
+        matches = [job for job in jobs if name in (job.key, job.name, job.script.name, job.script.stem)]
+        if not matches:
+            raise SystemExit(f"Unknown figure '{name}'. Known: {', '.join(sorted(j.name for j in jobs))}")
+        if len(matches) > 1:
+            raise SystemExit(f"Figure name '{name}' is ambiguous: {', '.join(j.key for j in matches)}")
+        if matches[0] not in selected:
+            selected.append(matches[0])
+    return selected
+
+
+def referenced(page=NOTES_PAGE):
+    """File names of the figures the notes page embeds (figures/<name>.png), in page order."""
+    return list(dict.fromkeys(FIGURE_REF.findall(Path(page).read_text(encoding='utf-8'))))
+
+
+def in_notes_order(jobs=None, page=NOTES_PAGE):
+    """Jobs whose outputs the notes page embeds, ordered by where their first figure appears."""
+    jobs = discover() if jobs is None else jobs
+    position = {name: index for index, name in enumerate(referenced(page))}
+    shown = {job: min((position.get(Path(output).name, len(position)) for output in job.outputs),
+                      default=len(position)) for job in jobs}
+    return sorted((job for job in jobs if shown[job] < len(position)), key=shown.get)
+
+
+def unreferenced(jobs=None, page=NOTES_PAGE):
+    """Jobs none of whose outputs the notes page embeds, in discovery order."""
+    jobs = discover() if jobs is None else jobs
+    shown = set(referenced(page))
+    return [job for job in jobs if not any(Path(output).name in shown for output in job.outputs)]
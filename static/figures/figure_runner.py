@@ -0,0 +1,140 @@
+"""
+Run one registered figure in the current process.
+
+Shared by the benchmark and the build driver. Each job runs inside its own
+rcParams context (the scripts freely mutate rcParams and styles) with
+FIGURES_OUTPUT set to the output directory, which save_figure() resolves
+the generators' relative paths against (see figure_io.py).
+
+USAGE (child-process mode, used by the benchmark and the parallel build):
+    python figure_runner.py KEY --workdir DIR                       # just render
+    python figure_runner.py KEY --workdir DIR --trace TRACE.json
+    python figure_runner.py KEY --workdir DIR --result RESULT.json [--memory]
+"""
+
+import argparse
+import importlib
+import json
+import os
+import resource
+import runpy
+import signal
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+from figure_hooks import RERENDER_PHASES, PhaseEvents, instrument
+from figure_registry import FIGURES_DIR, select
+from figure_style import use_build_cache
+
+use_build_cache()
+
+if str(FIGURES_DIR) not in sys.path:
+    sys.path.insert(0, str(FIGURES_DIR))
+
+
+def preload(job):
+    """Import the producer's top-level dependencies; returns seconds spent."""
+    start = time.perf_counter()
+    for module in job.imports:
+        importlib.import_module(module)
+    return time.perf_counter() - start
+
+
+def run_job(job, workdir):
+    """Execute job with its figures saved under workdir."""
+    import matplotlib
+    import matplotlib.pyplot as plt
+
+    root, argv = os.environ.get('FIGURES_OUTPUT'), sys.argv
+    os.environ['FIGURES_OUTPUT'] = str(Path(workdir).resolve())
+    sys.argv = [str(job.script)]
+    try:
+        with matplotlib.rc_context():
+            if job.function:
+                namespace = runpy.run_path(str(job.script), run_name='figure_job')
+                namespace[job.function]()
+            else:
+                runpy.run_path(str(job.script), run_name='__main__')
+    finally:
+        plt.close('all')
+        sys.argv = argv
+        if root is None:
+            del os.environ['FIGURES_OUTPUT']
+        else:
+            os.environ['FIGURES_OUTPUT'] = root
+
+
+def failure(proc):
+    """Why a finished figure_runner.py process failed: its last stderr line, else how it exited."""
+    lines = (proc.stderr or '').strip().splitlines()
+    if lines:
+        return lines[-1]
+    if proc.returncode < 0:
+        return f'killed by {signal.Signals(-proc.returncode).name}'
+    return f'exit status {proc.returncode}'
+
+
+def output_bytes(job, workdir):
+    return sum((Path(workdir) / o).stat().st_size for o in job.outputs if (Path(workdir) / o).exists())
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process (ru_maxrss is KiB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+def measure(job, workdir):
+    """Run job once and split its wall time into pipeline phases."""
+    import_s = preload(job)
+    events = PhaseEvents()
+    start = time.perf_counter()
+    with instrument(events):
+        run_job(job, workdir)
+    wall_s = time.perf_counter() - start
+
+    save_s = events.total('save')
+    draw_s = events.total('draw')
+    rerender_s = sum(events.total(phase) for phase in RERENDER_PHASES)
+    return {
+        'import_s': import_s,
+        'compute_s': wall_s - save_s - rerender_s - events.total('draw', within=False),
+        'draw_s': draw_s,
+        'encode_s': save_s - events.total('draw', within=True),
+        'dark_s': events.total('save_dark'),
+        'total_s': import_s + wall_s,
+        'peak_rss_mb': peak_rss_mb(),
+        'output_bytes': output_bytes(job, workdir),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run one figure and report phase timings.')
+    parser.add_argument('figure', help='figure name or key (see figure_registry.py)')
+    parser.add_argument('--workdir', required=True, help='directory the figure is written to')
+    parser.add_argument('--result', help='JSON file to write measurements to (default: only render)')
+    parser.add_argument('--memory', action='store_true', help='measure memory instead of phase timings')
+    parser.add_argument('--trace', help='write a Chrome trace of the render to this file')
+    args = parser.parse_args()
+
+    job, = select([args.figure])
+    if args.result:
+        if args.memory:
+            from figure_memory import measure_memory
+            metrics = measure_memory(job, args.workdir)
+        else:
+            metrics = measure(job, args.workdir)
+        Path(args.result).write_text(json.dumps(metrics))
+    elif args.trace:
+        from figure_trace import tracing
+        with tracing(args.trace) as trace, trace.figure(job.name):
+            run_job(job, args.workdir)
+    else:
+        run_job(job, args.workdir)
+
+
+if __name__ == '__main__':
+    main()
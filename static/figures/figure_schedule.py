@@ -0,0 +1,114 @@
+"""
+Longest-processing-time-first ordering for the parallel build.
+
+With N workers the build's makespan is set by whichever long figure starts
+last: if MCMC or a usetex figure is picked up near the end, every other
+worker sits idle while it finishes. Starting the longest figures first (LPT)
+keeps all workers busy until the queue drains, and is within 4/3 of the
+optimal makespan.
+
+Expected durations, in order of preference:
+
+    1. the wall time the last parallel build observed for the figure
+       (figures/schedule/durations.json in the build cache)
+    2. the median total_s of the figure's recent benchmark runs
+       (benchmark_figures.py history)
+    3. for figures neither has seen, a line fitted to source size vs
+       duration over the figures that do have timings (the producer's
+       script, or its function in generate_figures.py)
+"""
+
+import ast
+import heapq
+import json
+import os
+import statistics
+
+from figure_registry import cache_dir
+
+HISTORY_RUNS = 5          # benchmark records the median is taken over
+DEFAULT_STARTUP_S = 1.0   # interpreter + imports, when nothing has been timed yet
+DEFAULT_S_PER_KB = 0.15   # per KB of producer source, likewise
+
+
+def durations_file():
+    return cache_dir('schedule') / 'durations.json'
+
+
+def benchmark_durations():
+    """{job key: median total_s over the last HISTORY_RUNS benchmark records that timed it}."""
+    try:
+        history = json.loads((cache_dir('bench') / 'history.json').read_text())
+    except FileNotFoundError:
+        return {}
+    runs = {}
+    for record in history:
+        for key, metrics in record.get('figures', {}).items():
+            runs.setdefault(key, []).append(metrics['total_s'])
+    return {key: statistics.median(times[-HISTORY_RUNS:]) for key, times in runs.items()}
+
+
+def load_durations():
+    """{job key: expected seconds} from benchmarks, overridden by the last build's observations."""
+    durations = benchmark_durations()
+    try:
+        durations.update(json.loads(durations_file().read_text()))
+    except FileNotFoundError:
+        pass
+    return durations
+
+
+def save_durations(observed):
+    """Merge {job key: seconds} into the durations file (latest observation wins)."""
+    try:
+        durations = json.loads(durations_file().read_text())
+    except FileNotFoundError:
+        durations = {}
+    durations.update({key: round(seconds, 3) for key, seconds in observed.items()})
+    tmp = durations_file().with_suffix('.tmp')
+    tmp.write_text(json.dumps(durations, indent=1, sort_keys=True))
+    os.replace(tmp, durations_file())
+
+
+def source_bytes(job):
+    """Size of the code that produces job: its generate_figures.py function, or its whole script."""
+    source = job.script.read_text(encoding='utf-8')
+    if job.function:
+        for node in ast.parse(source).body:
+            if isinstance(node, ast.FunctionDef) and node.name == job.function:
+                return len(ast.get_source_segment(source, node).encode())
+    return len(source.encode())
+
+
+def _fit(points):
+    """Least-squares (intercept, slope) of seconds over source bytes, or the defaults."""
+    if len(points) >= 2:
+        xs, ys = zip(*points)
+        mean_x, mean_y = statistics.fmean(xs), statistics.fmean(ys)
+        spread = sum((x - mean_x) ** 2 for x in xs)
+        if spread:
+            slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+            if slope > 0:
+                return mean_y - slope * mean_x, slope
+    return DEFAULT_STARTUP_S, DEFAULT_S_PER_KB / 1024
+
+
+def predict(jobs, durations=None):
+    """{job key: expected seconds}, timed figures from history and the rest from source size."""
+    durations = load_durations() if durations is None else durations
+    sizes = {job.key: source_bytes(job) for job in jobs}
+    intercept, slope = _fit([(sizes[k], durations[k]) for k in sizes if k in durations])
+    return {key: durations.get(key, max(intercept + slope * size, 0.0)) for key, size in sizes.items()}
+
+
+def lpt_order(jobs, predicted):
+    """Jobs sorted longest expected duration first (ties keep registry order)."""
+    return sorted(jobs, key=lambda job: -predicted[job.key])
+
+
+def makespan(durations, workers):
+    """Finish time of list-scheduling durations, in order, onto workers that each take the next job when free."""
+    finish = [0.0] * max(1, min(workers, len(durations)))
+    for seconds in durations:
+        heapq.heapreplace(finish, finish[0] + seconds)
+    return max(finish)
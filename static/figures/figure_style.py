@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Shared project style for every generator.
+
+A generator sets up its look with one call instead of a style.use() plus a
+block of rcParams lines copied from its neighbours:
+
+    from figure_style import use_style
+    use_style('whitegrid', 'labels')                   # a named combination
+    use_style('hidpi', rc={'font.size': 12})           # plus per-figure overrides
+
+The named fragments in STYLES and the overrides are compiled once into a flat
+.mplstyle file in the build cache (figures/style/), keyed by the matplotlib
+version and the fragment definitions; later calls only load that file on
+top of matplotlib's defaults, so every figure starts from the same state no
+matter what ran before it in the process.
+
+Build entry points (the driver, figure_runner workers, the render daemon)
+call use_build_cache() before importing matplotlib, which moves matplotlib's
+config cache, and with it the font list it otherwise rebuilds on every fresh
+CI or Netlify container, into the build cache as well. warm_up() builds that
+font list up front:
+
+    python figure_style.py        # warm the font list and compile the styles
+"""
+
+import enum
+import hashlib
+import json
+import os
+import time
+
+from figure_registry import cache_dir
+
+# name: (matplotlib base style or None, rcParams on top of it)
+STYLES = {
+    'whitegrid': ('seaborn-v0_8-whitegrid', {}),
+    'hidpi': (None, {'figure.dpi': 150, 'savefig.dpi': 150}),
+    'labels': (None, {'font.size': 11, 'axes.labelsize': 12, 'axes.titlesize': 13}),
+}
+
+
+def use_build_cache():
+    """Keep matplotlib's config cache (font list) in the build cache; call before importing matplotlib."""
+    os.environ.setdefault('MPLCONFIGDIR', str(cache_dir('matplotlib')))
+
+
+def _format(value):
+    if isinstance(value, enum.Enum):
+        return str(value.value)
+    if isinstance(value, (list, tuple)):
+        return ', '.join(map(str, value))
+    return str(value)
+
+
+def style_params(names=(), rc=None):
+    """rcParams (on top of matplotlib's defaults) for the named fragments plus rc overrides."""
+    import matplotlib.style
+
+    params = {}
+    for name in names:
+        base, extra = STYLES[name]
+        if base:
+            params.update(matplotlib.style.library[base])
+        params.update(extra)
+    params.update(rc or {})
+    return params
+
+
+def compile_style(names=(), rc=None):
+    """Return the compiled .mplstyle for this combination, writing it on first use."""
+    import matplotlib
+
+    from figure_io import write_if_changed
+
+    spec = json.dumps([matplotlib.__version__, [(n, repr(STYLES[n])) for n in names],
+                       sorted((k, repr(v)) for k, v in (rc or {}).items())])
+    digest = hashlib.sha256(spec.encode()).hexdigest()[:12]
+    path = cache_dir('style') / f"{'+'.join(names) or 'default'}-{digest}.mplstyle"
+    if not path.exists():
+        lines = [f'# {" + ".join(names) or "default"} for matplotlib {matplotlib.__version__}',
+                 *(f'{key}: {_format(value)}' for key, value in style_params(names, rc).items())]
+        write_if_changed(path, ('\n'.join(lines) + '\n').encode())
+    return path
+
+
+def use_style(*names, rc=None):
+    """Reset rcParams to matplotlib's defaults and apply the compiled project style."""
+    import matplotlib.pyplot as plt
+
+    plt.style.use(['default', compile_style(names, rc)])
+
+
+def warm_up():
+    """Build the font list and compile every named fragment; returns seconds."""
+    start = time.perf_counter()
+    import matplotlib.font_manager  # loads the cached font list, or scans the system fonts and writes it
+
+    matplotlib.font_manager.fontManager.findfont('DejaVu Sans')
+    for name in STYLES:
+        compile_style((name,))
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    use_build_cache()
+    seconds = warm_up()
+    import matplotlib
+    print(f"✓ Font list and styles cached in {matplotlib.get_cachedir()} and {cache_dir('style')} ({seconds:.2f}s)")
@@ -0,0 +1,96 @@
+"""
+SVG copies of the figures, kept small.
+
+With FIGURES_SVG=1 (generate_figures.py --svg) save_figure() also saves
+every PNG figure as `<name>.svg`. A naive SVG of a 100×100 plot_surface or
+a 10,000-point MCMC trace runs to megabytes of path data that no reader
+can tell from an image, so the SVG is tuned before it is written:
+
+    - artists with more than VERTEX_BUDGET vertices (surfaces, contourf,
+      meshes, long traces, large scatters, histograms with many bins) are
+      drawn rasterized, as an image embedded at the figure's DPI, while
+      axes, text and the sparse artists stay vector
+    - paths are simplified to SIMPLIFY_PX: vertices that move a line by less
+      than that (in output pixels) are dropped
+    - text is drawn as glyph outlines ('path' fonttype), each glyph defined
+      once in <defs> and referenced by every character that uses it, which
+      subsets the fonts to the glyphs on the figure and needs no font files
+
+generate_figures.py --svg ends with a size report, SVG against PNG bytes.
+"""
+
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+import matplotlib
+from matplotlib.collections import Collection, QuadMesh
+from matplotlib.container import BarContainer
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+
+VERTEX_BUDGET = 5000
+SIMPLIFY_PX = 0.5
+SVG_RC = {'svg.fonttype': 'path', 'path.simplify': True, 'path.simplify_threshold': SIMPLIFY_PX}
+
+
+def svg_export():
+    return os.environ.get('FIGURES_SVG', '') not in ('', '0')
+
+
+def vertex_count(artist):
+    """Number of vertices artist draws (markers and collection offsets count once each)."""
+    if isinstance(artist, Line2D):
+        return len(artist.get_xydata())
+    if isinstance(artist, QuadMesh):
+        return artist.get_coordinates().shape[0] * artist.get_coordinates().shape[1]
+    if isinstance(artist, Collection):
+        paths = artist.get_paths()
+        vertices = sum(len(path.vertices) for path in paths)
+        return max(vertices, vertices // max(len(paths), 1) * len(artist.get_offsets()))
+    if isinstance(artist, Patch):
+        return len(artist.get_path().vertices)
+    return 0
+
+
+def dense_artists(fig, budget=VERTEX_BUDGET):
+    """Artists of fig (bar containers counted as a whole) with more than budget vertices."""
+    dense = [artist for artist in fig.findobj(lambda a: isinstance(a, (Line2D, Collection, Patch)))
+             if vertex_count(artist) > budget]
+    for ax in fig.axes:
+        for container in ax.containers:
+            if isinstance(container, BarContainer) and sum(map(vertex_count, container.patches)) > budget:
+                dense += container.patches
+    return dense
+
+
+@contextmanager
+def svg_ready(fig, budget=VERTEX_BUDGET):
+    """Rasterize fig's dense artists and set the SVG rcParams for the block; yields the rasterized artists."""
+    dense = [artist for artist in dense_artists(fig, budget) if not artist.get_rasterized()]
+    for artist in dense:
+        artist.set_rasterized(True)
+    try:
+        with matplotlib.rc_context(SVG_RC):
+            yield dense
+    finally:
+        for artist in dense:
+            artist.set_rasterized(False)
+
+
+def report(jobs, output):
+    """Print SVG against PNG bytes for every PNG output of jobs that has an SVG copy in output."""
+    rows = []
+    for job in jobs:
+        for name in job.outputs:
+            png = Path(output) / name
+            svg = png.with_suffix('.svg')
+            if png.suffix == '.png' and png.exists() and svg.exists():
+                rows.append((png.stem, png.stat().st_size, svg.stat().st_size))
+    if not rows:
+        return
+    print(f"\n{'figure':<36} {'PNG':>9} {'SVG':>9}  SVG/PNG")
+    for name, png_bytes, svg_bytes in sorted(rows, key=lambda row: row[2] / row[1], reverse=True):
+        print(f"{name:<36} {png_bytes / 1024:8.0f}K {svg_bytes / 1024:8.0f}K  {svg_bytes / png_bytes:6.2f}")
+    png_total, svg_total = sum(row[1] for row in rows), sum(row[2] for row in rows)
+    print(f"{'total':<36} {png_total / 1024:8.0f}K {svg_total / 1024:8.0f}K  {svg_total / png_total:6.2f}")
@@ -0,0 +1,162 @@
+"""
+Dark variants of finished figures.
+
+ml_ai_notes.html switches between a light and a dark theme, but the figures
+are drawn for a white page. Rather than computing and building every figure
+twice, save_figure() saves the light figure, recolours the artists it
+already holds to the page's dark palette, saves `<name>.dark.png` and puts
+the original colours back:
+
+    with dark_theme(fig):
+        fig.savefig('roc_curve.dark.png', facecolor=dark_fill('white'))
+
+Colours are mapped by role. Fills (figure and axes backgrounds, patch and
+collection faces) turn white into the page background and light pastels into
+dark tints of the same hue. Ink (text, lines, edges, markers, arrows) turns
+black and greys into the page's text colour and lightens dark colours (by
+luminance, so pure blue counts as dark) until they stand out. Glyph
+collections labelled INK_LABEL (figure_grids.text_layer) are text, so ink.
+Mid-tone data colours, colormapped data (images, collections with an array)
+and text placed on an image (heatmap cell labels) keep their colours.
+Alpha is always preserved.
+"""
+
+import colorsys
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+from matplotlib import colors as mcolors
+from matplotlib.collections import Collection, QuadMesh
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.patches import FancyArrowPatch, Patch
+from matplotlib.text import Text
+
+# ml_ai_notes.html [data-theme="dark"]: --bg-primary and --text-primary
+DARK_BACKGROUND = mcolors.to_rgb('#0d1117')
+DARK_TEXT = mcolors.to_rgb('#c9d1d9')
+NEUTRAL_SATURATION = 0.12  # below this a colour counts as grey
+PASTEL_LIGHTNESS = 0.7     # fills lighter than this are inverted
+MIN_INK_LUMINANCE = 0.2    # ink is lightened until its relative luminance reaches this
+INK_LABEL = '_ink'         # label of collections that draw text as glyph paths
+
+
+def _grey(lightness):
+    """White maps to the page background, black to the page text, greys in between."""
+    return tuple(bg * lightness + fg * (1 - lightness) for bg, fg in zip(DARK_BACKGROUND, DARK_TEXT))
+
+
+def _luminance(rgb):
+    """WCAG relative luminance; unlike HLS lightness it rates pure blue as dark."""
+    linear = [c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4 for c in rgb]
+    return 0.2126 * linear[0] + 0.7152 * linear[1] + 0.0722 * linear[2]
+
+
+def dark_fill(color):
+    """Dark-theme colour for a filled area."""
+    r, g, b, a = mcolors.to_rgba(color)
+    if a == 0:
+        return r, g, b, a
+    h, l, s = colorsys.rgb_to_hls(r, g, b)
+    if s < NEUTRAL_SATURATION:
+        return (*_grey(l), a)
+    if l > PASTEL_LIGHTNESS:
+        return (*colorsys.hls_to_rgb(h, 1 - l, s), a)
+    return r, g, b, a
+
+
+def dark_ink(color):
+    """Dark-theme colour for text, lines and edges."""
+    r, g, b, a = mcolors.to_rgba(color)
+    if a == 0:
+        return r, g, b, a
+    h, l, s = colorsys.rgb_to_hls(r, g, b)
+    if s < NEUTRAL_SATURATION:
+        return (*_grey(l), a)
+    while _luminance((r, g, b)) < MIN_INK_LUMINANCE and l < 1:
+        l = min(1.0, l + 0.05)
+        r, g, b = colorsys.hls_to_rgb(h, l, s)
+    return r, g, b, a
+
+
+def _recolor(changes, getter, setter, mapping):
+    old = getter()
+    if isinstance(old, np.ndarray) and old.ndim == 2:
+        if not len(old):
+            return
+        new = np.array([mapping(c) for c in old])
+    elif isinstance(old, str) and old in ('none', 'face', 'auto'):
+        return
+    else:
+        new = mapping(old)
+    changes.append((setter, old))
+    setter(new)
+
+
+def _shows_image(ax):
+    return ax is not None and bool(ax.images or any(isinstance(c, QuadMesh) for c in ax.collections))
+
+
+def _over_image(text):
+    """Data-coordinate text in axes showing an image: its colour was picked against the image, keep it."""
+    return text.axes is not None and text.get_transform() is text.axes.transData and _shows_image(text.axes)
+
+
+def _restyle(fig):
+    """Recolour every artist of fig in place; returns [(setter, original value)]."""
+    changes = []
+    for artist in fig.findobj():
+        if isinstance(artist, Figure):
+            _recolor(changes, artist.get_facecolor, artist.set_facecolor, dark_fill)
+            _recolor(changes, artist.get_edgecolor, artist.set_edgecolor, dark_ink)
+        elif isinstance(artist, Text) and not _over_image(artist):
+            _recolor(changes, artist.get_color, artist.set_color, dark_ink)
+            bbox = artist.get_bbox_patch()
+            if bbox is not None:
+                _recolor(changes, bbox.get_facecolor, bbox.set_facecolor, dark_fill)
+                _recolor(changes, bbox.get_edgecolor, bbox.set_edgecolor, dark_ink)
+            arrow = getattr(artist, 'arrow_patch', None)
+            if arrow is not None:
+                _recolor(changes, arrow.get_facecolor, arrow.set_facecolor, dark_ink)
+                _recolor(changes, arrow.get_edgecolor, arrow.set_edgecolor, dark_ink)
+        elif isinstance(artist, Line2D):
+            _recolor(changes, artist.get_color, artist.set_color, dark_ink)
+            _recolor(changes, artist.get_markerfacecolor, artist.set_markerfacecolor, dark_ink)
+            _recolor(changes, artist.get_markeredgecolor, artist.set_markeredgecolor, dark_ink)
+        elif isinstance(artist, FancyArrowPatch):
+            _recolor(changes, artist.get_facecolor, artist.set_facecolor, dark_ink)
+            _recolor(changes, artist.get_edgecolor, artist.set_edgecolor, dark_ink)
+        elif isinstance(artist, Patch):
+            _recolor(changes, artist.get_facecolor, artist.set_facecolor, dark_fill)
+            _recolor(changes, artist.get_edgecolor, artist.set_edgecolor, dark_ink)
+        elif isinstance(artist, Collection) and artist.get_label() == INK_LABEL:
+            if not _shows_image(artist.axes):  # glyphs placed in data coordinates, like _over_image()
+                _recolor(changes, artist.get_facecolor, artist.set_facecolor, dark_ink)
+        elif isinstance(artist, Collection) and artist.get_array() is None:
+            face_edges = isinstance(artist._edgecolors, str) and artist._edgecolors == 'face'
+            _recolor(changes, artist.get_facecolor, artist.set_facecolor, dark_fill)
+            if not face_edges:  # edges drawn in the face colour follow it on their own
+                _recolor(changes, artist.get_edgecolor, artist.set_edgecolor, dark_ink)
+    return changes
+
+
+@contextmanager
+def dark_theme(fig):
+    """Temporarily recolour fig for the dark theme.
+
+    Call this after the light figure has been drawn once, so every tick it
+    will draw already exists and is recoloured with the rest.
+    """
+    changes = _restyle(fig)
+    try:
+        yield fig
+    finally:
+        for setter, old in reversed(changes):
+            setter(old)
+
+
+def dark_path(fname):
+    """'figures/roc_curve.png' -> 'figures/roc_curve.dark.png'."""
+    path = Path(fname)
+    return path.with_name(f'{path.stem}.dark{path.suffix}')
@@ -0,0 +1,105 @@
+"""
+Chrome-trace recording of the figure render pipeline.
+
+ChromeTrace is a figure_hooks listener: every hooked call becomes a complete
+('X') event, and each figure gets an enclosing span whose args summarise the
+phases (compute is whatever is left over: NumPy work and Python glue) and
+count the artists by type at the first save of each Figure. The written file opens in
+chrome://tracing or https://ui.perfetto.dev.
+
+USAGE:
+------
+    with tracing('trace.json') as trace:
+        for job in jobs:
+            with trace.figure(job.name):
+                run_job(job, workdir)
+"""
+
+import json
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+from figure_hooks import RERENDER_PHASES, TRACE_HOOKS, instrument
+
+# Phases that make up a figure's wall time; draw/encode inside save are reported separately
+SUMMARY_PHASES = ('artists', 'layout', 'draw', 'encode', 'save', *RERENDER_PHASES)
+
+
+def artist_counts(fig):
+    """{artist class name: count} for every artist reachable from fig."""
+    return dict(Counter(type(artist).__name__ for artist in fig.findobj()).most_common())
+
+
+class ChromeTrace:
+    """Collects trace events for one process; listener(phase, start, end, obj) per figure_hooks."""
+
+    def __init__(self):
+        self.events = []
+        self.pid = os.getpid()
+        # perf_counter is per-process; anchor to wall clock so traces from several workers line up
+        self._offset = time.time() - time.perf_counter()
+        self._figure = None
+
+    def _us(self, t):
+        return round((t + self._offset) * 1e6, 1)
+
+    def __call__(self, phase, start, end, obj=None):
+        args = {}
+        if phase == 'save' and obj is not None:
+            args['artists'] = artist_counts(obj)
+            if self._figure is not None and id(obj) not in self._figure['saved']:
+                self._figure['saved'].add(id(obj))
+                self._figure['artists'].update(args['artists'])
+        if self._figure is not None:
+            self._figure['phases'][phase] += end - start
+            self._figure['spans'].append((start, end))
+        self.events.append({'name': phase, 'cat': 'phase', 'ph': 'X', 'pid': self.pid, 'tid': 0,
+                            'ts': self._us(start), 'dur': round((end - start) * 1e6, 1), 'args': args})
+
+    @contextmanager
+    def figure(self, name):
+        """Wrap one figure's run in a span summarising its phases and artists."""
+        self._figure = {'phases': Counter(), 'artists': Counter(), 'spans': [], 'saved': set()}
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            phases, artists, spans = self._figure['phases'], self._figure['artists'], self._figure['spans']
+            self._figure = None
+            # Phases nest (layout and draw run inside save); only outermost spans are subtracted
+            hooked = sum(e - s for s, e in spans
+                         if not any(s2 <= s and e <= e2 and (s2, e2) != (s, e) for s2, e2 in spans))
+            summary = {f'{p}_ms': round(phases[p] * 1e3, 2) for p in SUMMARY_PHASES}
+            summary['compute_ms'] = round(max(end - start - hooked, 0.0) * 1e3, 2)
+            summary['artists'] = dict(artists.most_common())
+            self.events.append({'name': name, 'cat': 'figure', 'ph': 'X', 'pid': self.pid, 'tid': 0,
+                                'ts': self._us(start), 'dur': round((end - start) * 1e6, 1), 'args': summary})
+
+    def write(self, path):
+        meta = [{'name': 'process_name', 'ph': 'M', 'pid': self.pid, 'args': {'name': 'figures'}}]
+        Path(path).write_text(json.dumps({'traceEvents': meta + self.events, 'displayTimeUnit': 'ms'}))
+
+
+def merge(parts, path):
+    """Combine trace files written by separate worker processes into one trace."""
+    events = []
+    for part in parts:
+        events += json.loads(Path(part).read_text())['traceEvents']
+    Path(path).write_text(json.dumps({'traceEvents': events, 'displayTimeUnit': 'ms'}))
+    print(f"✓ Merged {len(parts)} worker traces into {path}")
+
+
+@contextmanager
+def tracing(path):
+    """Instrument the render pipeline while active and write the trace to path on exit."""
+    trace = ChromeTrace()
+    try:
+        with instrument(trace, TRACE_HOOKS):
+            yield trace
+    finally:
+        trace.write(path)
+        print(f"✓ Wrote trace ({len(trace.events)} events) to {path}")
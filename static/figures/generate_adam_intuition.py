@@ -5,20 +5,26 @@ Shows how Adam adapts learning rate for different parameters.
 
 import matplotlib.pyplot as plt
 import numpy as np
+from figure_io import save_figure
+from figure_seeds import figure_rng
+from figure_style import use_style
+
+# Set style
+use_style()
 
 # Set up the figure
 fig, axes = plt.subplots(2, 2, figsize=(14, 10))
 
 # Top left: Two parameters with different gradient behaviors
 ax1 = axes[0, 0]
-np.random.seed(42)
+rng = figure_rng('adam_intuition')
 steps = np.arange(50)
 
 # Parameter 1: Large, noisy gradients
-grad1 = np.random.randn(50) * 5 + np.sin(steps * 0.3) * 3
+grad1 = rng.standard_normal(50) * 5 + np.sin(steps * 0.3) * 3
 
 # Parameter 2: Small, consistent gradients
-grad2 = np.random.randn(50) * 0.5 + 1
+grad2 = rng.standard_normal(50) * 0.5 + 1
 
 ax1.plot(steps, grad1, 'b-', alpha=0.7, linewidth=2, label='Param 1: Large, noisy gradients')
 ax1.plot(steps, grad2, 'r-', alpha=0.7, linewidth=2, label='Param 2: Small, consistent gradients')
@@ -103,7 +109,7 @@ ax4.text(0.05, 0.95, summary_text, transform=ax4.transAxes, fontsize=10,
 plt.suptitle('How Adam Adapts Learning Rates to Parameter Gradient Statistics', 
              fontsize=14, fontweight='bold')
 plt.tight_layout()
-plt.savefig('adam_intuition.png', dpi=150, bbox_inches='tight',
+save_figure('adam_intuition.png', dpi=150, bbox_inches='tight',
             facecolor='white', edgecolor='none')
 plt.close()
 
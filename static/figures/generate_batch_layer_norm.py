@@ -6,14 +6,12 @@ Shows which dimensions each method normalizes over using a tensor grid visualiza
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch
+from figure_grids import cell_centers, cell_grid, text_layer
+from figure_io import save_figure
+from figure_style import use_style
 
 # Set style
-plt.style.use('seaborn-v0_8-whitegrid')
-plt.rcParams['font.family'] = 'DejaVu Sans'
-plt.rcParams['font.size'] = 11
-plt.rcParams['axes.labelsize'] = 12
-plt.rcParams['axes.titlesize'] = 13
+use_style('whitegrid', 'labels', rc={'font.family': 'DejaVu Sans'})
 
 # Colors
 color_batch = '#4CAF50'      # Green for batch norm
@@ -29,31 +27,22 @@ n_batch = 4
 n_features = 6
 
 def draw_tensor_grid(ax, title, highlight_func, norm_direction, arrow_color):
-    """Draw a 2D tensor grid with highlighting based on normalization type."""
+    """Draw a 2D tensor grid with highlighting based on normalization type.
+
+    highlight_func(b, f) gets the batch and feature index arrays of the whole
+    grid and returns the matching array of cell colours.
+    """
     ax.set_xlim(-0.5, n_features + 1.5)
     ax.set_ylim(-1.5, n_batch + 0.5)
     ax.set_aspect('equal')
     ax.axis('off')
     ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
     
-    cell_size = 0.9
-    
-    # Draw grid cells
-    for b in range(n_batch):
-        for f in range(n_features):
-            color = highlight_func(b, f)
-            rect = FancyBboxPatch(
-                (f + 0.05, n_batch - 1 - b + 0.05), 
-                cell_size, cell_size,
-                boxstyle="round,pad=0.02,rounding_size=0.1",
-                facecolor=color, 
-                edgecolor='white',
-                linewidth=2
-            )
-            ax.add_patch(rect)
-            # Add value text
-            ax.text(f + 0.5, n_batch - 1 - b + 0.5, f'x{b}{f}', 
-                   ha='center', va='center', fontsize=8, color='#555555')
+    # One collection for the cells and one text layer for their labels
+    b, f = np.indices((n_batch, n_features))
+    cell_grid(ax, highlight_func(b, f), inset=0.05, rounding=0.1, edgecolor='white', linewidth=2)
+    labels = [f'x{i}{j}' for i, j in zip(b.ravel(), f.ravel())]
+    text_layer(ax, cell_centers((n_batch, n_features)), labels, fontsize=8, color='#555555')
     
     # Axis labels
     ax.text(n_features/2, n_batch + 0.3, 'Features (Hidden Dim)', 
@@ -87,9 +76,7 @@ def draw_tensor_grid(ax, title, highlight_func, norm_direction, arrow_color):
 def batch_norm_highlight(b, f):
     """Highlight one feature column (all batches for feature f=2)."""
     highlight_feature = 2
-    if f == highlight_feature:
-        return color_batch
-    return color_neutral
+    return np.where(f == highlight_feature, color_batch, color_neutral)
 
 draw_tensor_grid(axes[0], 'Batch Normalization', batch_norm_highlight, 'batch', color_batch)
 
@@ -116,9 +103,7 @@ axes[0].text(0.5, -0.15, r'$\hat{x}_{b,f} = \frac{x_{b,f} - \mu_f}{\sqrt{\sigma_
 def layer_norm_highlight(b, f):
     """Highlight one batch row (all features for batch b=1)."""
     highlight_batch = 1
-    if b == highlight_batch:
-        return color_layer
-    return color_neutral
+    return np.where(b == highlight_batch, color_layer, color_neutral)
 
 draw_tensor_grid(axes[1], 'Layer Normalization', layer_norm_highlight, 'layer', color_layer)
 
@@ -151,7 +136,7 @@ fig.text(0.5, 0.96, 'Highlighted cells show which elements are normalized togeth
 
 plt.tight_layout()
 plt.subplots_adjust(top=0.86, bottom=0.22, wspace=0.05)  # Space for title area, minimal horizontal gap
-plt.savefig('batch_layer_norm.png', dpi=150, bbox_inches='tight', 
+save_figure('batch_layer_norm.png', dpi=150, bbox_inches='tight', 
             facecolor='white', edgecolor='none')
 plt.close()
 
@@ -3,17 +3,17 @@ Generate box-plot anatomy figure showing outlier detection concepts.
 """
 import matplotlib.pyplot as plt
 import numpy as np
+from figure_io import save_figure
+from figure_seeds import figure_rng
+from figure_style import use_style
 
 # Set style
-plt.style.use('seaborn-v0_8-whitegrid')
-plt.rcParams['font.size'] = 11
-plt.rcParams['axes.labelsize'] = 12
-plt.rcParams['axes.titlesize'] = 13
+use_style('whitegrid', 'labels')
 
 # Generate sample data with outliers
-np.random.seed(42)
+rng = figure_rng('boxplot')
 data = np.concatenate([
-    np.random.normal(50, 10, 100),  # Main distribution
+    rng.normal(50, 10, 100),  # Main distribution
     np.array([10, 15, 95, 100, 105])  # Outliers
 ])
 
@@ -136,7 +136,7 @@ ax2.text(0.02, 0.98, formula_text, transform=ax2.transAxes, fontsize=9,
          bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
 
 plt.tight_layout()
-plt.savefig('boxplot_anatomy.png', dpi=150, bbox_inches='tight', facecolor='white')
+save_figure('boxplot_anatomy.png', dpi=150, bbox_inches='tight', facecolor='white')
 plt.close()
 
 print("Generated: boxplot_anatomy.png")
@@ -6,35 +6,34 @@ Shows how sample means converge to normal distribution regardless of original di
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy import stats
+from figure_io import save_figure
+from figure_quality import scaled
+from figure_seeds import figure_rng
+from figure_style import use_style
 
 # Set style
-plt.rcParams['font.size'] = 10
-plt.rcParams['axes.titlesize'] = 11
-plt.rcParams['figure.facecolor'] = 'white'
+use_style(rc={'axes.titlesize': 11})
 
-np.random.seed(42)
+rng = figure_rng('clt')
 
 def sample_means(dist_func, n_samples, sample_size, **kwargs):
     """Generate n_samples sample means, each from sample_size observations."""
-    means = []
-    for _ in range(n_samples):
-        sample = dist_func(size=sample_size, **kwargs)
-        means.append(np.mean(sample))
-    return np.array(means)
+    # One (n_samples, sample_size) draw instead of n_samples small ones
+    return dist_func(size=(n_samples, sample_size), **kwargs).mean(axis=1)
 
 # Create figure with 3 rows x 4 columns
 fig, axes = plt.subplots(3, 4, figsize=(14, 10))
 
 # Number of sample means to generate
-n_samples = 10000
+n_samples = scaled(10000, minimum=200)
 
 # Three different original distributions
 distributions = [
-    ("Uniform [0,1]", lambda size: np.random.uniform(0, 1, size), 0.5, np.sqrt(1/12)),
-    ("Exponential (λ=1)", lambda size: np.random.exponential(1, size), 1.0, 1.0),
-    ("Bimodal", lambda size: np.where(np.random.random(size) < 0.5, 
-                                       np.random.normal(-2, 0.5, size),
-                                       np.random.normal(2, 0.5, size)), 0.0, np.sqrt(4.25)),
+    ("Uniform [0,1]", lambda size: rng.uniform(0, 1, size), 0.5, np.sqrt(1/12)),
+    ("Exponential (λ=1)", lambda size: rng.exponential(1, size), 1.0, 1.0),
+    ("Bimodal", lambda size: np.where(rng.random(size) < 0.5, 
+                                       rng.normal(-2, 0.5, size),
+                                       rng.normal(2, 0.5, size)), 0.0, np.sqrt(4.25)),
 ]
 
 # Sample sizes to show
@@ -43,7 +42,7 @@ sample_sizes = [1, 5, 30]
 for row, (dist_name, dist_func, mu, sigma) in enumerate(distributions):
     # Column 0: Original distribution
     ax = axes[row, 0]
-    original_samples = dist_func(size=10000)
+    original_samples = dist_func(size=scaled(10000, minimum=200))
     ax.hist(original_samples, bins=50, density=True, alpha=0.7, color='steelblue', edgecolor='white')
     ax.set_title(f"Original: {dist_name}")
     ax.set_ylabel(f"{dist_name}" if row == 1 else "")
@@ -89,7 +88,7 @@ fig.suptitle("Central Limit Theorem: Sample Means → Normal Distribution\n" +
              "regardless of the original distribution!", fontsize=13, fontweight='bold', y=1.02)
 
 plt.tight_layout()
-plt.savefig('clt_visualization.png', dpi=150, bbox_inches='tight', facecolor='white')
+save_figure('clt_visualization.png', dpi=150, bbox_inches='tight', facecolor='white')
 plt.close()
 
 print("Generated: clt_visualization.png")
@@ -99,16 +98,17 @@ fig, axes = plt.subplots(1, 4, figsize=(14, 3.5))
 
 # Use dice rolling as the example (discrete uniform 1-6)
 def roll_dice(size):
-    return np.random.randint(1, 7, size)
+    return rng.integers(1, 7, size)
 
 mu_dice = 3.5
 sigma_dice = np.sqrt(35/12)  # Variance of uniform discrete 1-6
 
 # Original distribution
 ax = axes[0]
-dice_samples = roll_dice(10000)
+n_rolls = scaled(10000, minimum=200)
+dice_samples = roll_dice(n_rolls)
 counts = [np.sum(dice_samples == i) for i in range(1, 7)]
-ax.bar(range(1, 7), np.array(counts)/10000, color='steelblue', edgecolor='white', alpha=0.8)
+ax.bar(range(1, 7), np.array(counts)/n_rolls, color='steelblue', edgecolor='white', alpha=0.8)
 ax.set_title("Original: Single Die Roll\n(Discrete Uniform 1-6)")
 ax.set_xlabel("Die Face")
 ax.set_ylabel("Probability")
@@ -136,7 +136,7 @@ for idx, n in enumerate([2, 10, 30]):
 fig.suptitle("Central Limit Theorem with Dice: Sample Means Become Normal!", 
              fontsize=12, fontweight='bold', y=1.05)
 plt.tight_layout()
-plt.savefig('clt_dice_example.png', dpi=150, bbox_inches='tight', facecolor='white')
+save_figure('clt_dice_example.png', dpi=150, bbox_inches='tight', facecolor='white')
 plt.close()
 
 print("Generated: clt_dice_example.png")
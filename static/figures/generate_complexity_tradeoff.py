@@ -3,10 +3,10 @@
 
 import matplotlib.pyplot as plt
 import numpy as np
+from figure_io import save_figure
+from figure_style import use_style
 
-plt.rcParams['figure.dpi'] = 150
-plt.rcParams['savefig.dpi'] = 150
-plt.rcParams['font.size'] = 12
+use_style('hidpi', rc={'font.size': 12})
 
 # Create figure
 fig, ax = plt.subplots(figsize=(10, 6))
@@ -73,7 +73,7 @@ ax.annotate('', xy=(2.5, 0.02), xytext=(1, 0.02),
 ax.text(1.7, 0.04, 'More complex', fontsize=9, color='gray')
 
 plt.tight_layout()
-plt.savefig('complexity_tradeoff.png', bbox_inches='tight', facecolor='white')
+save_figure('complexity_tradeoff.png', bbox_inches='tight', facecolor='white')
 plt.close()
 
 print("Generated complexity_tradeoff.png")
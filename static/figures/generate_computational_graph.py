@@ -5,8 +5,13 @@ Shows forward pass (blue) and backward pass (red) with gradient flow.
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
 import numpy as np
+from figure_diagram import Diagram
+from figure_io import save_figure
+from figure_style import use_style
+
+# Set style
+use_style()
 
 # Set up the figure
 fig, ax = plt.subplots(1, 1, figsize=(14, 6))
@@ -38,24 +43,23 @@ nodes = {
     'y_hat': (12.5, 1),
 }
 
-# Draw input/output nodes (circles)
+diagram = Diagram({
+    'variable': dict(shape='circle', radius=0.35, facecolor=node_color, edgecolor='black'),
+    'operation': dict(shape='box', height=0.6, boxstyle='round,pad=0.05,rounding_size=0.15',
+                      facecolor=operation_color, edgecolor='black'),
+    'forward': dict(color=forward_color, linewidth=2),
+    'backward': dict(color=backward_color, linewidth=2),
+})
+
+# Input/output nodes (circles)
 circle_nodes = ['x', 'W1', 'b1', 'h', 'W2', 'b2', 'y_hat']
 for name in circle_nodes:
-    x, y = nodes[name]
-    circle = plt.Circle((x, y), 0.35, color=node_color, ec='black', linewidth=1.5, zorder=3)
-    ax.add_patch(circle)
-    ax.text(x, y, name.replace('_', '\n'), ha='center', va='center', fontsize=10, fontweight='bold', zorder=4)
+    diagram.node(name, nodes[name], name.replace('_', '\n'), style='variable')
 
-# Draw operation nodes (rounded rectangles)
+# Operation nodes (rounded rectangles)
 op_nodes = {'mul1': '×', 'add1': '+', 'relu': 'ReLU', 'mul2': '×', 'add2': '+', 'sigmoid': 'σ'}
 for name, label in op_nodes.items():
-    x, y = nodes[name]
-    width = 0.8 if len(label) > 1 else 0.5
-    rect = FancyBboxPatch((x - width/2, y - 0.3), width, 0.6, 
-                          boxstyle="round,pad=0.05,rounding_size=0.15",
-                          facecolor=operation_color, edgecolor='black', linewidth=1.5, zorder=3)
-    ax.add_patch(rect)
-    ax.text(x, y, label, ha='center', va='center', fontsize=10, fontweight='bold', zorder=4)
+    diagram.node(name, nodes[name], label, style='operation', width=0.8 if len(label) > 1 else 0.5)
 
 # Forward pass arrows (blue)
 forward_edges = [
@@ -72,25 +76,8 @@ forward_edges = [
     ('add2', 'sigmoid'),
     ('sigmoid', 'y_hat'),
 ]
-
-def get_edge_points(start, end, offset=0.4):
-    x1, y1 = nodes[start]
-    x2, y2 = nodes[end]
-    # Direction vector
-    dx = x2 - x1
-    dy = y2 - y1
-    length = np.sqrt(dx**2 + dy**2)
-    # Normalize
-    dx /= length
-    dy /= length
-    # Offset from centers
-    return (x1 + dx * offset, y1 + dy * offset, x2 - dx * offset, y2 - dy * offset)
-
 for start, end in forward_edges:
-    x1, y1, x2, y2 = get_edge_points(start, end)
-    ax.annotate('', xy=(x2, y2), xytext=(x1, y1),
-                arrowprops=dict(arrowstyle='->', color=forward_color, lw=2),
-                zorder=2)
+    diagram.edge(start, end, style='forward', gap=0.05)
 
 # Title for forward pass
 ax.text(6.5, 3.5, 'Forward Pass', ha='center', va='center', fontsize=14, 
@@ -113,12 +100,8 @@ backward_labels = [
 ]
 
 # Draw backward arrows
-for i in range(len(backward_labels) - 1):
-    x1 = backward_labels[i][0]
-    x2 = backward_labels[i + 1][0]
-    ax.annotate('', xy=(x2 + 0.3, backward_y), xytext=(x1 - 0.3, backward_y),
-                arrowprops=dict(arrowstyle='->', color=backward_color, lw=2),
-                zorder=2)
+for (x1, _), (x2, _) in zip(backward_labels, backward_labels[1:]):
+    diagram.edge((x1 - 0.3, backward_y), (x2 + 0.3, backward_y), style='backward')
 
 # Add gradient labels
 for x, label in backward_labels:
@@ -133,7 +116,9 @@ ax.text(6.5, -1.7, 'Backward Pass (Gradient Flow)', ha='center', va='center',
 # Add vertical dashed lines connecting forward and backward
 connect_points = [12.5, 11, 6.5, 5, 0]
 for x in connect_points:
-    ax.plot([x, x], [0.6, backward_y + 0.3], 'k--', alpha=0.3, lw=1)
+    diagram.edge((x, 0.6), (x, backward_y + 0.3), color='black', linestyle='--', alpha=0.3, linewidth=1, head=None)
+
+diagram.draw(ax)
 
 # Add legend
 legend_elements = [
@@ -145,7 +130,7 @@ legend_elements = [
 ax.legend(handles=legend_elements, loc='upper right', fontsize=9)
 
 plt.tight_layout()
-plt.savefig('computational_graph.png', dpi=150, bbox_inches='tight', 
+save_figure('computational_graph.png', dpi=150, bbox_inches='tight', 
             facecolor='white', edgecolor='none')
 plt.close()
 
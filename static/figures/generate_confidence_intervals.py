@@ -6,15 +6,15 @@ Shows repeated CI simulation, percentiles on distribution, and CI width factors
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy import stats
+from figure_io import save_figure
+from figure_seeds import figure_rng
+from figure_style import use_style
 
 # Set random seed for reproducibility
-np.random.seed(42)
+rng = figure_rng('confidence_intervals')
 
 # Set style
-plt.style.use('seaborn-v0_8-whitegrid')
-plt.rcParams['font.size'] = 10
-plt.rcParams['axes.labelsize'] = 11
-plt.rcParams['axes.titlesize'] = 12
+use_style('whitegrid', rc={'axes.labelsize': 11, 'axes.titlesize': 12})
 
 fig, axes = plt.subplots(1, 3, figsize=(15, 5))
 
@@ -34,7 +34,7 @@ z_star = stats.norm.ppf(1 - (1 - confidence_level) / 2)
 misses = 0
 for i in range(n_experiments):
     # Draw a sample
-    sample = np.random.normal(true_mean, true_std, n_samples)
+    sample = rng.normal(true_mean, true_std, n_samples)
     sample_mean = np.mean(sample)
     sample_std = np.std(sample, ddof=1)
     
@@ -174,7 +174,7 @@ ax2.set_xticklabels(['1x', '2x', '3.2x', '6.3x'])
 ax2.set_xlabel('Relative precision improvement', fontsize=9)
 
 plt.tight_layout()
-plt.savefig('ml-notes/figures/confidence_intervals_percentiles.png', dpi=150, bbox_inches='tight',
+save_figure('confidence_intervals_percentiles.png', dpi=150, bbox_inches='tight',
             facecolor='white', edgecolor='none')
 plt.close()
 
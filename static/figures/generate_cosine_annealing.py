@@ -3,10 +3,10 @@
 
 import matplotlib.pyplot as plt
 import numpy as np
+from figure_io import save_figure
+from figure_style import use_style
 
-plt.rcParams['figure.dpi'] = 150
-plt.rcParams['savefig.dpi'] = 150
-plt.rcParams['font.size'] = 12
+use_style('hidpi', rc={'font.size': 12})
 
 fig, ax = plt.subplots(figsize=(8, 5))
 
@@ -52,7 +52,7 @@ ax.text(total_steps * 0.55, max_lr * 0.7,
         bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.9))
 
 plt.tight_layout()
-plt.savefig('cosine_annealing_schedule.png', bbox_inches='tight', facecolor='white')
+save_figure('cosine_annealing_schedule.png', bbox_inches='tight', facecolor='white')
 plt.close()
 
 print("Generated cosine_annealing_schedule.png")
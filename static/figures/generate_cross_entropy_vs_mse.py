@@ -3,11 +3,11 @@
 
 import matplotlib.pyplot as plt
 import numpy as np
+from figure_io import save_figure
+from figure_style import use_style
 
 # Set style
-plt.rcParams['figure.dpi'] = 150
-plt.rcParams['savefig.dpi'] = 150
-plt.rcParams['font.size'] = 11
+use_style('hidpi', rc={'font.size': 11})
 
 COLORS = {
     'primary': '#2563eb',      # Blue
@@ -104,7 +104,7 @@ ax.annotate('5x more penalty!',
 
 plt.suptitle('Why Use Cross-Entropy for Classification?', fontsize=15, fontweight='bold', y=1.02)
 plt.tight_layout()
-plt.savefig('cross_entropy_vs_mse.png', bbox_inches='tight', facecolor='white')
+save_figure('cross_entropy_vs_mse.png', bbox_inches='tight', facecolor='white')
 plt.close()
 
 print("Generated cross_entropy_vs_mse.png")
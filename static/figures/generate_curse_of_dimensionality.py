@@ -7,13 +7,13 @@ Generate Curse of Dimensionality figures:
 
 import numpy as np
 import matplotlib.pyplot as plt
+from figure_io import save_figure
+from figure_quality import scaled
+from figure_seeds import figure_rng
+from figure_style import use_style
 
 # Set style
-plt.rcParams['figure.facecolor'] = 'white'
-plt.rcParams['axes.facecolor'] = 'white'
-plt.rcParams['axes.grid'] = True
-plt.rcParams['grid.alpha'] = 0.3
-plt.rcParams['font.size'] = 11
+use_style(rc={'axes.grid': True, 'grid.alpha': 0.3, 'font.size': 11})
 
 fig, axes = plt.subplots(1, 2, figsize=(14, 5))
 
@@ -34,10 +34,10 @@ def hughes_curve(d, n, d_optimal, max_acc=0.95, min_acc=0.5):
     curse_factor = np.maximum(0, (d - d_optimal) / d_optimal) ** 1.5
     acc = acc - curse_factor * (max_acc - min_acc) * 0.5
     # Add noise for realism
-    acc = np.clip(acc + np.random.randn(len(d)) * 0.01, min_acc, max_acc)
+    acc = np.clip(acc + rng.standard_normal(len(d)) * 0.01, min_acc, max_acc)
     return acc
 
-np.random.seed(42)
+rng = figure_rng('curse_of_dimensionality')
 # Different sample sizes
 for n, color, d_opt in [(50, '#e74c3c', 8), (200, '#f39c12', 25), (1000, '#3498db', 50), (10000, '#2ecc71', 80)]:
     acc = hughes_curve(dimensions, n, d_opt)
@@ -72,12 +72,12 @@ ax2 = axes[1]
 
 # Simulate distance ratio: max_dist / min_dist as dimension increases
 dimensions_dist = np.array([1, 2, 5, 10, 20, 50, 100, 200, 500, 1000])
-n_points = 100
+n_points = scaled(100, minimum=20)
 
 distance_ratios = []
 for d in dimensions_dist:
     # Generate random points in d-dimensional unit hypercube
-    points = np.random.rand(n_points, d)
+    points = rng.random((n_points, d))
     # Compute all pairwise distances
     distances = []
     for i in range(n_points):
@@ -105,7 +105,7 @@ ax2.annotate('In high D:\n"nearest" = "farthest"\n→ k-NN fails', xy=(500, 0.3)
              bbox=dict(boxstyle='round', facecolor='#f8e8f8', alpha=0.9))
 
 plt.tight_layout()
-plt.savefig('curse_of_dimensionality.png', dpi=150, bbox_inches='tight',
+save_figure('curse_of_dimensionality.png', dpi=150, bbox_inches='tight',
             facecolor='white', edgecolor='none')
 plt.close()
 
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Generate distributed training strategies figure (data, tensor and pipeline parallelism)."""
+
+import matplotlib.pyplot as plt
+from figure_diagram import Diagram
+from figure_io import save_figure
+from figure_style import use_style
+
+use_style('hidpi')
+
+fig, axes = plt.subplots(1, 3, figsize=(16, 7))
+
+gpu_colors = ['#f87171', '#4ade80', '#60a5fa', '#fb923c']
+batch_color = '#f97316'
+allreduce_color = '#8b5cf6'
+
+STYLES = {
+    'gpu': dict(shape='box', width=1.5, height=3.0, boxstyle='round,pad=0.05,rounding_size=0.15',
+                facecolor='#60a5fa', edgecolor='#1f2937', linewidth=2),
+    'model': dict(shape='box', width=1.1, height=1.9, boxstyle='square,pad=0', facecolor='#34b78a',
+                  edgecolor='#1f2937', linewidth=1, fontsize=10, zorder=4),
+    'shard': dict(shape='box', width=0.9, height=1.1, boxstyle='square,pad=0', edgecolor='#374151',
+                  linewidth=1.5, fontsize=11),
+    'stage': dict(shape='box', width=4.2, height=0.9, boxstyle='round,pad=0.05,rounding_size=0.1',
+                  edgecolor='#374151', linewidth=1.5, fontsize=11, color='white'),
+    'edge': dict(color='#374151', linewidth=1.5),
+}
+
+
+def setup(ax, title, subtitle):
+    ax.set_xlim(0, 6)
+    ax.set_ylim(-1, 8)
+    ax.set_aspect('equal')
+    ax.axis('off')
+    ax.text(3, 7.6, title, ha='center', fontsize=13, fontweight='bold')
+    ax.text(3, 7.05, subtitle, ha='center', fontsize=10, color='#6b7280')
+
+
+def summary(ax, text):
+    ax.text(3, -0.6, text, ha='center', va='center', fontsize=10,
+            bbox=dict(boxstyle='round', facecolor='lightyellow', edgecolor='#374151'))
+
+
+# === Data parallelism: replicate the model, split the batch, all-reduce gradients ===
+ax = axes[0]
+setup(ax, 'Data Parallelism (DDP)', 'Replicate model, split batch')
+ddp = Diagram(STYLES)
+allreduce = ddp.node('allreduce', (3, 1.0), shape='point')
+for i, x in enumerate([1.2, 3.0, 4.8]):
+    gpu = ddp.node(f'gpu{i}', (x, 3.9), style='gpu')
+    ddp.node(f'model{i}', (x, 3.9), 'Full\nModel', style='model')
+    ax.text(x, 5.65, f'GPU {i}', ha='center', fontsize=10, fontweight='bold')
+    ax.text(x, 6.35, f'Batch$_{i}$', ha='center', fontsize=10, fontweight='bold', color=batch_color)
+    ddp.edge((x, 6.3), gpu, color=batch_color)
+    ddp.edge(gpu, allreduce, color=allreduce_color, gap=0.05)
+ddp.draw(ax)
+ax.text(3, 0.6, 'AllReduce Gradients', ha='center', va='top', fontsize=11, fontweight='bold',
+        color=allreduce_color)
+summary(ax, '• Each GPU: full model copy\n• Split: data batch\n• Sync: gradients')
+
+# === Tensor parallelism: shard each weight matrix across GPUs ===
+ax = axes[1]
+setup(ax, 'Tensor Parallelism (TP)', 'Split weight matrices across GPUs')
+tp = Diagram(STYLES)
+ax.text(3, 5.9, 'Weight Matrix W', ha='center', fontsize=11, fontweight='bold')
+for i, (x, color) in enumerate(zip([1.05, 2.35, 3.65, 4.95], gpu_colors)):
+    shard = tp.node(f'w{i}', (x, 4.9), f'$W_{i}$', style='shard', facecolor=color)
+    gpu = tp.node(f'gpu{i}', (x, 2.2), style='gpu', width=1.1, height=1.6, facecolor=color)
+    ax.text(x, 3.25, f'GPU {i}', ha='center', fontsize=10, fontweight='bold')
+    tp.edge(shard, gpu, color=color, linewidth=2, gap=0.45)
+tp.draw(ax)
+summary(ax, '• Each GPU: weight shard\n• Split: matrices (columns/rows)\n• Used: huge layers (LLMs)')
+
+# === Pipeline parallelism: consecutive layers on consecutive GPUs ===
+ax = axes[2]
+setup(ax, 'Pipeline Parallelism (PP)', 'Split model layers into stages')
+pp = Diagram(STYLES)
+stages = ['Layers 1-8', 'Layers 9-16', 'Layers 17-24', 'Layers 25-32']
+previous = None
+for i, (label, color) in enumerate(zip(stages, gpu_colors)):
+    stage = pp.node(f'stage{i}', (3.3, 6.1 - 1.3 * i), f'{label} (GPU {i})', style='stage', facecolor=color)
+    if previous:
+        pp.edge(previous, stage, linewidth=2)
+    previous = stage
+pp.draw(ax)
+ax.annotate('', xy=(0.7, 2.3), xytext=(0.7, 6.2), arrowprops=dict(arrowstyle='->', color='#374151', lw=2))
+ax.text(0.45, 4.25, 'Data Flow', rotation=90, ha='center', va='center', fontsize=10, fontweight='bold')
+summary(ax, '• Each GPU: layer subset\n• Split: sequential stages\n• Less communication')
+
+fig.suptitle('Distributed Training Strategies', fontsize=16, fontweight='bold')
+
+plt.tight_layout()
+save_figure('distributed_training.png', bbox_inches='tight', facecolor='white')
+plt.close()
+
+print("Generated distributed_training.png")
@@ -7,6 +7,12 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib.patches import Circle, FancyBboxPatch, FancyArrowPatch
 import numpy as np
+from figure_grids import dense_edges
+from figure_io import save_figure
+from figure_style import use_style
+
+# Set style
+use_style()
 
 # Set up the figure
 fig, axes = plt.subplots(1, 4, figsize=(16, 5))
@@ -27,20 +33,14 @@ def draw_network(ax, title, dropped_neurons=None, is_inference=False):
     
     dropped = dropped_neurons or []
     
-    # Draw connections first (so they're behind neurons)
+    # Draw connections first (so they're behind neurons); one collection per
+    # layer pair, without the edges of dropped neurons
     for l, layer in enumerate(layers[:-1]):
         next_layer = layers[l + 1]
-        for i, (x1, y1) in enumerate(layer):
-            for j, (x2, y2) in enumerate(next_layer):
-                # Check if either neuron is dropped
-                neuron1_dropped = (l, i) in dropped
-                neuron2_dropped = (l + 1, j) in dropped
-                
-                if neuron1_dropped or neuron2_dropped:
-                    continue  # Don't draw connection
-                
-                ax.plot([x1 + 0.2, x2 - 0.2], [y1, y2], 
-                       color='#90A4AE', linewidth=1.5, alpha=0.6)
+        kept_from = np.array([(l, i) not in dropped for i in range(len(layer))])
+        kept_to = np.array([(l + 1, j) not in dropped for j in range(len(next_layer))])
+        dense_edges(ax, layer, next_layer, colors='#90A4AE', alpha=0.6, gap=0.2,
+                    mask=np.outer(kept_from, kept_to), linewidth=1.5, capstyle='projecting')
     
     # Draw neurons
     for l, layer in enumerate(layers):
@@ -109,7 +109,7 @@ fig.legend(handles=legend_elements, loc='upper right', fontsize=9,
 
 plt.suptitle('Dropout as Implicit Ensemble', fontsize=14, fontweight='bold', y=0.98)
 plt.tight_layout(rect=[0, 0.15, 1, 0.92])
-plt.savefig('dropout_ensemble.png', dpi=150, bbox_inches='tight',
+save_figure('dropout_ensemble.png', dpi=150, bbox_inches='tight',
             facecolor='white', edgecolor='none')
 plt.close()
 
@@ -4,10 +4,11 @@ Eigenvectors only get scaled (not rotated) when multiplied by the matrix.
 """
 import numpy as np
 import matplotlib.pyplot as plt
+from figure_io import save_figure
+from figure_style import use_style
 
 # Set style
-plt.style.use('seaborn-v0_8-whitegrid')
-plt.rcParams['font.size'] = 12
+use_style('whitegrid', rc={'font.size': 12})
 
 # Matrix from the worked example
 A = np.array([[4, 2], [1, 3]])
@@ -97,7 +98,7 @@ ax2.text(0.02, 0.98, textstr, transform=ax2.transAxes, fontsize=12,
         verticalalignment='top', bbox=props)
 
 plt.tight_layout()
-plt.savefig('eigenvector_transformation.png', dpi=150, bbox_inches='tight', facecolor='white')
+save_figure('eigenvector_transformation.png', dpi=150, bbox_inches='tight', facecolor='white')
 plt.close()
 
 print("\nGenerated eigenvector_transformation.png")
@@ -26,15 +26,30 @@ FIGURES GENERATED:
 7. attention_heatmap.png     - Self-attention weights visualization
 8. lr_schedules.png          - Learning rate schedule comparison (cosine, step, warmup)
 9. gradient_flow.png         - Vanishing/exploding gradient visualization
-10. cross_entropy_vs_mse.png - Why cross-entropy is better for classification
+10. overfitting_spectrum.png - Underfitting to overfitting as model capacity grows
+11. learning_curves_diagnostic.png - Reading train/validation curves
+
+Every other figure has its own generate_<name>.py; each output file has exactly
+one producer (figure_registry.discover() refuses to run otherwise).
 
 USAGE:
 ------
-    cd ml-prep/figures
-    python generate_figures.py
-
-    Or from the ml-prep directory:
-    python figures/generate_figures.py
+    cd static/figures
+    python generate_figures.py                    # every registered figure (all generate_*.py)
+    python generate_figures.py sigmoid_figure mcmc
+    python generate_figures.py --trace trace.json # per-phase timings + artist counts as a Chrome trace
+    python generate_figures.py --profile clt      # cProfile/pyinstrument run, .pstats + collapsed stacks
+    python generate_figures.py --memory           # tracemalloc peak, NumPy usage, allocation sites
+    python generate_figures.py -j 0               # one worker per CPU, capped by recorded peak RSS
+    python generate_figures.py --draft log_function  # sub-second preview into .cache/figures/draft/
+    python generate_figures.py --unreferenced     # figures ml_ai_notes.html never shows
+    python generate_figures.py --book figures.pdf # the notes' figures as one vector PDF, in page order
+    python generate_figures.py --svg              # SVG copies (dense layers rasterized) + size report
+    python generate_figures.py --animate mcmc     # MCMC/optimizer figures also as blitted WebP (or mp4)
+    python figure_style.py                        # CI warm-up: font list + styles into .cache/figures/
+
+    The trace opens in chrome://tracing or https://ui.perfetto.dev; each figure's
+    span lists compute/artists/layout/draw/encode milliseconds and artist counts.
 
 REQUIREMENTS:
 -------------
@@ -43,7 +58,7 @@ REQUIREMENTS:
 STYLE:
 ------
 All figures use a consistent style defined by:
-- seaborn-v0_8-whitegrid theme
+- seaborn-v0_8-whitegrid theme (shared project styles live in figure_style.py)
 - 150 DPI resolution
 - Consistent color palette (COLORS dict)
 - White background for markdown embedding
@@ -57,20 +72,26 @@ TO MODIFY:
 Author: Generated for ML Interview Prep
 """
 
+import argparse
+import os
+from functools import partial
+from pathlib import Path
+
+from figure_style import use_build_cache
+
+use_build_cache()  # before matplotlib is imported, so its font list lives in the build cache
+
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
-from pathlib import Path
+
+from figure_io import save_figure
+from figure_seeds import figure_rng
+from figure_style import use_style
 
 # Set style for all figures
-plt.style.use('seaborn-v0_8-whitegrid')
-plt.rcParams['figure.dpi'] = 150
-plt.rcParams['savefig.dpi'] = 150
-plt.rcParams['font.size'] = 11
-plt.rcParams['axes.titlesize'] = 14
-plt.rcParams['axes.labelsize'] = 12
-plt.rcParams['legend.fontsize'] = 10
-plt.rcParams['figure.facecolor'] = 'white'
+use_style('whitegrid', 'hidpi', rc={'font.size': 11, 'axes.titlesize': 14, 'axes.labelsize': 12,
+                                   'legend.fontsize': 10})
 
 # Color palette
 COLORS = {
@@ -182,7 +203,7 @@ def generate_sigmoid_figure():
             verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
     
     plt.tight_layout()
-    plt.savefig('sigmoid_function.png', bbox_inches='tight', facecolor='white')
+    save_figure('sigmoid_function.png', bbox_inches='tight', facecolor='white')
     plt.close()
     print("✓ Generated sigmoid_function.png")
 
@@ -218,7 +239,7 @@ def generate_activation_functions():
     
     plt.suptitle('Activation Functions Comparison', fontsize=16, fontweight='bold', y=1.02)
     plt.tight_layout()
-    plt.savefig('activation_functions.png', bbox_inches='tight', facecolor='white')
+    save_figure('activation_functions.png', bbox_inches='tight', facecolor='white')
     plt.close()
     print("✓ Generated activation_functions.png")
 
@@ -276,21 +297,22 @@ def generate_loss_landscape():
     ax2.set_ylim(-3, 3)
     
     plt.tight_layout()
-    plt.savefig('loss_landscape.png', bbox_inches='tight', facecolor='white')
+    save_figure('loss_landscape.png', bbox_inches='tight', facecolor='white')
     plt.close()
     print("✓ Generated loss_landscape.png")
 
 
 def generate_learning_curves():
     """Generate learning curves showing overfitting vs good fit."""
+    rng = figure_rng('learning_curves')
     fig, axes = plt.subplots(1, 3, figsize=(15, 5))
     
     epochs = np.arange(1, 101)
     
     # Underfitting
     ax = axes[0]
-    train_loss = 2 - 0.5 * np.log(epochs) + np.random.randn(100) * 0.05
-    val_loss = 2.2 - 0.4 * np.log(epochs) + np.random.randn(100) * 0.05
+    train_loss = 2 - 0.5 * np.log(epochs) + rng.standard_normal(100) * 0.05
+    val_loss = 2.2 - 0.4 * np.log(epochs) + rng.standard_normal(100) * 0.05
     ax.plot(epochs, train_loss, color=COLORS['primary'], linewidth=2, label='Training Loss')
     ax.plot(epochs, val_loss, color=COLORS['secondary'], linewidth=2, label='Validation Loss')
     ax.fill_between(epochs, train_loss, val_loss, alpha=0.1, color='gray')
@@ -305,8 +327,8 @@ def generate_learning_curves():
     
     # Good fit
     ax = axes[1]
-    train_loss = 1.5 * np.exp(-epochs/20) + 0.1 + np.random.randn(100) * 0.02
-    val_loss = 1.6 * np.exp(-epochs/25) + 0.15 + np.random.randn(100) * 0.03
+    train_loss = 1.5 * np.exp(-epochs/20) + 0.1 + rng.standard_normal(100) * 0.02
+    val_loss = 1.6 * np.exp(-epochs/25) + 0.15 + rng.standard_normal(100) * 0.03
     ax.plot(epochs, train_loss, color=COLORS['primary'], linewidth=2, label='Training Loss')
     ax.plot(epochs, val_loss, color=COLORS['secondary'], linewidth=2, label='Validation Loss')
     ax.fill_between(epochs, train_loss, val_loss, alpha=0.1, color='gray')
@@ -321,10 +343,10 @@ def generate_learning_curves():
     
     # Overfitting
     ax = axes[2]
-    train_loss = 1.5 * np.exp(-epochs/15) + 0.02 + np.random.randn(100) * 0.01
+    train_loss = 1.5 * np.exp(-epochs/15) + 0.02 + rng.standard_normal(100) * 0.01
     val_loss = np.where(epochs < 30,
                         1.5 * np.exp(-epochs/20) + 0.1,
-                        0.3 + 0.01 * (epochs - 30) + np.random.randn(100) * 0.02)
+                        0.3 + 0.01 * (epochs - 30) + rng.standard_normal(100) * 0.02)
     ax.plot(epochs, train_loss, color=COLORS['primary'], linewidth=2, label='Training Loss')
     ax.plot(epochs, val_loss, color=COLORS['secondary'], linewidth=2, label='Validation Loss')
     ax.fill_between(epochs, train_loss, val_loss, alpha=0.1, color='red')
@@ -340,7 +362,7 @@ def generate_learning_curves():
     
     plt.suptitle('Learning Curves: Diagnosing Model Performance', fontsize=14, fontweight='bold', y=1.02)
     plt.tight_layout()
-    plt.savefig('learning_curves.png', bbox_inches='tight', facecolor='white')
+    save_figure('learning_curves.png', bbox_inches='tight', facecolor='white')
     plt.close()
     print("✓ Generated learning_curves.png")
 
@@ -350,11 +372,11 @@ def generate_bias_variance():
     fig, axes = plt.subplots(1, 3, figsize=(15, 5))
     
     # True function
-    np.random.seed(42)
+    rng = figure_rng('bias_variance')
     x = np.linspace(0, 1, 100)
-    x_data = np.random.uniform(0, 1, 20)
+    x_data = rng.uniform(0, 1, 20)
     y_true = np.sin(2 * np.pi * x)
-    y_data = np.sin(2 * np.pi * x_data) + np.random.randn(20) * 0.3
+    y_data = np.sin(2 * np.pi * x_data) + rng.standard_normal(20) * 0.3
     
     # Underfitting (degree 1)
     ax = axes[0]
@@ -399,7 +421,7 @@ def generate_bias_variance():
     plt.suptitle('Bias-Variance Tradeoff: Model Complexity vs Generalization', 
                  fontsize=14, fontweight='bold', y=1.02)
     plt.tight_layout()
-    plt.savefig('bias_variance.png', bbox_inches='tight', facecolor='white')
+    save_figure('bias_variance.png', bbox_inches='tight', facecolor='white')
     plt.close()
     print("✓ Generated bias_variance.png")
 
@@ -440,7 +462,7 @@ def generate_softmax_temperature():
     plt.suptitle('Effect of Temperature on Softmax Distribution\n(Same logits: [2.0, 1.0, 0.5, 0.1, -0.5])',
                  fontsize=14, fontweight='bold', y=1.05)
     plt.tight_layout()
-    plt.savefig('softmax_temperature.png', bbox_inches='tight', facecolor='white')
+    save_figure('softmax_temperature.png', bbox_inches='tight', facecolor='white')
     plt.close()
     print("✓ Generated softmax_temperature.png")
 
@@ -455,8 +477,8 @@ def generate_attention_heatmap():
     n = len(tokens)
     
     # Create realistic attention pattern
-    np.random.seed(42)
-    attention = np.random.rand(n, n) * 0.05  # Lower base noise
+    rng = figure_rng('attention_heatmap')
+    attention = rng.random((n, n)) * 0.05  # Lower base noise
     
     # Semantic attention patterns (what we want to highlight)
     # For "sat" (index 2): should attend to "cat" (subject) and "mat" (location)
@@ -502,7 +524,7 @@ def generate_attention_heatmap():
             ax.text(j, i, text, ha='center', va='center', color=color, fontsize=9)
     
     plt.tight_layout()
-    plt.savefig('attention_heatmap.png', bbox_inches='tight', facecolor='white')
+    save_figure('attention_heatmap.png', bbox_inches='tight', facecolor='white')
     plt.close()
     print("✓ Generated attention_heatmap.png")
 
@@ -558,13 +580,14 @@ def generate_lr_schedules():
                 fontsize=9, bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
     
     plt.tight_layout()
-    plt.savefig('lr_schedules.png', bbox_inches='tight', facecolor='white')
+    save_figure('lr_schedules.png', bbox_inches='tight', facecolor='white')
     plt.close()
     print("✓ Generated lr_schedules.png")
 
 
 def generate_gradient_flow():
     """Generate gradient flow visualization for vanishing/exploding gradients."""
+    rng = figure_rng('gradient_flow')
     fig, axes = plt.subplots(1, 3, figsize=(15, 5))
     
     layers = np.arange(1, 11)
@@ -583,7 +606,7 @@ def generate_gradient_flow():
     
     # Stable gradients (with residuals)
     ax = axes[1]
-    grad_stable = np.ones(10) * (0.9 + 0.1 * np.random.randn(10) * 0.1)
+    grad_stable = np.ones(10) * (0.9 + 0.1 * rng.standard_normal(10) * 0.1)
     ax.bar(layers, grad_stable, color=COLORS['tertiary'], alpha=0.8, edgecolor='black')
     ax.set_xlabel('Layer (from output)')
     ax.set_ylabel('Relative Gradient Magnitude')
@@ -607,7 +630,7 @@ def generate_gradient_flow():
     
     plt.suptitle('Gradient Flow Through Deep Networks', fontsize=14, fontweight='bold', y=1.02)
     plt.tight_layout()
-    plt.savefig('gradient_flow.png', bbox_inches='tight', facecolor='white')
+    save_figure('gradient_flow.png', bbox_inches='tight', facecolor='white')
     plt.close()
     print("✓ Generated gradient_flow.png")
 
@@ -617,11 +640,11 @@ def generate_overfitting_spectrum():
     fig, axes = plt.subplots(1, 3, figsize=(15, 5))
     
     # True function
-    np.random.seed(42)
+    rng = figure_rng('overfitting_spectrum')
     x = np.linspace(0, 1, 200)
     x_data = np.array([0.05, 0.15, 0.25, 0.35, 0.45, 0.55, 0.65, 0.75, 0.85, 0.95])
     y_true = np.sin(2.5 * np.pi * x)
-    y_data = np.sin(2.5 * np.pi * x_data) + np.random.randn(10) * 0.15
+    y_data = np.sin(2.5 * np.pi * x_data) + rng.standard_normal(10) * 0.15
     
     # Panel 1: Underfitting (straight line)
     ax = axes[0]
@@ -675,7 +698,7 @@ def generate_overfitting_spectrum():
     plt.suptitle('The Overfitting Spectrum: Model Complexity vs. Fit Quality', 
                  fontsize=16, fontweight='bold', y=1.02)
     plt.tight_layout()
-    plt.savefig('overfitting_spectrum.png', bbox_inches='tight', facecolor='white')
+    save_figure('overfitting_spectrum.png', bbox_inches='tight', facecolor='white')
     plt.close()
     print("✓ Generated overfitting_spectrum.png")
 
@@ -684,17 +707,17 @@ def generate_learning_curves_diagnostic():
     """Generate learning curves diagnostic tool - 2 panel version matching ASCII art."""
     fig, axes = plt.subplots(1, 2, figsize=(14, 5))
     
-    np.random.seed(42)
+    rng = figure_rng('learning_curves_diagnostic')
     epochs = np.arange(1, 101)
     
     # Panel 1: Overfitting (gap = problem!)
     ax = axes[0]
-    train_loss = 1.5 * np.exp(-epochs/12) + 0.05 + np.random.randn(100) * 0.01
+    train_loss = 1.5 * np.exp(-epochs/12) + 0.05 + rng.standard_normal(100) * 0.01
     # Validation initially decreases then increases
     val_loss_base = np.where(epochs < 25,
                               1.5 * np.exp(-epochs/18) + 0.15,
                               0.35 + 0.012 * (epochs - 25))
-    val_loss = val_loss_base + np.random.randn(100) * 0.02
+    val_loss = val_loss_base + rng.standard_normal(100) * 0.02
     
     ax.plot(epochs, train_loss, color=COLORS['primary'], linewidth=2.5, label='Training loss')
     ax.plot(epochs, val_loss, color=COLORS['secondary'], linewidth=2.5, label='Validation loss')
@@ -720,8 +743,8 @@ def generate_learning_curves_diagnostic():
     
     # Panel 2: Good fit (both converge)
     ax = axes[1]
-    train_loss = 1.5 * np.exp(-epochs/18) + 0.1 + np.random.randn(100) * 0.015
-    val_loss = 1.6 * np.exp(-epochs/22) + 0.12 + np.random.randn(100) * 0.02
+    train_loss = 1.5 * np.exp(-epochs/18) + 0.1 + rng.standard_normal(100) * 0.015
+    val_loss = 1.6 * np.exp(-epochs/22) + 0.12 + rng.standard_normal(100) * 0.02
     
     ax.plot(epochs, train_loss, color=COLORS['primary'], linewidth=2.5, label='Training loss')
     ax.plot(epochs, val_loss, color=COLORS['tertiary'], linewidth=2.5, label='Validation loss')
@@ -743,91 +766,124 @@ def generate_learning_curves_diagnostic():
     
     plt.suptitle('Learning Curves: Your Diagnostic Tool', fontsize=16, fontweight='bold', y=1.02)
     plt.tight_layout()
-    plt.savefig('learning_curves_diagnostic.png', bbox_inches='tight', facecolor='white')
+    save_figure('learning_curves_diagnostic.png', bbox_inches='tight', facecolor='white')
     plt.close()
     print("✓ Generated learning_curves_diagnostic.png")
 
 
-def generate_cross_entropy_vs_mse():
-    """Generate comparison of cross-entropy vs MSE loss for classification."""
-    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
-    
-    # For true label y=1
-    p = np.linspace(0.001, 0.999, 500)  # Predicted probability
-    
-    # MSE loss: (1 - p)^2
-    mse = (1 - p) ** 2
-    
-    # Cross-entropy loss: -log(p)
-    ce = -np.log(p)
-    
-    ax = axes[0]
-    ax.plot(p, mse, color=COLORS['secondary'], linewidth=2.5, label='MSE: (y-ŷ)²')
-    ax.plot(p, ce, color=COLORS['primary'], linewidth=2.5, label='CE: -log(ŷ)')
-    ax.set_xlabel('Predicted Probability ŷ (true label y=1)', fontsize=12)
-    ax.set_ylabel('Loss', fontsize=12)
-    ax.set_title('Loss Functions Comparison\n(True Label = 1)', fontsize=12, fontweight='bold')
-    ax.legend(fontsize=10)
-    ax.set_xlim(0, 1)
-    ax.set_ylim(0, 5)
-    ax.axvline(x=0.5, color='gray', linestyle=':', alpha=0.5)
-    ax.text(0.52, 4.5, 'Decision boundary', fontsize=9, color='gray')
-    
-    # Annotate key difference
-    ax.annotate('CE punishes confident\nwrong predictions MORE',
-                xy=(0.1, -np.log(0.1)), xytext=(0.3, 3.5),
-                arrowprops=dict(arrowstyle='->', color='gray'),
-                fontsize=9, bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
-    
-    # Gradient comparison
-    ax = axes[1]
-    
-    # MSE gradient: -2(1-p) 
-    mse_grad = np.abs(-2 * (1 - p))
-    
-    # CE gradient: -1/p (before sigmoid) -> simplified for viz
-    ce_grad = np.abs(1 / p)
-    ce_grad = np.clip(ce_grad, 0, 10)  # Clip for visualization
-    
-    ax.plot(p, mse_grad, color=COLORS['secondary'], linewidth=2.5, label='|∂MSE/∂ŷ| = 2|y-ŷ|')
-    ax.plot(p, ce_grad, color=COLORS['primary'], linewidth=2.5, label='|∂CE/∂ŷ| = 1/ŷ')
-    ax.set_xlabel('Predicted Probability ŷ', fontsize=12)
-    ax.set_ylabel('|Gradient|', fontsize=12)
-    ax.set_title('Gradient Magnitude Comparison', fontsize=12, fontweight='bold')
-    ax.legend(fontsize=10)
-    ax.set_xlim(0, 1)
-    ax.set_ylim(0, 10)
-    
-    ax.text(0.5, 0.95, 'CE gradient is LARGE when\nprediction is confident & wrong',
-            transform=ax.transAxes, fontsize=9, verticalalignment='top', horizontalalignment='center',
-            bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
-    
-    plt.suptitle('Why Cross-Entropy is Better for Classification', fontsize=14, fontweight='bold', y=1.02)
-    plt.tight_layout()
-    plt.savefig('cross_entropy_vs_mse.png', bbox_inches='tight', facecolor='white')
-    plt.close()
-    print("✓ Generated cross_entropy_vs_mse.png")
-
-
-def main():
-    """Generate all figures."""
-    print("Generating figures for ML Interview Guide...\n")
-    
-    generate_sigmoid_figure()
-    generate_activation_functions()
-    generate_loss_landscape()
-    generate_learning_curves()
-    generate_bias_variance()
-    generate_softmax_temperature()
-    generate_attention_heatmap()
-    generate_lr_schedules()
-    generate_gradient_flow()
-    generate_overfitting_spectrum()
-    generate_learning_curves_diagnostic()
-    generate_cross_entropy_vs_mse()
-    
+def build_parallel(jobs, output, workers, budget_mb, trace_path):
+    """Render jobs into output with worker processes; exits non-zero if any figure failed."""
+    import tempfile
+    from figure_build import build
+    from figure_trace import merge
+
+    with tempfile.TemporaryDirectory(prefix='figtrace-') as trace_dir:
+        failed = build(jobs, output, workers, budget_mb, trace_dir if trace_path else None)
+        if trace_path:
+            merge(sorted(Path(trace_dir).glob('*.json')), trace_path)
+    if failed:
+        raise SystemExit(f"\n✗ {len(failed)} figures failed: {', '.join(failed)}")
+
+
+def main(argv=None):
+    """Generate all registered figures (or the ones named on the command line)."""
+    parser = argparse.ArgumentParser(description='Generate the figures for the ML notes.')
+    parser.add_argument('figures', nargs='*', help='figure names or keys (default: all, see figure_registry.py)')
+    parser.add_argument('--trace', metavar='PATH',
+                        help='time compute/artists/layout/draw/encode per figure and write a Chrome trace JSON')
+    parser.add_argument('--profile', metavar='NAME',
+                        help='profile one figure: write .pstats + collapsed stacks and print the hotspots')
+    parser.add_argument('--memory', action='store_true',
+                        help='report tracemalloc peak, NumPy usage and top allocation sites per figure')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='render in N worker processes, capped by memory (0: one per CPU; default: 1)')
+    parser.add_argument('--memory-budget', type=float, metavar='MB',
+                        help='memory the parallel build may use (default: 80%% of the cgroup limit or RAM)')
+    parser.add_argument('--draft', action='store_true',
+                        help='fast preview into the build cache: low DPI, no tight bbox, mathtext, fewer samples')
+    parser.add_argument('--scale', type=float,
+                        help='multiply Monte-Carlo sample counts (default: 1, or 0.1 with --draft)')
+    parser.add_argument('-o', '--output', type=Path,
+                        help='directory to write figures to (default: $FIGURES_OUTPUT or static/figures)')
+    parser.add_argument('--svg', action='store_true',
+                        help='also save every figure as a size-tuned SVG and compare SVG with PNG bytes')
+    parser.add_argument('--animate', nargs='?', const='webp', choices=['webp', 'mp4'],
+                        help='also export the figures that show a process (MCMC, SGD paths) as animations')
+    parser.add_argument('--book', metavar='PDF', type=Path,
+                        help='also collect the figures ml_ai_notes.html shows into one PDF, in page order')
+    parser.add_argument('--unreferenced', action='store_true',
+                        help='list the figures ml_ai_notes.html does not embed, then exit')
+    args = parser.parse_args(argv)
+
+    from figure_io import output_root
+    from figure_registry import NOTES_PAGE, cache_dir, in_notes_order, select, unreferenced
+    from figure_runner import run_job
+
+    # Quality settings go through the environment so worker processes inherit them
+    if args.draft:
+        os.environ['FIGURES_DRAFT'] = '1'
+    if args.scale is not None:
+        os.environ['FIGURES_SCALE'] = str(args.scale)
+    if args.svg:
+        os.environ['FIGURES_SVG'] = '1'
+    if args.animate:
+        os.environ['FIGURES_ANIMATE'] = args.animate
+    output = cache_dir('draft') if args.draft else (args.output or output_root()).resolve()
+
+    if args.profile:
+        if args.figures or args.trace:
+            parser.error('--profile takes a single figure and cannot be combined with --trace')
+        from figure_profile import profile
+        job, = select([args.profile])
+        profile(job, partial(run_job, job, output))
+        return
+
+    jobs = select(args.figures)
+    if args.unreferenced:
+        dead = unreferenced(jobs)
+        print(f"{len(dead)} of {len(jobs)} figures are not embedded in {NOTES_PAGE.name}:")
+        for job in dead:
+            print(f"  {job.key:<48} {', '.join(job.outputs)}")
+        return
+    if args.memory:
+        from figure_memory import account
+        print(f"Measuring memory of {len(jobs)} figures...\n")
+        account(jobs)
+        return
+
+    if args.book:
+        if args.jobs != 1 or args.trace:
+            parser.error('--book renders in this process and cannot be combined with -j or --trace')
+        from figure_book import figure_book
+        jobs = in_notes_order(jobs)
+        print(f"Generating {len(jobs)} figures into {args.book}, in notes order...\n")
+        with figure_book(args.book, title='ML & AI Notes: Figures') as book:
+            for job in jobs:
+                run_job(job, output)
+            pages = book.get_pagecount()
+        print(f"\n✅ {pages} pages, {args.book.stat().st_size / 1e6:.1f}MB")
+        return
+
+    print(f"Generating {len(jobs)} figures for ML Interview Guide...\n")
+    workers = args.jobs or os.cpu_count()
+    if workers > 1:
+        build_parallel(jobs, output, workers, args.memory_budget, args.trace)
+    elif args.trace:
+        from figure_trace import tracing
+        with tracing(args.trace) as trace:
+            for job in jobs:
+                with trace.figure(job.name):
+                    run_job(job, output)
+    else:
+        for job in jobs:
+            run_job(job, output)
+
+    if args.svg:
+        from figure_svg import report
+        report(jobs, output)
+
     print("\n✅ All figures generated successfully!")
-    print("Figures are saved in the current directory (ml-prep/figures/)")
+    print(f"Figures are saved in {output}")
 
 
 if __name__ == "__main__":
@@ -3,10 +3,10 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+from figure_io import save_figure
+from figure_style import use_style
 
-plt.rcParams['figure.dpi'] = 150
-plt.rcParams['savefig.dpi'] = 150
-plt.rcParams['font.size'] = 11
+use_style('hidpi', rc={'font.size': 11})
 
 # Number of layers
 layers = np.arange(1, 21)
@@ -94,7 +94,7 @@ fig.text(0.5, -0.02,
 
 plt.tight_layout()
 plt.subplots_adjust(bottom=0.18)
-plt.savefig('gradient_magnitude_layers.png', bbox_inches='tight', facecolor='white')
+save_figure('gradient_magnitude_layers.png', bbox_inches='tight', facecolor='white')
 plt.close()
 
 print("Generated gradient_magnitude_layers.png")
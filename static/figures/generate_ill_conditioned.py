@@ -3,11 +3,12 @@
 
 import matplotlib.pyplot as plt
 import numpy as np
+from figure_animation import animation_format, save_animation
+from figure_io import save_figure
+from figure_style import use_style
 
 # Set style
-plt.rcParams['figure.dpi'] = 150
-plt.rcParams['savefig.dpi'] = 150
-plt.rcParams['font.size'] = 11
+use_style('hidpi', rc={'font.size': 11})
 
 COLORS = {
     'primary': '#2563eb',      # Blue
@@ -140,7 +141,56 @@ ax.grid(True, alpha=0.3)
 plt.suptitle('The Problem: Oscillations in Ill-Conditioned Landscapes', 
              fontsize=14, fontweight='bold', y=1.02)
 plt.tight_layout()
-plt.savefig('ill_conditioned_landscape.png', bbox_inches='tight', facecolor='white')
+save_figure('ill_conditioned_landscape.png', bbox_inches='tight', facecolor='white')
 plt.close()
 
 print("Generated ill_conditioned_landscape.png")
+
+# Animated race (--animate): both optimizers from the same start, run until they reach the minimum
+if animation_format():
+    n_frames = 150
+    paths = {'SGD': [(1.2, -1.2)], 'Momentum': [(1.2, -1.2)]}
+    vx, vy = 0, 0
+    for _ in range(n_frames - 1):
+        paths['SGD'].append(sgd_step(*paths['SGD'][-1], lr))
+        *point, vx, vy = momentum_step(*paths['Momentum'][-1], vx, vy, lr_mom, beta=0.9)
+        paths['Momentum'].append(tuple(point))
+    paths = {name: np.array(path) for name, path in paths.items()}
+
+    fig, ax = plt.subplots(figsize=(7, 6.5), dpi=100)
+    ax.contour(X, Y, L, levels=15, cmap='Blues', linewidths=1.5, alpha=0.7)
+    ax.contourf(X, Y, L, levels=15, cmap='Blues', alpha=0.3)
+    ax.scatter([1.2], [-1.2], color='black', s=120, marker='*', zorder=5, label='Start', edgecolors='white')
+    ax.scatter([0], [0], color=COLORS['purple'], s=150, marker='*', zorder=5, label='Goal', edgecolors='black')
+    ax.set_xlabel('$w_1$ (steep direction)', fontsize=12)
+    ax.set_ylabel('$w_2$ (gentle direction)', fontsize=12)
+    ax.set_title('SGD vs Momentum on an Ill-Conditioned Loss (κ = 25)', fontsize=12, fontweight='bold')
+    ax.set_xlim(-1.5, 1.5)
+    ax.set_ylim(-1.5, 1.5)
+    ax.set_aspect('equal')
+    ax.grid(True, alpha=0.3)
+    lines = {'SGD': ax.plot([], [], 'o-', color=COLORS['secondary'], markersize=3, linewidth=1.5, alpha=0.8,
+                            label=f'SGD (lr = {lr})')[0],
+             'Momentum': ax.plot([], [], 's-', color=COLORS['tertiary'], markersize=3, linewidth=2, alpha=0.9,
+                                 label=f'Momentum (lr = {lr_mom}, β = 0.9)')[0]}
+    ax.legend(loc='upper right', fontsize=9)  # clear of both paths, so it can stay in the background
+    status = ax.text(0.02, 0.98, '', transform=ax.transAxes, fontsize=10, va='top', family='monospace',
+                     bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.9))
+    plt.tight_layout()
+
+    def init():
+        for line in lines.values():
+            line.set_data([], [])
+        status.set_text('')
+        return [*lines.values(), status]
+
+    def update(frame):
+        for name, line in lines.items():
+            line.set_data(paths[name][:frame + 1, 0], paths[name][:frame + 1, 1])
+        losses = {name: kappa * path[frame, 0] ** 2 + path[frame, 1] ** 2 for name, path in paths.items()}
+        status.set_text(f'step {frame:3d}\n' + '\n'.join(f'{name:<8} L = {loss:.4f}' for name, loss in losses.items()))
+        return [*lines.values(), status]
+
+    path = save_animation('ill_conditioned_landscape.webp', fig, update, n_frames, init, fps=15)
+    plt.close()
+    print(f"Generated {path.name} ({n_frames} frames)")
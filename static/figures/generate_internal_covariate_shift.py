@@ -5,17 +5,15 @@ Shows how activation distributions change during training, causing optimization
 
 import numpy as np
 import matplotlib.pyplot as plt
+from figure_io import save_figure
+from figure_style import use_style
 
 def norm_pdf(x, mean, std):
     """Normal distribution PDF using numpy (no scipy dependency)."""
     return (1 / (std * np.sqrt(2 * np.pi))) * np.exp(-0.5 * ((x - mean) / std) ** 2)
 
 # Set style
-plt.style.use('seaborn-v0_8-whitegrid')
-plt.rcParams['font.family'] = 'DejaVu Sans'
-plt.rcParams['font.size'] = 11
-plt.rcParams['axes.labelsize'] = 12
-plt.rcParams['axes.titlesize'] = 13
+use_style('whitegrid', 'labels', rc={'font.family': 'DejaVu Sans'})
 
 fig, axes = plt.subplots(1, 2, figsize=(12, 5))
 
@@ -102,7 +100,7 @@ fig.suptitle('Internal Covariate Shift: Why BatchNorm Helps',
 
 plt.tight_layout()
 plt.subplots_adjust(bottom=0.18)  # Make room for bottom text annotations
-plt.savefig('internal_covariate_shift.png', dpi=150, bbox_inches='tight', 
+save_figure('internal_covariate_shift.png', dpi=150, bbox_inches='tight', 
             facecolor='white', edgecolor='none')
 plt.close()
 
@@ -3,10 +3,10 @@
 
 import matplotlib.pyplot as plt
 import numpy as np
+from figure_io import save_figure
+from figure_style import use_style
 
-plt.rcParams['figure.dpi'] = 150
-plt.rcParams['savefig.dpi'] = 150
-plt.rcParams['font.size'] = 12
+use_style('hidpi', rc={'font.size': 12})
 
 # Gaussian PDF using numpy only
 def gaussian_pdf(x, mu, sigma):
@@ -100,7 +100,7 @@ fig.text(0.5, 0.01,
          ha='center', fontsize=10, style='italic')
 
 plt.tight_layout(rect=[0, 0.05, 1, 1])
-plt.savefig('kl_divergence.png', bbox_inches='tight', facecolor='white')
+save_figure('kl_divergence.png', bbox_inches='tight', facecolor='white')
 plt.close()
 
 print("Generated kl_divergence.png")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Generate L1 vs L2 constraint regions figure (why L1 gives sparse solutions)."""
+
+import matplotlib.pyplot as plt
+import numpy as np
+from figure_io import save_figure
+from figure_style import use_style
+
+use_style('hidpi')
+
+# Quadratic loss with its unconstrained minimum outside both unit balls.
+# Curvature along w2 is low enough (b <= a/4) that the L1 optimum is the corner (1, 0).
+w_star = np.array([1.2, 0.8])
+a, b = 1.0, 0.2
+
+
+def loss(w1, w2):
+    return a * (w1 - w_star[0])**2 + b * (w2 - w_star[1])**2
+
+
+# L2 optimum: the lowest-loss point on the unit circle
+theta = np.linspace(0, np.pi / 2, 20001)
+circle_loss = loss(np.cos(theta), np.sin(theta))
+l2_opt = np.array([np.cos(theta[circle_loss.argmin()]), np.sin(theta[circle_loss.argmin()])])
+l1_opt = np.array([1.0, 0.0])
+
+grid = np.linspace(-1.8, 1.8, 400)
+W1, W2 = np.meshgrid(grid, grid)
+levels = loss(*l1_opt) * 2.0 ** np.arange(-2, 6)
+
+fig, axes = plt.subplots(1, 2, figsize=(12, 6))
+panels = [
+    (axes[0], 'L1 Regularization (Lasso)\n' + r'$||w||_1 \leq t$', '#d62728', 'L1 constraint region',
+     l1_opt, 'Optimal (sparse!)', 'Solution at CORNER!\n' + r'$\rightarrow w_2 = 0$ (sparse)', '#FFA07A'),
+    (axes[1], 'L2 Regularization (Ridge)\n' + r'$||w||_2^2 \leq t$', '#16a34a', 'L2 constraint region',
+     l2_opt, 'Optimal (both non-zero)', 'Solution on EDGE\n' + r'$\rightarrow$ Both $w_1, w_2 \neq 0$', '#98E898'),
+]
+
+for ax, title, color, region_label, opt, opt_label, note, note_color in panels:
+    ax.contour(W1, W2, loss(W1, W2), levels=levels, cmap='Blues_r', alpha=0.6, linewidths=1.2)
+    # the loss contour that just touches the constraint region
+    ax.contour(W1, W2, loss(W1, W2), levels=[loss(*opt)], colors='#1e3a8a', linewidths=2, linestyles='--')
+
+    if ax is axes[0]:
+        region = np.array([[1, 0], [0, 1], [-1, 0], [0, -1], [1, 0]])
+    else:
+        t = np.linspace(0, 2 * np.pi, 200)
+        region = np.column_stack([np.cos(t), np.sin(t)])
+    ax.fill(region[:, 0], region[:, 1], color=color, alpha=0.3, label=region_label)
+    ax.plot(region[:, 0], region[:, 1], color=color, linewidth=2.5)
+
+    ax.scatter(*opt, marker='*', s=250, color=color, edgecolors='black', linewidths=1.5, zorder=5,
+               label=opt_label)
+    ax.scatter(*w_star, s=120, color='#2563eb', edgecolors='black', linewidths=1, zorder=5,
+               label='Unconstrained min')
+    ax.annotate('', xy=opt, xytext=w_star,
+                arrowprops=dict(arrowstyle='->', color='gray', lw=1.5, ls='--'))
+
+    ax.axhline(0, color='gray', linewidth=0.5, alpha=0.5)
+    ax.axvline(0, color='gray', linewidth=0.5, alpha=0.5)
+    ax.text(-1.7, -1.7, note, fontsize=10, va='bottom',
+            bbox=dict(boxstyle='round', facecolor=note_color, alpha=0.9))
+
+    ax.set_xlim(-1.8, 1.8)
+    ax.set_ylim(-1.8, 1.8)
+    ax.set_aspect('equal')
+    ax.set_xlabel('$w_1$', fontsize=13)
+    ax.set_ylabel('$w_2$', fontsize=13)
+    ax.set_title(title, fontsize=13, fontweight='bold')
+    ax.grid(True, alpha=0.3)
+    ax.legend(loc='upper left', fontsize=9)
+
+fig.suptitle('L1 vs L2 Regularization: Why L1 Gives Sparse Solutions', fontsize=15, fontweight='bold', y=1.02)
+
+plt.tight_layout()
+save_figure('l1_l2_balls.png', bbox_inches='tight', facecolor='white')
+plt.close()
+
+print("Generated l1_l2_balls.png")
@@ -5,6 +5,9 @@ Shows why Laplace → L1 (sparsity) and Gaussian → L2 (weight decay).
 
 import numpy as np
 import matplotlib.pyplot as plt
+from figure_io import save_figure
+from figure_seeds import figure_rng
+from figure_style import use_style
 
 # Define distributions manually (no scipy dependency)
 def gaussian_pdf(x, mu=0, sigma=1):
@@ -16,11 +19,7 @@ def laplace_pdf_func(x, mu=0, b=1):
     return (1 / (2 * b)) * np.exp(-np.abs(x - mu) / b)
 
 # Set style - no LaTeX to avoid multiline text issues
-plt.rcParams['font.size'] = 11
-plt.rcParams['axes.titlesize'] = 12
-plt.rcParams['axes.labelsize'] = 11
-plt.rcParams['font.family'] = 'serif'
-plt.rcParams['mathtext.fontset'] = 'cm'
+use_style(rc={'font.size': 11, 'axes.titlesize': 12, 'axes.labelsize': 11, 'font.family': 'serif', 'mathtext.fontset': 'cm'})
 
 fig, axes = plt.subplots(2, 2, figsize=(12, 10))
 
@@ -125,19 +124,19 @@ ax2.grid(True, alpha=0.3)
 # =============================================================================
 ax3 = axes[1, 0]
 
-np.random.seed(42)
+rng = figure_rng('laplace_gaussian_prior')
 
 # Simulate trained weights
 n_weights = 50
 
 # L2 regularization: all weights small but non-zero (Gaussian-like)
-l2_weights = np.random.normal(0, 0.3, n_weights)
+l2_weights = rng.normal(0, 0.3, n_weights)
 
 # L1 regularization: many zeros, some larger weights (sparse)
 l1_weights = np.zeros(n_weights)
 n_nonzero = 12  # Only 12 out of 50 are non-zero
-nonzero_indices = np.random.choice(n_weights, n_nonzero, replace=False)
-l1_weights[nonzero_indices] = np.random.laplace(0, 0.4, n_nonzero)
+nonzero_indices = rng.choice(n_weights, n_nonzero, replace=False)
+l1_weights[nonzero_indices] = rng.laplace(0, 0.4, n_nonzero)
 
 # Plot as bar charts
 width = 0.35
@@ -245,8 +244,8 @@ ax4.axvline(x=0, color='gray', linestyle='-', linewidth=0.5)
 ax4.grid(True, alpha=0.3)
 
 plt.tight_layout()
-plt.savefig('ml-notes/figures/laplace_gaussian_prior.png', dpi=150, bbox_inches='tight',
+save_figure('laplace_gaussian_prior.png', dpi=150, bbox_inches='tight',
             facecolor='white', edgecolor='none')
 plt.close()
 
-print("Generated: ml-notes/figures/laplace_gaussian_prior.png")
+print("Generated: laplace_gaussian_prior.png")
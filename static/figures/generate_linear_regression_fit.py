@@ -3,10 +3,10 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+from figure_io import save_figure
+from figure_style import use_style
 
-plt.rcParams['figure.dpi'] = 150
-plt.rcParams['savefig.dpi'] = 150
-plt.rcParams['font.size'] = 11
+use_style('hidpi', rc={'font.size': 11})
 
 # Data from the document
 X = np.array([1000, 1500, 2000, 2500, 3000])
@@ -76,7 +76,7 @@ fig.text(0.5, 0.02,
 
 plt.tight_layout()
 plt.subplots_adjust(bottom=0.15)
-plt.savefig('linear_regression_fit.png', bbox_inches='tight', facecolor='white')
+save_figure('linear_regression_fit.png', bbox_inches='tight', facecolor='white')
 plt.close()
 
 print("Generated linear_regression_fit.png")
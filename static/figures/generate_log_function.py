@@ -4,15 +4,14 @@ Generate visualization of the log function and why we use log-likelihood.
 
 import numpy as np
 import matplotlib.pyplot as plt
+from figure_io import save_figure
+from figure_quality import tex_rc
+from figure_style import use_style
 
 # Set style - Enable full LaTeX rendering for publication-quality math
-plt.rcParams['font.size'] = 11
-plt.rcParams['axes.titlesize'] = 12
-plt.rcParams['axes.labelsize'] = 11
-plt.rcParams['text.usetex'] = True  # Use full LaTeX rendering
-plt.rcParams['font.family'] = 'serif'
-plt.rcParams['font.serif'] = ['Computer Modern Roman']
-plt.rcParams['text.latex.preamble'] = r'\usepackage{amsmath}\usepackage{amssymb}'  # For \text{} and \checkmark
+use_style(rc={'font.size': 11, 'axes.titlesize': 12, 'axes.labelsize': 11})
+# Full LaTeX rendering (mathtext with Computer Modern in drafts or without TeX)
+plt.rcParams.update(tex_rc(r'\usepackage{amsmath}\usepackage{amssymb}'))  # For \text{} and \checkmark
 
 fig, axes = plt.subplots(2, 2, figsize=(12, 10))
 
@@ -193,7 +192,7 @@ ax4.text(2.3, 2.5, r'$\frac{d}{dx}\log(2) = 0.5$' + '\n(less sensitive)', fontsi
 
 # Add box explaining why this matters for ML
 ax4.text(0.5, 0.7, 
-         r'\textbf{Why this helps optimization:}' + '\n' +
+         r'$\mathbf{Why\ this\ helps\ optimization:}$' + '\n' +
          r'$\bullet$ Small $p$: large gradient $\rightarrow$ model updates more' + '\n' + 
          r'$\bullet$ Large $p$: small gradient $\rightarrow$ stable, no overshoot',
          transform=ax4.transAxes, fontsize=9, va='center', ha='center',
@@ -208,8 +207,8 @@ ax4.legend(loc='upper right')
 ax4.grid(True, alpha=0.3)
 
 plt.tight_layout()
-plt.savefig('ml-notes/figures/log_function_why.png', dpi=150, bbox_inches='tight',
+save_figure('log_function_why.png', dpi=150, bbox_inches='tight',
             facecolor='white', edgecolor='none')
 plt.close()
 
-print("Generated: ml-notes/figures/log_function_why.png")
+print("Generated: log_function_why.png")
@@ -3,6 +3,11 @@
 
 import matplotlib.pyplot as plt
 import numpy as np
+from figure_io import save_figure
+from figure_style import use_style
+
+# Set style
+use_style()
 
 # Create figure
 fig, ax = plt.subplots(1, 1, figsize=(8, 5))
@@ -53,7 +58,7 @@ ax.set_ylim(0.5, 3)
 ax.grid(True, alpha=0.3)
 
 plt.tight_layout()
-plt.savefig('loss_valley.png', dpi=150, bbox_inches='tight', facecolor='white')
+save_figure('loss_valley.png', dpi=150, bbox_inches='tight', facecolor='white')
 plt.close()
 
 print("Generated loss_valley.png")
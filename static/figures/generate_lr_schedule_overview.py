@@ -5,6 +5,11 @@ Shows different LR schedules: constant, step decay, cosine, warmup+cosine.
 
 import matplotlib.pyplot as plt
 import numpy as np
+from figure_io import save_figure
+from figure_style import use_style
+
+# Set style
+use_style()
 
 # Set up the figure
 fig, axes = plt.subplots(2, 2, figsize=(14, 10))
@@ -107,7 +112,7 @@ ax4.text(0.02, 0.95, explanation_text, transform=ax4.transAxes, fontsize=9,
 
 plt.suptitle('Learning Rate Schedules: Why and When', fontsize=14, fontweight='bold')
 plt.tight_layout()
-plt.savefig('lr_schedule_overview.png', dpi=150, bbox_inches='tight',
+save_figure('lr_schedule_overview.png', dpi=150, bbox_inches='tight',
             facecolor='white', edgecolor='none')
 plt.close()
 
@@ -4,10 +4,14 @@ Demonstrates how MCMC samples converge to the target distribution.
 """
 import numpy as np
 import matplotlib.pyplot as plt
+from figure_animation import animation_format, save_animation
+from figure_io import save_figure
+from figure_quality import scaled
+from figure_seeds import figure_rng
+from figure_style import use_style
 
 # Set style
-plt.style.use('seaborn-v0_8-whitegrid')
-plt.rcParams['font.size'] = 12
+use_style('whitegrid', rc={'font.size': 12})
 
 def gaussian_pdf(x, mu, sigma):
     """Gaussian PDF using numpy only"""
@@ -17,21 +21,23 @@ def target_pdf(x):
     """Mixture of two Gaussians (unnormalized)"""
     return 0.3 * gaussian_pdf(x, -2, 0.7) + 0.7 * gaussian_pdf(x, 2, 1.0)
 
-def metropolis_hastings(n_samples, proposal_std=1.0, seed=42):
+def metropolis_hastings(n_samples, rng, proposal_std=1.0):
     """Run Metropolis-Hastings algorithm"""
-    np.random.seed(seed)
+    # Draw every proposal step and acceptance threshold up front
+    steps = rng.normal(0, proposal_std, n_samples)
+    thresholds = rng.random(n_samples)
     samples = []
     x = 0.0  # Starting point
     
-    for _ in range(n_samples):
+    for step, threshold in zip(steps, thresholds):
         # Propose new point
-        x_proposed = x + np.random.normal(0, proposal_std)
+        x_proposed = x + step
         
         # Acceptance ratio
         alpha = min(1, target_pdf(x_proposed) / max(target_pdf(x), 1e-10))
         
         # Accept or reject
-        if np.random.random() < alpha:
+        if threshold < alpha:
             x = x_proposed
         
         samples.append(x)
@@ -39,9 +45,9 @@ def metropolis_hastings(n_samples, proposal_std=1.0, seed=42):
     return np.array(samples)
 
 # Run MCMC
-n_samples = 10000
-burn_in = 1000
-samples = metropolis_hastings(n_samples)
+n_samples = scaled(10000, minimum=1000)
+burn_in = n_samples // 10
+samples = metropolis_hastings(n_samples, figure_rng('mcmc'))
 samples_after_burnin = samples[burn_in:]
 
 # Create figure
@@ -93,10 +99,68 @@ ax4.set_title('Autocorrelation of MCMC Samples')
 ax4.legend()
 
 plt.tight_layout()
-plt.savefig('mcmc_sampling.png', dpi=150, bbox_inches='tight', facecolor='white')
+save_figure('mcmc_sampling.png', dpi=150, bbox_inches='tight', facecolor='white')
 plt.close()
 
 print("Generated mcmc_sampling.png")
 print(f"Samples: {n_samples}, Burn-in: {burn_in}")
 print(f"Sample mean: {samples_after_burnin.mean():.3f}")
 print(f"Sample std: {samples_after_burnin.std():.3f}")
+
+# Animated chain (--animate): the trace grows while the histogram fills in under the target
+if animation_format():
+    n_frames = 200
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 4.5), dpi=100)
+
+    iterations = np.arange(0, n_samples, 10)
+    thinned = samples[::10]  # as in the full-trace panel
+    ax1.axhline(y=-2, color='r', linestyle='--', alpha=0.5, label='Mode 1 (-2)')
+    ax1.axhline(y=2, color='g', linestyle='--', alpha=0.5, label='Mode 2 (2)')
+    ax1.set_xlim(0, n_samples)
+    ax1.set_ylim(samples.min() - 0.5, samples.max() + 0.5)
+    ax1.set_xlabel('Iteration')
+    ax1.set_ylabel('Sample value')
+    ax1.set_title('MCMC Trace')
+    ax1.legend(loc='upper right', fontsize=9)
+    trace, = ax1.plot([], [], 'b-', alpha=0.6, lw=0.6)
+    head, = ax1.plot([], [], 'o', color='darkblue', markersize=5)
+
+    bins = np.linspace(-6, 6, 51)
+    width = bins[1] - bins[0]
+    sample_bins = np.clip(np.digitize(samples, bins) - 1, 0, len(bins) - 2)
+    ax2.plot(x_range, target_pdf(x_range), 'r-', lw=2, label='Target distribution')
+    bars = ax2.bar(bins[:-1] + width / 2, np.zeros(len(bins) - 1), width=width, color='steelblue', alpha=0.7,
+                   edgecolor='white', label='MCMC samples')
+    ax2.set_xlim(-6, 6)
+    ax2.set_ylim(0, target_pdf(x_range).max() * 1.5)
+    ax2.set_xlabel('x')
+    ax2.set_ylabel('Density')
+    ax2.set_title('Samples Approach the Target Distribution')
+    ax2.legend(loc='upper left')
+    counter = ax2.text(0.98, 0.95, '', transform=ax2.transAxes, ha='right', va='top', fontsize=11)
+    plt.tight_layout()
+
+    ends = np.linspace(10, n_samples, n_frames).astype(int)
+
+    def init():
+        trace.set_data([], [])
+        head.set_data([], [])
+        for bar in bars:
+            bar.set_height(0)
+        counter.set_text('')
+        return [trace, head, *bars, counter]
+
+    def update(frame):
+        end = ends[frame]
+        shown = end // 10
+        trace.set_data(iterations[:shown], thinned[:shown])
+        head.set_data(iterations[shown - 1:shown], thinned[shown - 1:shown])
+        density = np.bincount(sample_bins[:end], minlength=len(bars)) / (end * width)
+        for bar, height in zip(bars, density):
+            bar.set_height(height)
+        counter.set_text(f'{end} samples')
+        return [trace, head, *bars, counter]
+
+    path = save_animation('mcmc_sampling.webp', fig, update, n_frames, init)
+    plt.close()
+    print(f"Generated {path.name} ({n_frames} frames)")
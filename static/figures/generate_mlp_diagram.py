@@ -4,6 +4,12 @@
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import numpy as np
+from figure_grids import dense_edges
+from figure_io import save_figure
+from figure_style import use_style
+
+# Set style
+use_style()
 
 def draw_mlp():
     fig, ax = plt.subplots(1, 1, figsize=(10, 6))
@@ -28,16 +34,9 @@ def draw_mlp():
     hidden_color = '#FF6B6B'
     output_color = '#45B7D1'
     
-    # Draw connections (weights)
-    for ix, iy in input_nodes:
-        for hx, hy in hidden_nodes:
-            ax.annotate('', xy=(hx - node_radius, hy), xytext=(ix + node_radius, iy),
-                       arrowprops=dict(arrowstyle='-', color='#888888', lw=1, alpha=0.6))
-    
-    for hx, hy in hidden_nodes:
-        for ox, oy in output_nodes:
-            ax.annotate('', xy=(ox - node_radius, oy), xytext=(hx + node_radius, hy),
-                       arrowprops=dict(arrowstyle='-', color='#888888', lw=1, alpha=0.6))
+    # Draw connections (weights), one collection per layer pair
+    dense_edges(ax, input_nodes, hidden_nodes, colors='#888888', alpha=0.6, gap=node_radius, linewidth=1)
+    dense_edges(ax, hidden_nodes, output_nodes, colors='#888888', alpha=0.6, gap=node_radius, linewidth=1)
     
     # Draw nodes
     for i, (x, y) in enumerate(input_nodes):
@@ -71,7 +70,7 @@ def draw_mlp():
                arrowprops=dict(arrowstyle='<->', color='#555555', lw=1.5))
     
     plt.tight_layout()
-    plt.savefig('mlp_architecture.png', dpi=150, bbox_inches='tight', 
+    save_figure('mlp_architecture.png', dpi=150, bbox_inches='tight', 
                 facecolor='white', edgecolor='none')
     print("Saved mlp_architecture.png")
     plt.close()
@@ -4,10 +4,10 @@
 import matplotlib.pyplot as plt
 import numpy as np
 import matplotlib.patches as patches
+from figure_io import save_figure
+from figure_style import use_style
 
-plt.rcParams['figure.dpi'] = 150
-plt.rcParams['savefig.dpi'] = 150
-plt.rcParams['font.size'] = 12
+use_style('hidpi', rc={'font.size': 12})
 
 fig, axes = plt.subplots(1, 2, figsize=(12, 5))
 
@@ -102,7 +102,7 @@ fig.text(0.5, 0.02,
 
 plt.suptitle('Intuition: Ball Rolling Downhill', fontsize=16, fontweight='bold', y=0.98)
 plt.tight_layout(rect=[0, 0.12, 1, 0.95])
-plt.savefig('momentum_ball.png', bbox_inches='tight', facecolor='white')
+save_figure('momentum_ball.png', bbox_inches='tight', facecolor='white')
 plt.close()
 
 print("Generated momentum_ball.png")
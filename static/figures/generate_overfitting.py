@@ -3,19 +3,20 @@
 
 import matplotlib.pyplot as plt
 import numpy as np
+from figure_io import save_figure
+from figure_seeds import figure_rng
+from figure_style import use_style
 
-plt.rcParams['figure.dpi'] = 150
-plt.rcParams['savefig.dpi'] = 150
-plt.rcParams['font.size'] = 12
+use_style('hidpi', rc={'font.size': 12})
 
 # Create figure with three subplots
 fig, (ax1, ax2, ax3) = plt.subplots(1, 3, figsize=(14, 4))
 
 # Generate training data (noisy sine wave)
-np.random.seed(42)
+rng = figure_rng('overfitting')
 x_data = np.array([0.5, 1.5, 2.5, 3.5, 4.5, 5.5])
 y_true = np.sin(x_data * 0.8)
-y_data = y_true + np.random.normal(0, 0.15, len(x_data))
+y_data = y_true + rng.normal(0, 0.15, len(x_data))
 
 # Smooth x for plotting curves
 x_smooth = np.linspace(0, 6, 200)
@@ -75,7 +76,7 @@ ax3.text(3, -1.2, 'Captures pattern, ignores noise', fontsize=10, ha='center',
          style='italic', color='#16a34a')
 
 plt.tight_layout()
-plt.savefig('overfitting_good_fit.png', bbox_inches='tight', facecolor='white')
+save_figure('overfitting_good_fit.png', bbox_inches='tight', facecolor='white')
 plt.close()
 
 print("Generated overfitting_good_fit.png")
@@ -4,11 +4,11 @@ Uses the same data from the worked example in 03-math-foundations.md
 """
 import numpy as np
 import matplotlib.pyplot as plt
+from figure_io import save_figure
+from figure_style import use_style
 
 # Set clean style
-plt.style.use('seaborn-v0_8-whitegrid')
-plt.rcParams['font.size'] = 11
-plt.rcParams['font.family'] = 'sans-serif'
+use_style('whitegrid', rc={'font.size': 11})
 
 # Original data from the worked example
 data = np.array([
@@ -136,7 +136,7 @@ fig.suptitle('PCA: Dimensionality Reduction from 2D to 1D',
              fontsize=14, fontweight='bold', y=1.02)
 
 plt.tight_layout()
-plt.savefig('pca_projection.png', dpi=150, bbox_inches='tight', facecolor='white')
+save_figure('pca_projection.png', dpi=150, bbox_inches='tight', facecolor='white')
 plt.close()
 
 print("Generated pca_projection.png")
@@ -1,17 +1,16 @@
 """Generate percentiles and quantiles visualization."""
 import numpy as np
 import matplotlib.pyplot as plt
+from figure_io import save_figure
+from figure_seeds import figure_rng
+from figure_style import use_style
 
 # Set style to match other figures
-plt.style.use('seaborn-v0_8-whitegrid')
-plt.rcParams['font.size'] = 11
-plt.rcParams['axes.labelsize'] = 12
-plt.rcParams['axes.titlesize'] = 13
-plt.rcParams['figure.facecolor'] = 'white'
+use_style('whitegrid', 'labels')
 
 # Generate sample data (normal distribution)
-np.random.seed(42)
-data = np.random.normal(100, 15, 1000)
+rng = figure_rng('percentiles')
+data = rng.normal(100, 15, 1000)
 
 # Calculate key percentiles
 Q1, median, Q3 = np.percentile(data, [25, 50, 75])
@@ -77,7 +76,7 @@ ax2.set_yticks([0, 25, 50, 75, 100])
 ax2.grid(True, alpha=0.3)
 
 plt.tight_layout()
-plt.savefig('percentiles_quantiles.png', dpi=150, bbox_inches='tight',
+save_figure('percentiles_quantiles.png', dpi=150, bbox_inches='tight',
             facecolor='white', edgecolor='none')
 plt.close()
 
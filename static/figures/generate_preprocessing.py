@@ -3,24 +3,25 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+from figure_io import save_figure
+from figure_seeds import figure_rng
+from figure_style import use_style
 
-plt.rcParams['figure.dpi'] = 150
-plt.rcParams['savefig.dpi'] = 150
-plt.rcParams['font.size'] = 11
+use_style('hidpi', rc={'font.size': 11})
 
-np.random.seed(42)
+rng = figure_rng('preprocessing')
 
 # Create data with very different scales (common real-world scenario)
 n_samples = 100
 
 # Feature 1: Age (0-80)
-age = np.random.normal(40, 15, n_samples).clip(18, 80)
+age = rng.normal(40, 15, n_samples).clip(18, 80)
 
 # Feature 2: Salary (20,000 - 500,000)
-salary = np.random.exponential(80000, n_samples).clip(20000, 500000)
+salary = rng.exponential(80000, n_samples).clip(20000, 500000)
 
 # Feature 3: Height in meters (1.5 - 2.0)
-height = np.random.normal(1.7, 0.1, n_samples).clip(1.4, 2.1)
+height = rng.normal(1.7, 0.1, n_samples).clip(1.4, 2.1)
 
 # Create figure
 fig, axes = plt.subplots(1, 3, figsize=(16, 5))
@@ -102,7 +103,7 @@ fig.text(0.5, -0.03,
 
 plt.tight_layout()
 plt.subplots_adjust(bottom=0.16)
-plt.savefig('preprocessing_before_after.png', bbox_inches='tight', facecolor='white')
+save_figure('preprocessing_before_after.png', bbox_inches='tight', facecolor='white')
 plt.close()
 
 print("Generated preprocessing_before_after.png")
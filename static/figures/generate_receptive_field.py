@@ -5,8 +5,13 @@ Shows how receptive field grows with depth.
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
-from matplotlib.patches import Rectangle, FancyBboxPatch
 import numpy as np
+from figure_grids import cell_grid
+from figure_io import save_figure
+from figure_style import use_style
+
+# Set style
+use_style()
 
 # Set up the figure
 fig, axes = plt.subplots(1, 3, figsize=(14, 5))
@@ -19,20 +24,13 @@ def draw_grid(ax, size, highlight_cells=None, highlight_color='#FF5722',
     ax.set_aspect('equal')
     ax.axis('off')
     
-    # Draw grid cells
-    for i in range(size):
-        for j in range(size):
-            rect = Rectangle((j - 0.5, size - i - 1.5), 1, 1, 
-                            facecolor='white', edgecolor=grid_color, linewidth=1)
-            ax.add_patch(rect)
-    
-    # Highlight cells
+    # Draw grid cells, then the highlighted ones on top, one collection each
+    cell_grid(ax, 'white', shape=(size, size), origin=(-0.5, -0.5), edgecolor=grid_color, linewidth=1)
     if highlight_cells:
-        for (i, j) in highlight_cells:
-            rect = Rectangle((j - 0.5, size - i - 1.5), 1, 1, 
-                            facecolor=highlight_color, edgecolor='black', 
-                            linewidth=2, alpha=0.7)
-            ax.add_patch(rect)
+        mask = np.zeros((size, size), bool)
+        mask[tuple(np.transpose(highlight_cells))] = True
+        cell_grid(ax, highlight_color, mask=mask, origin=(-0.5, -0.5),
+                  edgecolor='black', linewidth=2, alpha=0.7)
     
     ax.set_title(title, fontsize=12, fontweight='bold', pad=10)
     
@@ -87,7 +85,7 @@ fig.text(0.5, 0.02,
 
 plt.suptitle('Receptive Field Growth in CNNs', fontsize=14, fontweight='bold', y=0.98)
 plt.tight_layout(rect=[0, 0.12, 1, 0.95])
-plt.savefig('receptive_field.png', dpi=150, bbox_inches='tight',
+save_figure('receptive_field.png', dpi=150, bbox_inches='tight',
             facecolor='white', edgecolor='none')
 plt.close()
 
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Generate ResNet residual block diagram (skip connection and gradient flow)."""
+
+import matplotlib.pyplot as plt
+from figure_diagram import Diagram
+from figure_io import save_figure
+from figure_style import use_style
+
+use_style('hidpi')
+
+fig, ax = plt.subplots(figsize=(9, 10))
+
+conv_color = '#60a5fa'
+norm_color = '#a78bfa'
+relu_color = '#4ade80'
+skip_color = '#ef4444'
+
+diagram = Diagram({
+    'layer': dict(shape='box', width=2.4, height=0.6, boxstyle='round,pad=0.1,rounding_size=0.25',
+                  edgecolor='#1f2937', linewidth=2, fontsize=12, color='white'),
+    'add': dict(shape='circle', radius=0.35, facecolor='#f97316', edgecolor='black', linewidth=2,
+                fontsize=20, color='white'),
+    'flow': dict(color='black', linewidth=2),
+    'skip': dict(color=skip_color, linewidth=3.5),
+})
+
+# Residual branch F(x): conv -> BN -> ReLU -> conv -> BN
+center_x = 3
+input_y = 11
+layers = [('conv1', 'Conv 3×3', conv_color), ('bn1', 'BatchNorm', norm_color), ('relu1', 'ReLU', relu_color),
+          ('conv2', 'Conv 3×3', conv_color), ('bn2', 'BatchNorm', norm_color)]
+layer_ys = [9.8 - 1.1 * i for i in range(len(layers))]
+
+ax.text(center_x, input_y + 0.35, r'$h_l$ (input)', ha='center', va='bottom', fontsize=14, fontweight='bold')
+previous = (center_x, input_y)
+for (name, label, color), y in zip(layers, layer_ys):
+    diagram.node(name, (center_x, y), label, style='layer', facecolor=color)
+    diagram.edge(previous, name, style='flow')
+    previous = name
+
+# Add the identity, then the final ReLU
+add_y = layer_ys[-1] - 1.2
+output_relu_y = add_y - 1.2
+diagram.node('add', (center_x, add_y), '+', style='add')
+diagram.node('relu_out', (center_x, output_relu_y), 'ReLU', style='layer', facecolor=relu_color)
+diagram.edge('bn2', 'add', style='flow')
+diagram.edge('add', 'relu_out', style='flow')
+diagram.edge('relu_out', (center_x, output_relu_y - 1.0), style='flow')
+ax.text(center_x, output_relu_y - 1.1, r'$h_{l+1}$ (output)', ha='center', va='top', fontsize=14, fontweight='bold')
+
+# Identity (skip) connection around the residual branch
+skip_x = center_x + 2.6
+diagram.edge((center_x, input_y - 0.25), 'add', style='skip', via=[(skip_x, input_y - 0.25), (skip_x, add_y)])
+ax.text(skip_x + 0.2, (input_y + add_y) / 2, 'Identity\n(skip)', fontsize=12, fontweight='bold',
+        color=skip_color, va='center')
+ax.text(center_x - 1.9, layer_ys[2], 'F(x)\n(residual)', fontsize=12, fontweight='bold', color='#3b82f6',
+        ha='right', va='center')
+
+diagram.draw(ax)
+
+# Block equation and why it helps gradients
+ax.text(center_x, input_y + 1.3, r'$h_{l+1} = h_l + F(h_l, W_l)$', ha='center', fontsize=17,
+        bbox=dict(boxstyle='round,pad=0.4', facecolor='#fde68a', edgecolor='#92400e', alpha=0.8))
+ax.text(skip_x + 0.2, layer_ys[-1] + 0.2,
+        'Gradient flow:\n'
+        r'$\frac{\partial h_{l+1}}{\partial h_l} = 1 + \frac{\partial F}{\partial h_l}$' '\n\n'
+        r'Even if $\frac{\partial F}{\partial h_l} \approx 0$,' '\n'
+        'the gradient still flows\nthrough the identity path',
+        fontsize=11, va='center', linespacing=1.5,
+        bbox=dict(boxstyle='round,pad=0.5', facecolor='#dcfce7', edgecolor='#16a34a'))
+
+ax.set_xlim(0, 10)
+ax.set_ylim(output_relu_y - 1.8, input_y + 2)
+ax.set_aspect('equal')
+ax.axis('off')
+ax.set_title('ResNet Residual Block: Skip Connections for Better Gradient Flow', fontsize=15, fontweight='bold')
+
+plt.tight_layout()
+save_figure('resnet_block.png', bbox_inches='tight', facecolor='white')
+plt.close()
+
+print("Generated resnet_block.png")
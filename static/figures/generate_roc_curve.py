@@ -4,13 +4,12 @@ Generate ROC curve visualization for ML fundamentals chapter.
 
 import numpy as np
 import matplotlib.pyplot as plt
+from figure_io import save_figure
+from figure_seeds import figure_rng
+from figure_style import use_style
 
 # Set style
-plt.style.use('default')
-plt.rcParams['font.size'] = 11
-plt.rcParams['axes.labelsize'] = 12
-plt.rcParams['axes.titlesize'] = 13
-plt.rcParams['figure.facecolor'] = 'white'
+use_style('labels')
 
 
 def compute_roc_curve(y_true, y_scores, n_thresholds=100):
@@ -48,25 +47,25 @@ def compute_auc(fpr, tpr):
 
 
 # Generate synthetic data for different classifiers
-np.random.seed(42)
+rng = figure_rng('roc_curve')
 n_samples = 1000
 
 # True labels (imbalanced: 30% positive)
-y_true = np.random.choice([0, 1], size=n_samples, p=[0.7, 0.3])
+y_true = rng.choice([0, 1], size=n_samples, p=[0.7, 0.3])
 
 # Simulate different classifier outputs
 # Good classifier: higher scores for positive class
 y_scores_good = np.where(y_true == 1, 
-                         np.random.beta(5, 2, n_samples),
-                         np.random.beta(2, 5, n_samples))
+                         rng.beta(5, 2, n_samples),
+                         rng.beta(2, 5, n_samples))
 
 # Medium classifier: some separation
 y_scores_medium = np.where(y_true == 1,
-                           np.random.beta(3, 2, n_samples),
-                           np.random.beta(2, 3, n_samples))
+                           rng.beta(3, 2, n_samples),
+                           rng.beta(2, 3, n_samples))
 
 # Poor classifier: almost random
-y_scores_poor = np.random.uniform(0, 1, n_samples)
+y_scores_poor = rng.uniform(0, 1, n_samples)
 
 # Compute ROC curves
 fpr_good, tpr_good, thresh_good = compute_roc_curve(y_true, y_scores_good)
@@ -141,7 +140,7 @@ ax2.text(0.05, 0.7, 'Lower threshold:\n• More true positives\n• More false p
         fontsize=9, bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.5))
 
 plt.tight_layout()
-plt.savefig('roc_curve.png', dpi=150, bbox_inches='tight', 
+save_figure('roc_curve.png', dpi=150, bbox_inches='tight', 
             facecolor='white', edgecolor='none')
 plt.close()
 
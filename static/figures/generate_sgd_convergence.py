@@ -5,21 +5,24 @@ Shows loss curve and parameter trajectory during training.
 
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.colors import LogNorm
+from figure_animation import animation_format, save_animation
+from figure_io import save_figure
+from figure_seeds import figure_rng
+from figure_style import use_style
 
 # Set style
-plt.style.use('seaborn-v0_8-whitegrid')
-plt.rcParams['font.size'] = 11
-plt.rcParams['axes.labelsize'] = 12
-plt.rcParams['axes.titlesize'] = 13
+use_style('whitegrid', 'labels')
 
 def sgd_linear_regression_with_history(X, y, lr=0.01, epochs=100):
-    """SGD for linear regression with loss and parameter history."""
+    """SGD for linear regression with loss and parameter history (per epoch, and per update in steps)."""
     w1, w2 = 0.0, 0.0  # Initialize weights
     n = len(X)
     
     loss_history = []
     w1_history = []
     w2_history = []
+    steps = [(w1, w2)]
     
     for epoch in range(epochs):
         # Compute epoch loss
@@ -30,7 +33,7 @@ def sgd_linear_regression_with_history(X, y, lr=0.01, epochs=100):
         w2_history.append(w2)
         
         # Shuffle data
-        indices = np.random.permutation(n)
+        indices = rng.permutation(n)
         
         for i in indices:
             # Prediction error for single point
@@ -39,16 +42,17 @@ def sgd_linear_regression_with_history(X, y, lr=0.01, epochs=100):
             # Update weights based on this ONE point
             w1 = w1 - lr * 2 * error
             w2 = w2 - lr * 2 * error * X[i]
+            steps.append((w1, w2))
     
-    return w1, w2, loss_history, w1_history, w2_history
+    return w1, w2, loss_history, w1_history, w2_history, np.array(steps)
 
 # Generate data
-np.random.seed(42)
+rng = figure_rng('sgd_convergence')
 X = np.array([1, 2, 3, 4, 5], dtype=float)
 y = np.array([2.1, 4.0, 5.8, 8.1, 9.9])  # Approximately y = 2x
 
 # Run SGD
-w1_final, w2_final, losses, w1s, w2s = sgd_linear_regression_with_history(X, y, lr=0.01, epochs=50)
+w1_final, w2_final, losses, w1s, w2s, steps = sgd_linear_regression_with_history(X, y, lr=0.01, epochs=50)
 
 # Create figure
 fig, axes = plt.subplots(1, 3, figsize=(14, 4))
@@ -93,10 +97,62 @@ ax3.set_xlim(0, 6)
 ax3.set_ylim(0, 12)
 
 plt.tight_layout()
-plt.savefig('sgd_convergence.png', dpi=150, bbox_inches='tight', 
+save_figure('sgd_convergence.png', dpi=150, bbox_inches='tight', 
             facecolor='white', edgecolor='none')
 plt.close()
 
 print("Generated sgd_convergence.png")
 print(f"Final weights: w1={w1_final:.4f}, w2={w2_final:.4f}")
 print(f"Final loss: {losses[-1]:.6f}")
+
+# Animated training (--animate): one frame per SGD update, over the loss surface and the data
+if animation_format():
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5), dpi=100)
+
+    w1_grid, w2_grid = np.meshgrid(np.linspace(-1.0, 1.5, 150), np.linspace(-0.5, 2.5, 150))
+    loss_grid = np.mean((w1_grid[..., None] + w2_grid[..., None] * X - y) ** 2, axis=-1)
+    levels = np.logspace(-2, 2, 15)
+    ax1.contourf(w1_grid, w2_grid, loss_grid, levels=levels, cmap='Blues_r', alpha=0.6,
+                 norm=LogNorm())
+    ax1.contour(w1_grid, w2_grid, loss_grid, levels=levels, colors='steelblue', linewidths=0.6, alpha=0.6)
+    ax1.scatter([0], [2], c='gold', s=150, marker='X', zorder=5, label='True (0, 2)', edgecolors='black')
+    ax1.scatter([0], [0], c='green', s=100, marker='o', zorder=5, label='Start (0, 0)')
+    ax1.set_xlabel('$w_1$ (intercept)')
+    ax1.set_ylabel('$w_2$ (slope)')
+    ax1.set_title('Parameter Trajectory on the MSE Loss')
+    ax1.legend(loc='lower right')
+    path_line, = ax1.plot([], [], 'b-', linewidth=1, alpha=0.8)
+    current, = ax1.plot([], [], 'o', color='red', markersize=7, zorder=6)
+
+    ax2.scatter(X, y, c='blue', s=80, label='Training data', zorder=5)
+    ax2.plot(x_line, y_true, 'g--', linewidth=2, label='True: y = 2x', alpha=0.7)
+    fit_line, = ax2.plot([], [], 'r-', linewidth=2, label='Fitted')
+    ax2.set_xlabel('x')
+    ax2.set_ylabel('y')
+    ax2.set_title('Linear Regression Fit')
+    ax2.legend(loc='upper left')
+    ax2.set_xlim(0, 6)
+    ax2.set_ylim(0, 12)
+    status = ax2.text(0.98, 0.04, '', transform=ax2.transAxes, ha='right', fontsize=11)
+    plt.tight_layout()
+
+    n_frames = len(steps)
+
+    def init():
+        path_line.set_data([], [])
+        current.set_data([], [])
+        fit_line.set_data([], [])
+        status.set_text('')
+        return [path_line, current, fit_line, status]
+
+    def update(frame):
+        w1, w2 = steps[frame]
+        path_line.set_data(steps[:frame + 1, 0], steps[:frame + 1, 1])
+        current.set_data([w1], [w2])
+        fit_line.set_data(x_line, w1 + w2 * x_line)
+        status.set_text(f'epoch {frame // len(X)}, update {frame}: y = {w1:.2f} + {w2:.2f}x')
+        return [path_line, current, fit_line, status]
+
+    path = save_animation('sgd_convergence.webp', fig, update, n_frames, init)
+    plt.close()
+    print(f"Generated {path.name} ({n_frames} frames)")
@@ -3,6 +3,11 @@
 
 import matplotlib.pyplot as plt
 import numpy as np
+from figure_io import save_figure
+from figure_style import use_style
+
+# Set style
+use_style()
 
 # Create figure with two subplots side by side
 fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
@@ -93,7 +98,7 @@ fig.text(0.5, 0.02,
          ha='center', fontsize=11, style='italic')
 
 plt.tight_layout(rect=[0, 0.05, 1, 1])
-plt.savefig('sharp_flat_minima.png', dpi=150, bbox_inches='tight', facecolor='white')
+save_figure('sharp_flat_minima.png', dpi=150, bbox_inches='tight', facecolor='white')
 plt.close()
 
 print("Generated sharp_flat_minima.png")
@@ -7,6 +7,11 @@ Generate sigmoid function and derivative plot showing:
 
 import numpy as np
 import matplotlib.pyplot as plt
+from figure_io import save_figure
+from figure_style import use_style
+
+# Set style
+use_style()
 
 # Set up the figure with two subplots
 fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
@@ -86,7 +91,7 @@ ax2.annotate('In saturation regions:\n' + r"$\sigma' \to 0$" + '\n(vanishing gra
              bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.8))
 
 plt.tight_layout()
-plt.savefig('sigmoid_derivative.png', dpi=150, bbox_inches='tight', 
+save_figure('sigmoid_derivative.png', dpi=150, bbox_inches='tight', 
             facecolor='white', edgecolor='none')
 plt.close()
 
@@ -139,7 +144,7 @@ ax3.text(0.02, 0.98, textstr, transform=ax3.transAxes, fontsize=10,
          verticalalignment='top', bbox=props)
 
 plt.tight_layout()
-plt.savefig('sigmoid_vs_relu_derivative.png', dpi=150, bbox_inches='tight',
+save_figure('sigmoid_vs_relu_derivative.png', dpi=150, bbox_inches='tight',
             facecolor='white', edgecolor='none')
 plt.close()
 
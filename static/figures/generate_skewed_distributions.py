@@ -3,17 +3,19 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy import stats
+from figure_io import save_figure
+from figure_quality import scaled
+from figure_seeds import figure_rng
+from figure_style import use_style
 
 # Set style
-plt.rcParams['font.size'] = 11
-plt.rcParams['axes.titlesize'] = 12
-plt.rcParams['axes.labelsize'] = 11
-plt.rcParams['figure.facecolor'] = 'white'
+use_style(rc={'font.size': 11, 'axes.titlesize': 12, 'axes.labelsize': 11})
 
 fig, axes = plt.subplots(1, 3, figsize=(14, 4))
 
 # Generate data for each distribution type
-np.random.seed(42)
+rng = figure_rng('skewed_distributions')
+n_draws = scaled(100000, minimum=1000)  # samples per skewed distribution
 
 # 1. Symmetric (Normal)
 x_sym = np.linspace(-4, 4, 1000)
@@ -25,7 +27,7 @@ mode_sym = 0
 # 2. Right-skewed (Log-normal / Chi-squared)
 x_right = np.linspace(0, 10, 1000)
 y_right = stats.chi2.pdf(x_right, df=3)
-samples_right = stats.chi2.rvs(df=3, size=100000)
+samples_right = stats.chi2.rvs(df=3, size=n_draws, random_state=rng)
 mean_right = np.mean(samples_right)
 median_right = np.median(samples_right)
 mode_right = x_right[np.argmax(y_right)]
@@ -33,7 +35,7 @@ mode_right = x_right[np.argmax(y_right)]
 # 3. Left-skewed (Reflected exponential / Beta)
 x_left = np.linspace(0, 1, 1000)
 y_left = stats.beta.pdf(x_left, a=5, b=2)
-samples_left = stats.beta.rvs(a=5, b=2, size=100000)
+samples_left = stats.beta.rvs(a=5, b=2, size=n_draws, random_state=rng)
 mean_left = np.mean(samples_left)
 median_left = np.median(samples_left)
 mode_left = x_left[np.argmax(y_left)]
@@ -98,7 +100,7 @@ ax3.annotate('', xy=(0.1, 0.1), xytext=(0.4, 0.1),
 ax3.text(0.25, 0.18, 'tail pulls\nmean left', ha='center', fontsize=9, color='#7f8c8d')
 
 plt.tight_layout()
-plt.savefig('skewed_distributions.png', dpi=150, bbox_inches='tight', 
+save_figure('skewed_distributions.png', dpi=150, bbox_inches='tight', 
             facecolor='white', edgecolor='none')
 plt.close()
 
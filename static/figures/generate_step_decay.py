@@ -3,10 +3,10 @@
 
 import matplotlib.pyplot as plt
 import numpy as np
+from figure_io import save_figure
+from figure_style import use_style
 
-plt.rcParams['figure.dpi'] = 150
-plt.rcParams['savefig.dpi'] = 150
-plt.rcParams['font.size'] = 12
+use_style('hidpi', rc={'font.size': 12})
 
 fig, ax = plt.subplots(figsize=(8, 5))
 
@@ -49,7 +49,7 @@ ax.text(75, 0.05, 'Divide by 10\nat epochs\n30, 60, 90',
         bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.9))
 
 plt.tight_layout()
-plt.savefig('step_decay_schedule.png', bbox_inches='tight', facecolor='white')
+save_figure('step_decay_schedule.png', bbox_inches='tight', facecolor='white')
 plt.close()
 
 print("Generated step_decay_schedule.png")
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Generate full encoder-decoder transformer architecture diagram (pre-norm residual sublayers)."""
+
+import matplotlib.pyplot as plt
+from figure_diagram import Diagram
+from figure_io import save_figure
+from figure_style import use_style
+
+use_style('hidpi')
+
+fig, ax = plt.subplots(figsize=(10, 12))
+
+STYLES = {
+    'plain': dict(shape='box', width=2.8, height=0.8, boxstyle='round,pad=0.05,rounding_size=0.1',
+                  facecolor='white', edgecolor='black', linewidth=1.8, fontsize=11),
+    'norm': dict(shape='box', width=2.8, height=0.45, boxstyle='round,pad=0.05,rounding_size=0.08',
+                 facecolor='#d5e8d4', edgecolor='#82b366', linewidth=1.8, fontsize=11),
+    'attention': dict(shape='box', width=2.8, height=0.8, boxstyle='round,pad=0.05,rounding_size=0.12',
+                      facecolor='#dae8fc', edgecolor='#6c8ebf', linewidth=1.8, fontsize=11),
+    'masked': dict(shape='box', width=2.8, height=1.1, boxstyle='round,pad=0.05,rounding_size=0.12',
+                   facecolor='#f8cecc', edgecolor='#b85450', linewidth=1.8, fontsize=11),
+    'ffn': dict(shape='box', width=2.8, height=0.8, boxstyle='round,pad=0.05,rounding_size=0.12',
+                facecolor='#fff2cc', edgecolor='#d6b656', linewidth=1.8, fontsize=11),
+    'add': dict(shape='circle', radius=0.28, facecolor='white', edgecolor='black', linewidth=1.8, fontsize=13),
+    'wave': dict(shape='circle', radius=0.3, facecolor='white', edgecolor='black', linewidth=1.8, fontsize=20,
+                 fontweight='normal'),
+    'sublayer': dict(shape='box', boxstyle='round,pad=0,rounding_size=0.35', facecolor='none',
+                     edgecolor='black', linewidth=1.5, linestyle='--', zorder=1),
+    'stack': dict(shape='box', boxstyle='round,pad=0,rounding_size=0.5', facecolor='none', linewidth=2, zorder=1),
+    'edge': dict(color='black', linewidth=1.8),
+    'residual': dict(color='black', linewidth=1.8, shrink=0.0, gap=0.04),
+}
+
+diagram = Diagram(STYLES)
+HEADS = (('V', -0.7), ('K', 0.0), ('Q', 0.7))
+
+
+def bottom(name):
+    """y of the lower outline of a box node."""
+    (_, y), _, props = diagram.nodes[name]
+    return y - props['height'] / 2 - 0.05
+
+
+def input_label(x, y, text):
+    ax.text(x, y, text, ha='center', va='center', fontsize=9, fontweight='bold', zorder=4,
+            bbox=dict(boxstyle='square,pad=0.05', facecolor='white', edgecolor='none'))
+
+
+def sublayer(prefix, x, branch_y, label, style, attention=None):
+    """Norm -> body -> (+) with the residual around them; returns the name of the (+) node.
+
+    attention is None for a feed-forward body, 'self' to feed V, K and Q
+    from the norm, or 'cross' to feed only Q (V and K come from the encoder).
+    """
+    norm = diagram.node(f'{prefix}_norm', (x, branch_y + 0.6), 'Norm', style='norm')
+    height = STYLES[style]['height']
+    body_y = branch_y + 0.6 + 0.275 + (1.2 if attention else 0.55) + height / 2
+    body = diagram.node(prefix, (x, body_y), label, style=style)
+    fork_y = branch_y + 0.6 + 0.55
+    if attention is None:
+        diagram.edge(norm, body)
+    for head, dx in HEADS:
+        if attention == 'self' or (attention == 'cross' and head == 'Q'):
+            diagram.edge(norm, (x + dx, bottom(body)), via=[(x, fork_y), (x + dx, fork_y)] if dx else ())
+        if attention:
+            input_label(x + dx, bottom(body) - 0.4, head)
+
+    add_y = body_y + height / 2 + 0.75
+    add = diagram.node(f'{prefix}_add', (x, add_y), '+', style='add')
+    diagram.edge(body, add)
+    diagram.edge((x, branch_y), add, style='residual', via=[(x + 1.75, branch_y), (x + 1.75, add_y)])
+    diagram.node(f'{prefix}_box', (x, (branch_y + add_y) / 2 + 0.1), style='sublayer', width=3.9,
+                 height=add_y - branch_y + 0.7)
+    return add
+
+
+def embedding(prefix, x, label, encoding_side):
+    """Input sequence -> embeddings -> (+) positional encoding; returns the name of the (+) node."""
+    ax.text(x, 0.15, label, ha='center', va='top', fontsize=11, fontweight='bold')
+    embed = diagram.node(f'{prefix}_embed', (x, 1.25), 'Embeddings/\nProjections', style='plain')
+    diagram.edge((x, 0.2), embed)
+    add = diagram.node(f'{prefix}_pos', (x, 2.45), '+', style='add')
+    wave = diagram.node(f'{prefix}_wave', (x + 1.25 * encoding_side, 2.45), '∼', style='wave')
+    ax.text(x + 1.7 * encoding_side, 2.45, 'Positional\nEncoding', ha='left' if encoding_side > 0 else 'right',
+            va='center', fontsize=11, fontweight='bold')
+    diagram.edge(embed, add)
+    diagram.edge(wave, add)
+    return add
+
+
+def stack(prefix, x, first_y, top_y, color, label_side):
+    """Container around the repeated sublayers, labelled Nx on one side."""
+    diagram.node(f'{prefix}_stack', (x, (first_y + top_y) / 2), style='stack', width=4.3,
+                 height=top_y - first_y, edgecolor=color)
+    ax.text(x + 2.6 * label_side, (first_y + top_y) / 2, 'Nx\n"Layers"', ha='left' if label_side > 0 else 'right',
+            va='center', fontsize=11, fontweight='bold')
+
+
+# === Encoder ===
+enc_x, dec_x = 4.0, 11.0
+previous = embedding('enc', enc_x, 'Source Sequence', -1)
+branch_y = 3.2
+for prefix, label, style, attention in [('enc_attn', 'Multi-Headed\nSelf-Attention', 'attention', 'self'),
+                                        ('enc_ffn', 'Feed-Forward\nNetwork', 'ffn', None)]:
+    add = sublayer(prefix, enc_x, branch_y, label, style, attention)
+    diagram.edge(previous, f'{prefix}_norm')
+    previous, branch_y = add, diagram.nodes[add][0][1] + 0.6
+stack('enc', enc_x, 2.8, branch_y - 0.05, '#d79b00', -1)
+enc_out = diagram.node('enc_norm', (enc_x, branch_y + 0.5), 'Norm', style='norm')
+diagram.edge(previous, enc_out)
+
+# === Decoder ===
+previous = embedding('dec', dec_x, 'Shifted\nTarget Sequence', 1)
+branch_y = 3.2
+for prefix, label, style, attention in [('dec_self', 'Masked\nMulti-Headed\nSelf-Attention', 'masked', 'self'),
+                                        ('dec_cross', 'Multi-Headed\nCross-Attention', 'attention', 'cross'),
+                                        ('dec_ffn', 'Feed-Forward\nNetwork', 'ffn', None)]:
+    add = sublayer(prefix, dec_x, branch_y, label, style, attention)
+    diagram.edge(previous, f'{prefix}_norm')
+    previous, branch_y = add, diagram.nodes[add][0][1] + 0.6
+stack('dec', dec_x, 2.8, branch_y - 0.05, '#82b366', 1)
+dec_norm = diagram.node('dec_norm', (dec_x, branch_y + 0.5), 'Norm', style='norm')
+linear = diagram.node('linear', (dec_x, branch_y + 1.6), 'Linear', style='plain', height=0.45)
+diagram.edge(previous, dec_norm)
+diagram.edge(dec_norm, linear)
+diagram.edge(linear, (dec_x, branch_y + 2.45))
+ax.text(dec_x, branch_y + 2.5, 'Predictions', ha='center', va='bottom', fontsize=11, fontweight='bold')
+
+# Encoder output feeds V and K of every decoder cross-attention
+memory_y = diagram.nodes['dec_cross_norm'][0][1] + 0.85
+over_y = diagram.nodes['enc_norm'][0][1] + 0.8
+for head, dx in HEADS[:2]:
+    diagram.edge(enc_out, (dec_x + dx, bottom('dec_cross')),
+                 via=[(enc_x, over_y), ((enc_x + dec_x) / 2, over_y), ((enc_x + dec_x) / 2, memory_y),
+                      (dec_x + dx, memory_y)])
+
+diagram.draw(ax)
+
+ax.set_xlim(-0.5, 15.5)
+ax.set_ylim(-0.6, branch_y + 3.0)
+ax.set_aspect('equal')
+ax.axis('off')
+
+plt.tight_layout()
+save_figure('transformer_full_architecture.png', bbox_inches='tight', facecolor='white')
+plt.close()
+
+print("Generated transformer_full_architecture.png")
@@ -6,12 +6,11 @@ Shows the null and alternative hypothesis distributions with error regions
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy import stats
+from figure_io import save_figure
+from figure_style import use_style
 
 # Set style
-plt.style.use('seaborn-v0_8-whitegrid')
-plt.rcParams['font.size'] = 11
-plt.rcParams['axes.labelsize'] = 12
-plt.rcParams['axes.titlesize'] = 13
+use_style('whitegrid', 'labels')
 
 fig, axes = plt.subplots(1, 2, figsize=(14, 5))
 
@@ -129,7 +128,7 @@ fig.text(0.5, 0.01,
          'Memory Trick: Type I = "False Alarm" (rejected true $H_0$)  •  Type II = "Missed Detection" (failed to reject false $H_0$)',
          ha='center', fontsize=10, style='italic', 
          bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
-plt.savefig('ml-notes/figures/type1_type2_errors.png', dpi=150, bbox_inches='tight', 
+save_figure('type1_type2_errors.png', dpi=150, bbox_inches='tight', 
             facecolor='white', edgecolor='none')
 plt.close()
 
@@ -5,20 +5,27 @@ Shows why He/Xavier initialization values are what they are.
 
 import matplotlib.pyplot as plt
 import numpy as np
+from figure_io import save_figure
+from figure_quality import scaled
+from figure_seeds import figure_rng
+from figure_style import use_style
+
+# Set style
+use_style()
 
 # Set up the figure
 fig, axes = plt.subplots(2, 2, figsize=(14, 10))
 
-np.random.seed(42)
+rng = figure_rng('variance_propagation')
 
 # Simulate variance propagation through layers
 def simulate_forward_pass(n_layers, n_neurons, init_std, activation='relu'):
     """Simulate forward pass and track activation statistics."""
-    x = np.random.randn(1000, n_neurons)  # Input batch
+    x = rng.standard_normal((scaled(1000, minimum=100), n_neurons))  # Input batch
     variances = [np.var(x)]
     
     for _ in range(n_layers):
-        W = np.random.randn(n_neurons, n_neurons) * init_std
+        W = rng.standard_normal((n_neurons, n_neurons)) * init_std
         x = x @ W
         
         if activation == 'relu':
@@ -135,7 +142,7 @@ ax4.text(0.02, 0.95, summary_text, transform=ax4.transAxes, fontsize=10,
 
 plt.suptitle('Why He and Xavier Initialization Values?', fontsize=14, fontweight='bold')
 plt.tight_layout()
-plt.savefig('variance_propagation.png', dpi=150, bbox_inches='tight',
+save_figure('variance_propagation.png', dpi=150, bbox_inches='tight',
             facecolor='white', edgecolor='none')
 plt.close()
 
@@ -3,10 +3,10 @@
 
 import matplotlib.pyplot as plt
 import numpy as np
+from figure_io import save_figure
+from figure_style import use_style
 
-plt.rcParams['figure.dpi'] = 150
-plt.rcParams['savefig.dpi'] = 150
-plt.rcParams['font.size'] = 12
+use_style('hidpi', rc={'font.size': 12})
 
 fig, ax = plt.subplots(figsize=(8, 5))
 
@@ -58,7 +58,7 @@ ax.grid(True, alpha=0.3)
 ax.ticklabel_format(axis='y', style='scientific', scilimits=(0,0))
 
 plt.tight_layout()
-plt.savefig('warmup_schedule.png', bbox_inches='tight', facecolor='white')
+save_figure('warmup_schedule.png', bbox_inches='tight', facecolor='white')
 plt.close()
 
 print("Generated warmup_schedule.png")
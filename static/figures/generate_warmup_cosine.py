@@ -3,10 +3,10 @@
 
 import matplotlib.pyplot as plt
 import numpy as np
+from figure_io import save_figure
+from figure_style import use_style
 
-plt.rcParams['figure.dpi'] = 150
-plt.rcParams['savefig.dpi'] = 150
-plt.rcParams['font.size'] = 12
+use_style('hidpi', rc={'font.size': 12})
 
 fig, ax = plt.subplots(figsize=(10, 5))
 
@@ -86,7 +86,7 @@ ax.text(total_steps * 0.75, max_lr * 0.55,
         bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.9))
 
 plt.tight_layout()
-plt.savefig('warmup_cosine_schedule.png', bbox_inches='tight', facecolor='white')
+save_figure('warmup_cosine_schedule.png', bbox_inches='tight', facecolor='white')
 plt.close()
 
 print("Generated warmup_cosine_schedule.png")
@@ -5,32 +5,25 @@ Shows Skip-gram and CBOW architectures for learning word embeddings.
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
-from matplotlib.patches import Rectangle, FancyBboxPatch, Circle, FancyArrowPatch
 import numpy as np
+from figure_diagram import Diagram
+from figure_io import save_figure
+from figure_style import use_style
+
+# Set style
+use_style()
 
 # Set up the figure
 fig, axes = plt.subplots(1, 2, figsize=(14, 7))
 
-def draw_word_box(ax, x, y, word, color='#E3F2FD'):
-    """Draw a box representing a word."""
-    rect = FancyBboxPatch((x - 0.4, y - 0.2), 0.8, 0.4,
-                          boxstyle="round,pad=0.02,rounding_size=0.1",
-                          facecolor=color, edgecolor='#424242', linewidth=1.5)
-    ax.add_patch(rect)
-    ax.text(x, y, word, ha='center', va='center', fontsize=10, fontweight='bold')
-
-def draw_layer(ax, x, y, label, color='#FFF9C4'):
-    """Draw a layer box."""
-    rect = FancyBboxPatch((x - 0.5, y - 0.3), 1.0, 0.6,
-                          boxstyle="round,pad=0.02,rounding_size=0.1",
-                          facecolor=color, edgecolor='#424242', linewidth=1.5)
-    ax.add_patch(rect)
-    ax.text(x, y, label, ha='center', va='center', fontsize=9)
-
-def draw_arrow(ax, x1, y1, x2, y2, color='#616161'):
-    """Draw an arrow."""
-    ax.annotate('', xy=(x2, y2), xytext=(x1, y1),
-                arrowprops=dict(arrowstyle='->', color=color, lw=1.5))
+STYLES = {
+    'word': dict(shape='box', width=0.8, height=0.4, boxstyle='round,pad=0.02,rounding_size=0.1',
+                 facecolor='#E3F2FD', fontsize=10),
+    'layer': dict(shape='box', width=1.0, height=0.6, boxstyle='round,pad=0.02,rounding_size=0.1',
+                  facecolor='#FFF9C4', fontsize=9, fontweight='normal'),
+    'hidden': dict(shape='circle', radius=0.25, facecolor='#C8E6C9', fontsize=10),
+    'edge': dict(color='#616161', linewidth=1.5),
+}
 
 # Left plot: Skip-gram
 ax1 = axes[0]
@@ -39,34 +32,26 @@ ax1.set_ylim(-0.5, 5)
 ax1.set_aspect('equal')
 ax1.axis('off')
 ax1.set_title('Skip-gram: Predict Context from Word', fontsize=12, fontweight='bold', pad=15)
+skip_gram = Diagram(STYLES)
 
-# Input word
-draw_word_box(ax1, 0.5, 2.5, '"cat"', color='#BBDEFB')
+# Input word -> embedding -> hidden representation
+skip_gram.node('input', (0.5, 2.5), '"cat"', style='word', facecolor='#BBDEFB')
 ax1.text(0.5, 3.3, 'Input\nWord', ha='center', va='center', fontsize=9, color='#424242')
-
-# Embedding layer
-draw_layer(ax1, 2.5, 2.5, 'Embedding\n(V × d)', color='#FFF9C4')
-
-# Hidden representation
-ax1.add_patch(Circle((4, 2.5), 0.25, facecolor='#C8E6C9', edgecolor='#424242', linewidth=1.5))
-ax1.text(4, 2.5, 'h', ha='center', va='center', fontsize=10, fontweight='bold')
+skip_gram.node('embedding', (2.5, 2.5), 'Embedding\n(V × d)', style='layer')
+skip_gram.node('h', (4, 2.5), 'h', style='hidden')
 ax1.text(4, 3.1, 'Hidden\n(d dims)', ha='center', va='center', fontsize=8, color='#424242')
+skip_gram.edge('input', 'embedding')
+skip_gram.edge('embedding', 'h')
 
 # Output words (context)
 output_words = [(5.5, 4), (5.5, 2.5), (5.5, 1)]
 output_labels = ['"the"', '"sat"', '"on"']
 
 for (x, y), label in zip(output_words, output_labels):
-    draw_word_box(ax1, x, y, label, color='#FFCDD2')
+    skip_gram.edge('h', skip_gram.node(label, (x, y), label, style='word', facecolor='#FFCDD2'))
 
 ax1.text(5.5, 4.8, 'Context Words\n(predict)', ha='center', va='center', fontsize=9, color='#424242')
-
-# Arrows
-draw_arrow(ax1, 1, 2.5, 1.9, 2.5)
-draw_arrow(ax1, 3.1, 2.5, 3.7, 2.5)
-draw_arrow(ax1, 4.3, 2.7, 5, 3.8)
-draw_arrow(ax1, 4.3, 2.5, 5, 2.5)
-draw_arrow(ax1, 4.3, 2.3, 5, 1.2)
+skip_gram.draw(ax1)
 
 # Right plot: CBOW
 ax2 = axes[1]
@@ -75,34 +60,26 @@ ax2.set_ylim(-0.5, 5)
 ax2.set_aspect('equal')
 ax2.axis('off')
 ax2.set_title('CBOW: Predict Word from Context', fontsize=12, fontweight='bold', pad=15)
+cbow = Diagram(STYLES)
 
 # Input context words
 input_words = [(0.5, 4), (0.5, 2.5), (0.5, 1)]
 input_labels = ['"the"', '"sat"', '"on"']
 
+cbow.node('embedding', (2.5, 2.5), 'Embed &\nAverage', style='layer')
 for (x, y), label in zip(input_words, input_labels):
-    draw_word_box(ax2, x, y, label, color='#BBDEFB')
+    cbow.edge(cbow.node(label, (x, y), label, style='word', facecolor='#BBDEFB'), 'embedding')
 
 ax2.text(0.5, 4.8, 'Context Words\n(input)', ha='center', va='center', fontsize=9, color='#424242')
 
-# Embedding + Average
-draw_layer(ax2, 2.5, 2.5, 'Embed &\nAverage', color='#FFF9C4')
-
-# Hidden representation
-ax2.add_patch(Circle((4, 2.5), 0.25, facecolor='#C8E6C9', edgecolor='#424242', linewidth=1.5))
-ax2.text(4, 2.5, 'h', ha='center', va='center', fontsize=10, fontweight='bold')
+# Hidden representation -> target word
+cbow.node('h', (4, 2.5), 'h', style='hidden')
 ax2.text(4, 3.1, 'Hidden\n(d dims)', ha='center', va='center', fontsize=8, color='#424242')
-
-# Output word
-draw_word_box(ax2, 5.5, 2.5, '"cat"', color='#FFCDD2')
+cbow.node('target', (5.5, 2.5), '"cat"', style='word', facecolor='#FFCDD2')
 ax2.text(5.5, 3.3, 'Target Word\n(predict)', ha='center', va='center', fontsize=9, color='#424242')
-
-# Arrows
-draw_arrow(ax2, 1, 3.8, 1.9, 2.7)
-draw_arrow(ax2, 1, 2.5, 1.9, 2.5)
-draw_arrow(ax2, 1, 1.2, 1.9, 2.3)
-draw_arrow(ax2, 3.1, 2.5, 3.7, 2.5)
-draw_arrow(ax2, 4.3, 2.5, 5, 2.5)
+cbow.edge('embedding', 'h')
+cbow.edge('h', 'target')
+cbow.draw(ax2)
 
 # Add explanation at bottom
 explanation = """
@@ -118,7 +95,7 @@ fig.text(0.5, 0.02, explanation, ha='center', fontsize=10, color='#424242',
          wrap=True)
 
 plt.tight_layout(rect=[0, 0.18, 1, 0.95])
-plt.savefig('word2vec_architecture.png', dpi=150, bbox_inches='tight',
+save_figure('word2vec_architecture.png', dpi=150, bbox_inches='tight',
             facecolor='white', edgecolor='none')
 plt.close()
 
@@ -3,11 +3,11 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.patches import FancyArrowPatch
+from figure_diagram import Diagram
+from figure_io import save_figure
+from figure_style import use_style
 
-plt.rcParams['figure.dpi'] = 150
-plt.rcParams['savefig.dpi'] = 150
-plt.rcParams['font.size'] = 11
+use_style('hidpi', rc={'font.size': 11})
 
 # XOR data
 X = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
@@ -55,29 +55,22 @@ ax2.axis('off')
 ax2.set_xlim(0, 10)
 ax2.set_ylim(-2, 12)  # Expanded to accommodate text boxes
 
-# Draw neurons
-# Input layer
-ax2.add_patch(plt.Circle((2, 7), 0.4, color='lightblue', ec='black', lw=2))
-ax2.text(2, 7, '$x_1$', ha='center', va='center', fontsize=12, fontweight='bold')
-ax2.add_patch(plt.Circle((2, 3), 0.4, color='lightblue', ec='black', lw=2))
-ax2.text(2, 3, '$x_2$', ha='center', va='center', fontsize=12, fontweight='bold')
+network = Diagram({
+    'neuron': dict(shape='circle', radius=0.5, edgecolor='black', linewidth=2, fontsize=12),
+    'edge': dict(color='gray', linewidth=1.5),
+})
 
-# Hidden layer
-ax2.add_patch(plt.Circle((5, 8), 0.5, color='lightgreen', ec='black', lw=2))
-ax2.text(5, 8, '$h_1$', ha='center', va='center', fontsize=12, fontweight='bold')
-ax2.add_patch(plt.Circle((5, 2), 0.5, color='lightgreen', ec='black', lw=2))
-ax2.text(5, 2, '$h_2$', ha='center', va='center', fontsize=12, fontweight='bold')
-
-# Output
-ax2.add_patch(plt.Circle((8, 5), 0.5, color='lightyellow', ec='black', lw=2))
-ax2.text(8, 5, '$y$', ha='center', va='center', fontsize=12, fontweight='bold')
+# Neurons: input layer, hidden layer, output
+network.node('x1', (2, 7), '$x_1$', style='neuron', radius=0.4, facecolor='lightblue')
+network.node('x2', (2, 3), '$x_2$', style='neuron', radius=0.4, facecolor='lightblue')
+network.node('h1', (5, 8), '$h_1$', style='neuron', facecolor='lightgreen')
+network.node('h2', (5, 2), '$h_2$', style='neuron', facecolor='lightgreen')
+network.node('y', (8, 5), '$y$', style='neuron', facecolor='lightyellow')
 
 # Connections
-for x1, y1, x2, y2 in [(2.4, 7, 4.5, 8), (2.4, 3, 4.5, 8), 
-                       (2.4, 7, 4.5, 2), (2.4, 3, 4.5, 2),
-                       (5.5, 8, 7.5, 5.2), (5.5, 2, 7.5, 4.8)]:
-    ax2.annotate('', xy=(x2, y2), xytext=(x1, y1),
-                 arrowprops=dict(arrowstyle='->', color='gray', lw=1.5))
+for start, end in [('x1', 'h1'), ('x2', 'h1'), ('x1', 'h2'), ('x2', 'h2'), ('h1', 'y'), ('h2', 'y')]:
+    network.edge(start, end)
+network.draw(ax2)
 
 # Add equations - positioned to avoid overlapping with neurons
 ax2.text(5, 11, '$h_1 = \\mathrm{ReLU}(x_1 + x_2 - 0.5)$\n"At least one input is 1"', 
@@ -131,7 +124,7 @@ fig.text(0.5, -0.02,
          bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.8))
 
 plt.tight_layout()
-plt.savefig('xor_transformation.png', bbox_inches='tight', facecolor='white')
+save_figure('xor_transformation.png', bbox_inches='tight', facecolor='white')
 plt.close()
 
 print("Generated xor_transformation.png")
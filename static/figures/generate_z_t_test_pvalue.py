@@ -6,12 +6,11 @@ Shows t-distribution convergence, p-value interpretation, and one/two-tailed tes
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy import stats
+from figure_io import save_figure
+from figure_style import use_style
 
 # Set style
-plt.style.use('seaborn-v0_8-whitegrid')
-plt.rcParams['font.size'] = 10
-plt.rcParams['axes.labelsize'] = 11
-plt.rcParams['axes.titlesize'] = 12
+use_style('whitegrid', rc={'axes.labelsize': 11, 'axes.titlesize': 12})
 
 fig, axes = plt.subplots(1, 3, figsize=(15, 4.5))
 
@@ -148,7 +147,7 @@ ax.text(0.98, 0.98, textstr, transform=ax.transAxes, fontsize=8,
         verticalalignment='top', ha='right', bbox=props)
 
 plt.tight_layout()
-plt.savefig('ml-notes/figures/z_t_test_pvalue.png', dpi=150, bbox_inches='tight',
+save_figure('z_t_test_pvalue.png', dpi=150, bbox_inches='tight',
             facecolor='white', edgecolor='none')
 plt.close()
 
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Warm render daemon with hot reload
+
+PURPOSE:
+--------
+A cold `python generate_x.py` spends ~2 s importing matplotlib, NumPy and
+SciPy and loading the font cache before it draws anything. The daemon pays
+that once: it imports everything the generators use, warms the font list,
+project styles and mathtext caches, then waits for work. Each render runs in a forked child,
+which inherits the warm interpreter, executes the (re-read) script and exits,
+so edits to a script are always picked up and one figure's globals, rcParams
+or leaked figures never reach the next.
+
+Work arrives two ways:
+    - file watching: saving static/figures/generate_*.py re-renders the
+      figures that script produces (inotify on Linux, mtime polling elsewhere).
+      Saving a figure_*.py helper drops it and every helper that imports it
+      from the daemon's modules, warms them up again and re-renders the
+      figures whose scripts import any of them
+    - a Unix socket in the build cache, driven by the client commands below
+
+USAGE:
+------
+    cd static/figures
+    python render_daemon.py serve [--output DIR] [--no-watch] [--draft]   # foreground
+    python render_daemon.py render mcmc clt [--draft]                     # from another shell
+    python render_daemon.py ping
+    python render_daemon.py stop
+
+REQUIREMENTS:
+-------------
+    Unix (fork + Unix sockets); inotify is used through libc when available.
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import json
+import os
+import selectors
+import socket
+import struct
+import sys
+import time
+import traceback
+from pathlib import Path
+
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+from figure_registry import FIGURES_DIR, cache_dir, discover, module_imports, select
+from figure_style import use_build_cache
+
+use_build_cache()
+
+WATCH_PATTERNS = ('generate_*.py', 'figure_*.py')
+HELPER_PATTERN = 'figure_*.py'
+DEBOUNCE = 0.05     # seconds to gather the burst of events an editor save produces
+POLL_INTERVAL = 0.5  # mtime polling when inotify is unavailable
+
+IN_CLOSE_WRITE, IN_MOVED_TO = 0x008, 0x080
+INOTIFY_EVENT = struct.Struct('iIII')
+
+
+def socket_path():
+    return cache_dir('daemon') / 'render.sock'
+
+
+class Watcher:
+    """Reports generate_*.py and figure_*.py files in FIGURES_DIR that were written since the last call."""
+
+    def __init__(self):
+        self.fd = None
+        libc_name = ctypes.util.find_library('c')
+        libc = ctypes.CDLL(libc_name, use_errno=True) if libc_name else None
+        if libc is not None and hasattr(libc, 'inotify_init1'):
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd >= 0 and libc.inotify_add_watch(fd, str(FIGURES_DIR).encode(), IN_CLOSE_WRITE | IN_MOVED_TO) >= 0:
+                self.fd = fd
+        self.mtimes = self._mtimes()
+
+    @property
+    def mode(self):
+        return 'inotify' if self.fd is not None else 'polling'
+
+    def _mtimes(self):
+        return {p.name: p.stat().st_mtime_ns for pattern in WATCH_PATTERNS for p in FIGURES_DIR.glob(pattern)}
+
+    def _read_events(self):
+        names = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return names
+            offset = 0
+            while offset < len(data):
+                _, _, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+                offset += INOTIFY_EVENT.size
+                names.add(data[offset:offset + length].rstrip(b'\0').decode())
+                offset += length
+
+    def changed(self):
+        """Names of watched scripts modified since the previous call."""
+        if self.fd is not None:
+            time.sleep(DEBOUNCE)
+            return sorted(n for n in self._read_events() if any(Path(n).match(p) for p in WATCH_PATTERNS))
+        mtimes = self._mtimes()
+        changed = sorted(n for n, m in mtimes.items() if self.mtimes.get(n) != m)
+        self.mtimes = mtimes
+        return changed
+
+
+def warm_up():
+    """Import everything the generators import and prime the font/mathtext caches; returns seconds."""
+    import io
+
+    from figure_runner import preload
+    from figure_style import warm_up as warm_style
+
+    start = time.perf_counter()
+    warm_style()
+    for job in discover():
+        try:
+            preload(job)
+        except ImportError as err:
+            print(f"⚠ {job.key}: {err}")
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=(2, 1))
+    fig.text(0.1, 0.5, r'Warm-up αβγ $\sigma(z) = \frac{1}{1+e^{-z}}$', fontweight='bold')
+    fig.savefig(io.BytesIO(), format='png')
+    plt.close(fig)
+    return time.perf_counter() - start
+
+
+def stale_helpers(changed):
+    """Module names of the changed helpers and of every helper that imports one of them, directly or not."""
+    graph = {}
+    for path in FIGURES_DIR.glob(HELPER_PATTERN):
+        try:
+            graph[path.stem] = set(module_imports(path))
+        except SyntaxError:  # caught mid-edit; the next save reports it again
+            graph[path.stem] = set()
+    stale = {Path(name).stem for name in changed}
+    while True:
+        importers = {name for name, imports in graph.items() if imports & stale} - stale
+        if not importers:
+            return stale
+        stale |= importers
+
+
+def reload_helpers(stale):
+    """Forget the stale helper modules and warm up again, so forked renders import the edited code."""
+    global FIGURES_DIR, cache_dir, discover, module_imports, select
+    for name in stale:
+        sys.modules.pop(name, None)
+    from figure_registry import FIGURES_DIR, cache_dir, discover, module_imports, select
+    return warm_up()
+
+
+def render_forked(job, output, env=None):
+    """Render job in a forked child of the warm daemon, with env added to its environment; returns (ok, seconds, error)."""
+    from figure_runner import run_job
+
+    start = time.perf_counter()
+    read_end, write_end = os.pipe()
+    sys.stdout.flush()  # or the child would print the daemon's buffered output again
+    pid = os.fork()
+    if pid == 0:  # child: render, report the error if any, and never return into the daemon loop
+        os.close(read_end)
+        os.environ.update(env or {})
+        code = 0
+        try:
+            run_job(job, output)
+        except BaseException as err:
+            traceback.print_exc()
+            os.write(write_end, f'{type(err).__name__}: {err}'.encode()[:4096])
+            code = 1
+        finally:
+            sys.stdout.flush()
+            os._exit(code)
+    os.close(write_end)
+    _, status = os.waitpid(pid, 0)
+    with os.fdopen(read_end, 'rb') as pipe:
+        error = pipe.read().decode(errors='replace')
+    ok = os.waitstatus_to_exitcode(status) == 0
+    return ok, time.perf_counter() - start, error or (None if ok else f'exit status {status}')
+
+
+class Daemon:
+    def __init__(self, output, watch=True, draft=False):
+        self.output = Path(output)
+        self.watcher = Watcher() if watch else None
+        self.draft = draft
+        self.running = True
+
+    def render(self, jobs, draft=None):
+        draft = self.draft if draft is None else draft
+        output, env = (cache_dir('draft'), {'FIGURES_DRAFT': '1'}) if draft else (self.output, {})
+        results = []
+        for job in jobs:
+            ok, seconds, error = render_forked(job, output, env)
+            print(f"{'✓' if ok else '✗'} {job.name:<32} {seconds * 1000:6.0f} ms{'  ' + error if error else ''}")
+            results.append({'figure': job.name, 'ok': ok, 'seconds': round(seconds, 3), 'error': error})
+        return results
+
+    def on_change(self):
+        scripts = self.watcher.changed()
+        if not scripts:
+            return
+        print(f"↻ {', '.join(scripts)} changed")
+        helpers = [name for name in scripts if Path(name).match(HELPER_PATTERN)]
+        stale = stale_helpers(helpers) if helpers else set()
+        if stale:
+            try:
+                print(f"✓ Reloaded {', '.join(sorted(stale))} in {reload_helpers(stale):.2f}s")
+            except Exception as err:  # the renders below report it again, per figure
+                print(f"✗ Reloading {', '.join(sorted(stale))} failed: {type(err).__name__}: {err}")
+        try:
+            jobs = discover()
+        except SystemExit as err:  # two scripts writing the same file, say mid-rename
+            print(f"✗ {err}")
+            return
+        self.render([job for job in jobs if job.script.name in scripts or stale & set(job.imports)])
+
+    def handle(self, conn):
+        with conn, conn.makefile('rwb') as stream:
+            try:
+                request = json.loads(stream.readline() or b'{}')
+                command = request.get('command')
+                if command == 'render':
+                    reply = {'results': self.render(select(request.get('figures', [])), request.get('draft'))}
+                elif command == 'ping':
+                    reply = {'pid': os.getpid(), 'output': str(self.output),
+                             'watch': self.watcher.mode if self.watcher else None}
+                elif command == 'stop':
+                    self.running, reply = False, {'stopping': True}
+                else:
+                    reply = {'error': f'unknown command {command!r}'}
+            except SystemExit as err:  # select() reports unknown figure names this way
+                reply = {'error': str(err)}
+            stream.write(json.dumps(reply).encode() + b'\n')
+
+    def serve(self):
+        path = socket_path()
+        path.unlink(missing_ok=True)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(path))
+        server.listen()
+
+        selector = selectors.DefaultSelector()
+        selector.register(server, selectors.EVENT_READ, 'client')
+        if self.watcher and self.watcher.fd is not None:
+            selector.register(self.watcher.fd, selectors.EVENT_READ, 'watch')
+        polling = self.watcher is not None and self.watcher.fd is None
+
+        print(f"✓ Warm in {warm_up():.2f}s; rendering into {self.output}")
+        print(f"✓ Listening on {path}" + (f" and watching {', '.join(WATCH_PATTERNS)} ({self.watcher.mode})" if self.watcher else ''))
+        try:
+            while self.running:
+                events = selector.select(POLL_INTERVAL if polling else None)
+                for key, _ in events:
+                    if key.data == 'client':
+                        self.handle(server.accept()[0])
+                    else:
+                        self.on_change()
+                if polling:
+                    self.on_change()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
+            path.unlink(missing_ok=True)
+        print("✓ Daemon stopped")
+
+
+def request(payload):
+    """Send one command to the running daemon and return its reply."""
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(str(socket_path()))
+    except (FileNotFoundError, ConnectionRefusedError):
+        raise SystemExit("✗ No render daemon running (start one with: python render_daemon.py serve)")
+    with client, client.makefile('rwb') as stream:
+        stream.write(json.dumps(payload).encode() + b'\n')
+        stream.flush()
+        return json.loads(stream.readline())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Warm figure render daemon.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    serve = commands.add_parser('serve', help='run the daemon in the foreground')
+    serve.add_argument('--output', help='directory figures are written to (default: $FIGURES_OUTPUT or static/figures)')
+    serve.add_argument('--no-watch', action='store_true', help='only render on request')
+    serve.add_argument('--draft', action='store_true', help='render draft previews into the build cache by default')
+    render = commands.add_parser('render', help='ask the daemon to render figures')
+    render.add_argument('figures', nargs='+', help='figure names or keys')
+    render.add_argument('--draft', action='store_true', default=None, help='render a draft preview')
+    commands.add_parser('ping', help='check that the daemon is running')
+    commands.add_parser('stop', help='shut the daemon down')
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        from figure_io import output_root
+        Daemon(Path(args.output or output_root()).resolve(), watch=not args.no_watch, draft=args.draft).serve()
+        return
+
+    reply = request({'command': args.command, 'figures': getattr(args, 'figures', []),
+                     'draft': getattr(args, 'draft', None)})
+    if 'error' in reply:
+        raise SystemExit(f"✗ {reply['error']}")
+    if args.command != 'render':
+        print(json.dumps(reply))
+        return
+    for result in reply['results']:
+        mark = '✓' if result['ok'] else '✗'
+        print(f"{mark} {result['figure']:<32} {result['seconds'] * 1000:6.0f} ms"
+              + (f"  {result['error']}" if result['error'] else ''))
+    if not all(result['ok'] for result in reply['results']):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
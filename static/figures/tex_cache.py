@@ -0,0 +1,44 @@
+"""
+Persistent, shared cache for usetex rendering.
+
+With text.usetex every label is typeset by a latex run and rasterized by a
+dvipng run. matplotlib's TexManager already stores both results under a hash
+of the label's full TeX source (expression, preamble, font size) plus the
+DPI, writing them atomically so concurrent processes can share them. By
+default that store sits in the per-user matplotlib cache, though, which is
+empty on every fresh build container. configure() moves it into the build
+cache (figures/tex/), so it persists with the rest of the build cache and
+all parallel workers read and fill the same entries.
+
+When latex or dvipng is missing, figure_quality.tex_rc() falls back to
+mathtext with the Computer Modern fontset instead of failing the build.
+"""
+
+import functools
+import shutil
+
+from figure_registry import cache_dir
+
+TEX_TOOLS = ('latex', 'dvipng')
+
+
+@functools.lru_cache(maxsize=None)
+def missing_tools():
+    """TeX programs usetex needs that are not on PATH."""
+    return tuple(tool for tool in TEX_TOOLS if shutil.which(tool) is None)
+
+
+def tex_available():
+    return not missing_tools()
+
+
+def configure():
+    """Point matplotlib's usetex DVI/PNG cache at the build cache; returns the directory."""
+    from matplotlib.texmanager import TexManager
+
+    path = cache_dir('tex')
+    if hasattr(TexManager, '_cache_dir'):
+        TexManager._cache_dir = path
+    else:  # matplotlib < 3.9 keeps it as a string class attribute
+        TexManager.texcache = str(path)
+    return path
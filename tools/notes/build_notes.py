@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Post-build pipeline for the ML/AI notes page.
+
+Runs every notes build step, in order, over the copy of ml_ai_notes.html that
+Hugo placed in the site output directory. The committed source page in
+static/ is never modified.
+
+STEPS:
+------
+1. prerender_math.py - TeX -> static SVG, drops the MathJax runtime
+2. highlight_code.py  - Pygments highlighting, drops highlight.js
+3. themed_figures.py  - <picture> with the dark figure variant for dark mode
+4. build_search_index.py - prefix-searchable inverted index + search box
+5. split_chapters.py  - shell page + lazily fetched per-chapter fragments
+
+USAGE:
+------
+    hugo --minify
+    python tools/notes/build_notes.py public
+"""
+
+import argparse
+from pathlib import Path
+
+import build_search_index
+import highlight_code
+import prerender_math
+import split_chapters
+import themed_figures
+from notes_common import PAGE_NAME, read_page, write_page
+
+
+def build(site_dir):
+    page_path = Path(site_dir) / PAGE_NAME
+    page = read_page(page_path)
+    page = prerender_math.prerender(page)
+    page = highlight_code.highlight(page)
+    page = themed_figures.theme_figures(page, site_dir)
+    write_page(page_path, page)
+    build_search_index.add_search(page_path)
+    split_chapters.split(page_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Post-process the ML/AI notes page.')
+    parser.add_argument('site_dir', nargs='?', default='public', help='Hugo output directory (default: public)')
+    args = parser.parse_args()
+    build(args.site_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Precomputed client-side search index for ml_ai_notes.html
+
+PURPOSE:
+--------
+Builds an inverted index over every heading section of the notes (the text
+from one <h1>-<h6 id=...> to the next) so the page can offer search without
+scanning the DOM. Outputs, next to the page:
+
+    ml_ai_notes/search-index.json.gz   gzip blob fetched by search_loader.js
+    ml_ai_notes/search-index.json      same index, for browsers without DecompressionStream
+
+Terms are stored sorted, so the loader answers prefix queries with a binary
+search; postings are delta-encoded [section, tf] pairs. Token counts are
+cached per section by a hash of its text, so a rebuild only re-tokenizes
+sections that changed.
+
+The step also injects the loader and a search box into the sidebar.
+
+USAGE:
+------
+    python tools/notes/build_search_index.py public/ml_ai_notes.html
+"""
+
+import argparse
+import gzip
+import html
+import json
+import re
+import unicodedata
+from collections import Counter
+from pathlib import Path
+
+from notes_common import TOOLS_DIR, cache_dir, cache_get, cache_put, content_hash, read_page, write_page
+
+INDEX_VERSION = '1'
+CONTENT_START = '<div class="content">'
+HEADING = re.compile(r'<h([1-6])\s+id="([^"]+)"[^>]*>(.*?)</h\1>', re.S)
+NON_TEXT = re.compile(r'<(svg|style|script|mjx-container)\b.*?</\1>', re.S)
+TAG = re.compile(r'<[^>]+>')
+TOKEN_SPLIT = re.compile(r'[\W_]+')
+NAV_TITLE = re.compile(r'(<div class="nav-title">.*?</div>)', re.S)
+
+STOPWORDS = sorted({
+    'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'have', 'if', 'in', 'into',
+    'is', 'it', 'its', 'of', 'on', 'or', 'so', 'than', 'that', 'the', 'their', 'then', 'there',
+    'these', 'this', 'to', 'was', 'we', 'were', 'what', 'when', 'which', 'while', 'with', 'you',
+})
+
+SEARCH_BOX = """
+        <input class="notes-search" type="search" placeholder="Search notes…" aria-label="Search notes">
+        <ul class="notes-search-results"></ul>"""
+SEARCH_STYLE = """<style id="notes-search">
+        .notes-search { display: block; width: calc(100% - 40px); margin: 0 20px 10px; padding: 6px 10px;
+            border-radius: 6px; border: 1px solid var(--border-primary); background: var(--bg-secondary);
+            color: var(--text-primary); font-size: 13px; }
+        .sidebar ul.notes-search-results { margin-bottom: 10px; }
+</style>
+"""
+
+
+def plain_text(fragment):
+    return html.unescape(TAG.sub(' ', NON_TEXT.sub(' ', fragment)))
+
+
+def tokenize(text):
+    """Lowercase, strip accents, split on non-alphanumerics; mirrors tokenize() in search_loader.js."""
+    text = unicodedata.normalize('NFKD', text.lower())
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch))
+    return [t for t in TOKEN_SPLIT.split(text) if len(t) > 1 and t not in STOPWORDS]
+
+
+def sections(page):
+    """Yield (anchor, title, text) for every heading section of the page body."""
+    body = page[page.index(CONTENT_START):]
+    headings = list(HEADING.finditer(body))
+    for heading, following in zip(headings, headings[1:] + [None]):
+        end = following.start() if following else len(body)
+        title = ' '.join(plain_text(heading.group(3)).split())
+        yield heading.group(2), title, title + ' ' + plain_text(body[heading.end():end])
+
+
+def build_index(page):
+    """Return (index dict, number of sections re-tokenized)."""
+    cache = cache_dir('notes', f'search-{INDEX_VERSION}')
+    section_list, postings, retokenized = [], {}, 0
+
+    for number, (anchor, title, text) in enumerate(sections(page)):
+        key = content_hash(text)
+        cached = cache_get(cache, key)
+        if cached is None:
+            counts = Counter(tokenize(text))
+            cache_put(cache, key, json.dumps(counts))
+            retokenized += 1
+        else:
+            counts = json.loads(cached)
+        section_list.append([anchor, title])
+        for term, tf in counts.items():
+            postings.setdefault(term, []).append((number, tf))
+
+    terms = sorted(postings)
+    encoded = []
+    for term in terms:
+        flat, previous = [], 0
+        for number, tf in postings[term]:
+            flat += [number - previous, tf]
+            previous = number
+        encoded.append(flat)
+
+    index = {
+        'version': INDEX_VERSION,
+        'sections': section_list,
+        'terms': terms,
+        'df': [len(postings[t]) for t in terms],
+        'postings': encoded,
+        'stopwords': STOPWORDS,
+    }
+    return index, retokenized
+
+
+def add_search(page_path):
+    """Write the index next to page_path and wire the search box into the page."""
+    page_path = Path(page_path)
+    page = read_page(page_path)
+    index, retokenized = build_index(page)
+
+    out_dir = page_path.with_suffix('')
+    blob = json.dumps(index, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / 'search-index.json').write_bytes(blob)
+    (out_dir / 'search-index.json.gz').write_bytes(gzip.compress(blob, mtime=0))
+
+    loader = (TOOLS_DIR / 'search_loader.js').read_text(encoding='utf-8')
+    loader = loader.replace('__INDEX_URL__', f'{out_dir.name}/search-index.json')
+    page = NAV_TITLE.sub(lambda m: m.group(1) + SEARCH_BOX, page, count=1)
+    page = page.replace('</head>', f'{SEARCH_STYLE}<script>\n{loader}</script>\n</head>', 1)
+    write_page(page_path, page)
+
+    print(f"✓ Search: {len(index['sections'])} sections, {len(index['terms'])} terms "
+          f"({retokenized} sections re-tokenized), {len(gzip.compress(blob)) / 1024:.0f} KB gzipped")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('page', help='HTML page to index (normally the copy in public/)')
+    args = parser.parse_args()
+    add_search(args.page)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+// Lazy chapter loader for the split ml_ai_notes.html shell (see split_chapters.py).
+// Chapters are fetched when scrolled near or when an anchor inside them is
+// navigated to; ids.json maps every anchor id to the chapter that holds it.
+(function() {
+    var ID_MAP_URL = '__ID_MAP_URL__';
+    var idMap = null;
+
+    function section(key) {
+        return document.querySelector('.notes-chapter[data-chapter="' + key + '"]');
+    }
+
+    function loadChapter(el) {
+        if (!el || !el.getAttribute('data-src')) return Promise.resolve(el);
+        if (el._loading) return el._loading;
+        el._loading = fetch(el.getAttribute('data-src'))
+            .then(function(response) {
+                if (!response.ok) throw new Error(response.status);
+                return response.text();
+            })
+            .then(function(html) {
+                el.innerHTML = html;
+                el.removeAttribute('data-src');
+                el.style.minHeight = '';
+                // Fallbacks for builds where math/code were not pre-rendered
+                if (window.MathJax && window.MathJax.typesetPromise) window.MathJax.typesetPromise([el]);
+                if (window.hljs) {
+                    var blocks = el.querySelectorAll('pre code');
+                    for (var i = 0; i < blocks.length; i++) window.hljs.highlightElement(blocks[i]);
+                }
+                document.dispatchEvent(new CustomEvent('notes:chapterloaded', { detail: el }));
+                return el;
+            })
+            .catch(function(e) {
+                el._loading = null;
+                throw e;
+            });
+        return el._loading;
+    }
+
+    function chapterOf(id) {
+        if (idMap) return Promise.resolve(idMap[id]);
+        return fetch(ID_MAP_URL)
+            .then(function(response) { return response.json(); })
+            .then(function(map) {
+                idMap = {};
+                for (var key in map) {
+                    for (var i = 0; i < map[key].length; i++) idMap[map[key][i]] = key;
+                }
+                return idMap[id];
+            });
+    }
+
+    // Resolve an anchor that may live in a chapter that has not been fetched yet
+    function goTo(id, push) {
+        if (!id || document.getElementById(id)) return Promise.resolve();
+        return chapterOf(id)
+            .then(function(key) { return loadChapter(section(key)); })
+            .then(function() {
+                var target = document.getElementById(id);
+                if (!target) return;
+                if (push) history.pushState(null, '', '#' + id);
+                target.scrollIntoView();
+            })
+            .catch(function() {});
+    }
+
+    document.addEventListener('click', function(e) {
+        var link = e.target.closest ? e.target.closest('a[href^="#"]') : null;
+        if (!link) return;
+        var id = decodeURIComponent(link.getAttribute('href').slice(1));
+        if (id && !document.getElementById(id)) {
+            e.preventDefault();
+            goTo(id, true);
+        }
+    });
+
+    window.addEventListener('hashchange', function() {
+        goTo(decodeURIComponent(location.hash.slice(1)), false);
+    });
+
+    document.addEventListener('DOMContentLoaded', function() {
+        var chapters = document.querySelectorAll('.notes-chapter[data-src]');
+        if ('IntersectionObserver' in window) {
+            var observer = new IntersectionObserver(function(entries) {
+                for (var i = 0; i < entries.length; i++) {
+                    if (entries[i].isIntersecting) {
+                        observer.unobserve(entries[i].target);
+                        loadChapter(entries[i].target);
+                    }
+                }
+            }, { rootMargin: '150% 0px' });
+            for (var i = 0; i < chapters.length; i++) observer.observe(chapters[i]);
+        } else {
+            for (var j = 0; j < chapters.length; j++) loadChapter(chapters[j]);
+        }
+        goTo(decodeURIComponent(location.hash.slice(1)), false);
+    });
+})();
@@ -0,0 +1,16 @@
+// Dark figure sources for the themed <picture> elements (see themed_figures.py).
+// Without scripts the browser follows prefers-color-scheme; this keeps the
+// figures in step with the page's own theme toggle instead, including in
+// chapters fetched after load.
+(function() {
+    function sync(root) {
+        var dark = document.documentElement.getAttribute('data-theme') === 'dark';
+        var sources = (root || document).querySelectorAll('source[data-dark-figure]');
+        for (var i = 0; i < sources.length; i++) sources[i].media = dark ? 'all' : 'not all';
+    }
+
+    new MutationObserver(function() { sync(); })
+        .observe(document.documentElement, { attributes: true, attributeFilter: ['data-theme'] });
+    document.addEventListener('DOMContentLoaded', function() { sync(); });
+    document.addEventListener('notes:chapterloaded', function(e) { sync(e.detail); });
+})();
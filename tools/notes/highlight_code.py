@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Build-time syntax highlighting for ml_ai_notes.html
+
+PURPOSE:
+--------
+The page used to load highlight.js plus a light and a dark stylesheet from
+cdnjs and run hljs.highlightAll() over all ~450 <pre> blocks on every view.
+This step highlights each fenced block once with Pygments, caches the result
+by a hash of (language, code, Pygments version), and emits one small
+stylesheet whose colours are CSS variables switched by the page's existing
+[data-theme="dark"] selector. The highlight.js scripts and stylesheets are
+removed from the page.
+
+Only blocks pandoc tagged with a language (class="sourceCode python") are
+highlighted; untagged blocks are ASCII diagrams and worked examples and stay
+plain text.
+
+USAGE:
+------
+    python tools/notes/highlight_code.py public/ml_ai_notes.html
+
+REQUIREMENTS:
+-------------
+    pip install -r tools/notes/requirements.txt
+"""
+
+import argparse
+import html
+import re
+
+import pygments
+from pygments import highlight as pygments_highlight
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import get_lexer_by_name
+from pygments.util import ClassNotFound
+
+from notes_common import cache_dir, cache_get, cache_put, content_hash, read_page, write_page
+
+CODE_BLOCK = re.compile(
+    r'<pre\s+class="sourceCode (?P<lang>[\w+-]+)"><code class="sourceCode (?P=lang)">(?P<body>.*?)</code></pre>',
+    re.S)
+TAG = re.compile(r'<[^>]+>')
+
+# highlight.js <link>/<script> tags and the unguarded theme hook in the theme bootstrap script
+HLJS_ASSETS = re.compile(r'[ \t]*<!-- highlight\.js for syntax highlighting -->\n.*?hljs\.highlightAll\(\);</script>\n', re.S)
+HLJS_THEME_HOOK = re.compile(r'\n[ \t]*// Update highlight\.js theme\n.*?updateHljsTheme\(theme === \'dark\'\);\n', re.S)
+
+CLASS_PREFIX = 'tok-'
+
+# Pygments token class -> (light, dark) colour; GitHub light / GitHub dark palettes,
+# matching the highlight.js themes the page used before.
+TOKEN_COLORS = {
+    'keyword':     (('k', 'kc', 'kd', 'kn', 'kp', 'kr', 'ow'), '#d73a49', '#ff7b72'),
+    'type':        (('kt', 'nb', 'bp'), '#005cc5', '#79c0ff'),
+    'function':    (('nf', 'fm', 'nc', 'ne', 'nd'), '#6f42c1', '#d2a8ff'),
+    'string':      (('s', 's1', 's2', 'sa', 'sb', 'sc', 'sd', 'sh', 'sx', 'sr', 'ss', 'dl'), '#032f62', '#a5d6ff'),
+    'escape':      (('se', 'si'), '#22863a', '#7ee787'),
+    'number':      (('m', 'mb', 'mf', 'mh', 'mi', 'mo', 'il'), '#005cc5', '#79c0ff'),
+    'comment':     (('c', 'c1', 'ch', 'cm', 'cs', 'cp', 'cpf'), '#6a737d', '#8b949e'),
+    'operator':    (('o',), '#d73a49', '#ff7b72'),
+    'error':       (('err',), '#b31d28', '#ffa198'),
+}
+
+
+def stylesheet():
+    """Token CSS keyed on theme variables, so the existing theme toggle recolours code."""
+    light = '\n'.join(f'    --code-{name}: {light};' for name, (_, light, _) in TOKEN_COLORS.items())
+    dark = '\n'.join(f'    --code-{name}: {dark};' for name, (_, _, dark) in TOKEN_COLORS.items())
+    rules = '\n'.join(
+        f'.{CLASS_PREFIX}' + f', .{CLASS_PREFIX}'.join(classes) + f' {{ color: var(--code-{name}); }}'
+        for name, (classes, _, _) in TOKEN_COLORS.items())
+    return (f':root {{\n{light}\n}}\n[data-theme="dark"] {{\n{dark}\n}}\n{rules}\n'
+            f'.{CLASS_PREFIX}cs, .{CLASS_PREFIX}c1, .{CLASS_PREFIX}cm {{ font-style: italic; }}\n')
+
+
+def code_text(body):
+    """Recover the raw source from pandoc's per-line <span>/<a> markup."""
+    return html.unescape(TAG.sub('', body))
+
+
+def highlight(page):
+    """Return page with every tagged code block highlighted and highlight.js removed."""
+    cache = cache_dir('notes', f'highlight-{pygments.__version__}')
+    formatter = HtmlFormatter(nowrap=True, classprefix=CLASS_PREFIX)
+    counts = {'cached': 0, 'highlighted': 0, 'plain': 0}
+
+    def replace(match):
+        lang, code = match.group('lang'), code_text(match.group('body'))
+        key = content_hash(lang, code)
+        markup = cache_get(cache, key)
+        if markup is not None:
+            counts['cached'] += 1
+        else:
+            try:
+                lexer = get_lexer_by_name(lang)
+            except ClassNotFound:
+                counts['plain'] += 1
+                markup = html.escape(code, quote=False)
+            else:
+                counts['highlighted'] += 1
+                markup = pygments_highlight(code, lexer, formatter).rstrip('\n')
+            cache_put(cache, key, markup)
+        return f'<pre class="sourceCode {lang}"><code class="sourceCode {lang}">{markup}</code></pre>'
+
+    page = CODE_BLOCK.sub(replace, page)
+    page = HLJS_ASSETS.sub('', page, count=1)
+    page = HLJS_THEME_HOOK.sub('\n', page, count=1)
+    page = page.replace('</head>', f'<style id="code-highlight">\n{stylesheet()}</style>\n</head>', 1)
+
+    print(f"✓ Code: {sum(counts.values())} blocks ({counts['cached']} cached, "
+          f"{counts['highlighted']} highlighted, {counts['plain']} unknown language)")
+    return page
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('page', help='HTML page to process (normally the copy in public/)')
+    parser.add_argument('-o', '--output', help='write here instead of overwriting PAGE')
+    args = parser.parse_args()
+
+    write_page(args.output or args.page, highlight(read_page(args.page)))
+
+
+if __name__ == '__main__':
+    main()
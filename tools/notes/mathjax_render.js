@@ -0,0 +1,44 @@
+// Batch TeX -> SVG renderer used by prerender_math.py.
+//
+// Reads one JSON request per line on stdin:  {"key": "...", "tex": "...", "display": true}
+// Writes the shared stylesheet first:        {"stylesheet": "..."}
+// then one JSON result per request:          {"key": "...", "html": "..."} or {"key": "...", "error": "..."}
+
+const readline = require('readline');
+const {mathjax} = require('mathjax-full/js/mathjax.js');
+const {TeX} = require('mathjax-full/js/input/tex.js');
+const {SVG} = require('mathjax-full/js/output/svg.js');
+const {liteAdaptor} = require('mathjax-full/js/adaptors/liteAdaptor.js');
+const {RegisterHTMLHandler} = require('mathjax-full/js/handlers/html.js');
+const {AllPackages} = require('mathjax-full/js/input/tex/AllPackages.js');
+
+const adaptor = liteAdaptor();
+RegisterHTMLHandler(adaptor);
+
+const tex = new TeX({
+  packages: AllPackages.filter((name) => name !== 'bussproofs'),
+  // Surface TeX errors instead of rendering red merror boxes into the page
+  formatError: (jax, err) => { throw err; },
+});
+// 'local' keeps every expression self-contained, so cached SVGs can be reused
+// in any order and in any chapter fragment.
+const svg = new SVG({fontCache: 'local'});
+const doc = mathjax.document('', {InputJax: tex, OutputJax: svg});
+
+function write(obj) {
+  process.stdout.write(JSON.stringify(obj) + '\n');
+}
+
+write({stylesheet: adaptor.textContent(svg.styleSheet(doc))});
+
+const lines = readline.createInterface({input: process.stdin, terminal: false});
+lines.on('line', (line) => {
+  if (!line.trim()) return;
+  const request = JSON.parse(line);
+  try {
+    const node = doc.convert(request.tex, {display: request.display});
+    write({key: request.key, html: adaptor.outerHTML(node)});
+  } catch (err) {
+    write({key: request.key, error: String(err && err.message || err)});
+  }
+});
@@ -0,0 +1,72 @@
+"""
+Shared helpers for the ml_ai_notes.html build steps.
+
+The notes page is committed as pandoc output in static/ml_ai_notes.html and
+copied verbatim into public/ by Hugo. The build steps in this directory
+post-process the copy in public/, so the committed source stays untouched
+and every step can be re-run from scratch.
+
+Each step keeps a content-addressed cache under BUILD_CACHE_DIR (default
+.cache/ at the repository root) so unchanged inputs are never re-processed.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+TOOLS_DIR = Path(__file__).resolve().parent
+SOURCE_PAGE = REPO_ROOT / 'static' / 'ml_ai_notes.html'
+PAGE_NAME = SOURCE_PAGE.name
+
+
+def cache_root():
+    """Root directory of the build cache (override with BUILD_CACHE_DIR)."""
+    return Path(os.environ.get('BUILD_CACHE_DIR', REPO_ROOT / '.cache'))
+
+
+def cache_dir(*parts):
+    """Return (and create) a namespaced directory inside the build cache."""
+    path = cache_root().joinpath(*parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def content_hash(*parts):
+    """Stable hex digest of one or more strings, used as a cache key."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def cache_get(directory, key):
+    """Return the cached text for key, or None on a miss."""
+    path = Path(directory) / key[:2] / key
+    try:
+        return path.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return None
+
+
+def cache_put(directory, key, text):
+    """Store text under key; written via a temp file so readers never see partial entries."""
+    path = Path(directory) / key[:2] / key
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f'{key}.{os.getpid()}.tmp')
+    tmp.write_text(text, encoding='utf-8')
+    os.replace(tmp, path)
+
+
+def read_page(path):
+    return Path(path).read_text(encoding='utf-8')
+
+
+def write_page(path, text):
+    """Atomically replace path with text."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    tmp.write_text(text, encoding='utf-8')
+    os.replace(tmp, path)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Server-side MathJax pre-rendering for ml_ai_notes.html
+
+PURPOSE:
+--------
+Pandoc emits every formula as <span class="math inline">\\(...\\)</span> or
+<span class="math display">\\[...\\]</span> and MathJax typesets all ~2,500 of
+them in the browser on every page load. This step renders each expression to
+static SVG once, at build time, and drops the MathJax runtime from the page.
+
+Rendered expressions are cached by a hash of (mode, TeX source, MathJax
+version), so an unchanged formula is never rendered twice. If any expression
+fails to render, its span is left as TeX and the MathJax runtime is kept so
+the browser can still typeset the leftovers.
+
+USAGE:
+------
+    npm install --prefix tools/notes          # once, installs mathjax-full
+    python tools/notes/prerender_math.py public/ml_ai_notes.html
+
+REQUIREMENTS:
+-------------
+    node >= 16 and the mathjax-full package (see tools/notes/package.json)
+"""
+
+import argparse
+import html
+import json
+import re
+import shutil
+import subprocess
+import sys
+
+from notes_common import TOOLS_DIR, cache_dir, cache_get, cache_put, content_hash, read_page, write_page
+
+MATH_SPAN = re.compile(r'<span\s+class="math (inline|display)">(.*?)</span>', re.S)
+# The MathJax config <script> plus the loader <script> that follows it
+MATHJAX_RUNTIME = re.compile(
+    r'[ \t]*<!-- MathJax Configuration.*?tex-chtml-full\.js"\s*type="text/javascript"></script>\n?', re.S)
+
+RENDERER = TOOLS_DIR / 'mathjax_render.js'
+MATHJAX_PACKAGE = TOOLS_DIR / 'node_modules' / 'mathjax-full' / 'package.json'
+STYLESHEET_KEY = content_hash('stylesheet')
+
+
+def mathjax_version():
+    """Installed mathjax-full version, or None when the renderer is unavailable."""
+    if not MATHJAX_PACKAGE.exists() or shutil.which('node') is None:
+        return None
+    return json.loads(MATHJAX_PACKAGE.read_text())['version']
+
+
+def strip_delimiters(source):
+    """Turn the escaped span body '\\(x &lt; y\\)' into plain TeX 'x < y'."""
+    tex = html.unescape(source).strip()
+    if tex[:2] in ('\\(', '\\['):
+        tex = tex[2:-2]
+    return tex.strip()
+
+
+def render_missing(requests):
+    """Render {key: (tex, display)} through the node helper.
+
+    Returns (stylesheet, {key: html}, {key: error}).
+    """
+    proc = subprocess.run(
+        ['node', str(RENDERER)],
+        input=''.join(json.dumps({'key': key, 'tex': tex, 'display': display}) + '\n'
+                      for key, (tex, display) in requests.items()),
+        capture_output=True, text=True, cwd=TOOLS_DIR, check=True)
+
+    stylesheet, rendered, errors = None, {}, {}
+    for line in proc.stdout.splitlines():
+        result = json.loads(line)
+        if 'stylesheet' in result:
+            stylesheet = result['stylesheet']
+        elif 'error' in result:
+            errors[result['key']] = result['error']
+        else:
+            rendered[result['key']] = result['html']
+    return stylesheet, rendered, errors
+
+
+def prerender(page):
+    """Return page with every math span replaced by cached or freshly rendered SVG."""
+    version = mathjax_version()
+    if version is None:
+        print('⚠ mathjax-full not installed; leaving math for client-side MathJax', file=sys.stderr)
+        return page
+
+    cache = cache_dir('notes', f'math-svg-{version}')
+    spans = {}
+    for match in MATH_SPAN.finditer(page):
+        display = match.group(1) == 'display'
+        tex = strip_delimiters(match.group(2))
+        spans[match.group(0)] = (content_hash(match.group(1), tex), tex, display)
+
+    rendered = {key: cache_get(cache, key) for key, _, _ in spans.values()}
+    missing = {key: (tex, display) for key, tex, display in spans.values() if rendered[key] is None}
+    stylesheet = cache_get(cache, STYLESHEET_KEY)
+    errors = {}
+
+    if missing or stylesheet is None:
+        stylesheet, fresh, errors = render_missing(missing)
+        cache_put(cache, STYLESHEET_KEY, stylesheet)
+        for key, markup in fresh.items():
+            cache_put(cache, key, markup)
+        rendered.update(fresh)
+
+    def replace(match):
+        key, tex, display = spans[match.group(0)]
+        if rendered.get(key) is None:
+            return match.group(0)
+        return f'<span class="math {match.group(1)}">{rendered[key]}</span>'
+
+    page = MATH_SPAN.sub(replace, page)
+    page = page.replace('</head>', f'<style id="mathjax-svg">{stylesheet}</style>\n</head>', 1)
+    if not errors:
+        page = MATHJAX_RUNTIME.sub('', page, count=1)
+
+    hits = len(rendered) - len(missing)
+    print(f"✓ Math: {len(rendered)} unique expressions ({hits} cached, {len(missing) - len(errors)} rendered)")
+    for key, error in errors.items():
+        print(f"  ✗ {error}", file=sys.stderr)
+    if errors:
+        print(f"⚠ {len(errors)} expressions failed; keeping the MathJax runtime for them", file=sys.stderr)
+    return page
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('page', help='HTML page to process (normally the copy in public/)')
+    parser.add_argument('-o', '--output', help='write here instead of overwriting PAGE')
+    args = parser.parse_args()
+
+    write_page(args.output or args.page, prerender(read_page(args.page)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+// Client-side search over the precomputed notes index (see build_search_index.py).
+// Index layout: {sections: [[id, title], ...], terms: [sorted...], df: [...],
+//                postings: [[sectionDelta, tf, sectionDelta, tf, ...], ...], stopwords: [...]}
+(function() {
+    var INDEX_URL = '__INDEX_URL__';
+    var index = null;
+    var loading = null;
+
+    function fetchIndex() {
+        if (index) return Promise.resolve(index);
+        if (loading) return loading;
+        var request = ('DecompressionStream' in window)
+            ? fetch(INDEX_URL + '.gz').then(function(response) {
+                return new Response(response.body.pipeThrough(new DecompressionStream('gzip'))).json();
+            })
+            : fetch(INDEX_URL).then(function(response) { return response.json(); });
+        loading = request.then(function(data) {
+            data.stopwordSet = Object.create(null);
+            for (var i = 0; i < data.stopwords.length; i++) data.stopwordSet[data.stopwords[i]] = true;
+            index = data;
+            return data;
+        });
+        return loading;
+    }
+
+    function tokenize(text, stopwords) {
+        return text.toLowerCase().normalize('NFKD').replace(/[\u0300-\u036f]/g, '')
+            .split(/[^\p{L}\p{N}]+/u).filter(function(t) { return t.length > 1 && !stopwords[t]; });
+    }
+
+    // First term index >= prefix in the sorted term list
+    function lowerBound(terms, prefix) {
+        var lo = 0, hi = terms.length;
+        while (lo < hi) {
+            var mid = (lo + hi) >> 1;
+            if (terms[mid] < prefix) lo = mid + 1; else hi = mid;
+        }
+        return lo;
+    }
+
+    // Every query token is matched as a prefix; sections must match all tokens
+    function search(data, query, limit) {
+        var tokens = tokenize(query, data.stopwordSet);
+        if (!tokens.length) return [];
+        var total = data.sections.length;
+        var scores = null;
+        for (var t = 0; t < tokens.length; t++) {
+            var tokenScores = {};
+            for (var i = lowerBound(data.terms, tokens[t]); i < data.terms.length
+                    && data.terms[i].lastIndexOf(tokens[t], 0) === 0; i++) {
+                var idf = Math.log(1 + total / data.df[i]);
+                var postings = data.postings[i];
+                for (var p = 0, section = 0; p < postings.length; p += 2) {
+                    section += postings[p];
+                    tokenScores[section] = (tokenScores[section] || 0) + postings[p + 1] * idf;
+                }
+            }
+            if (scores === null) {
+                scores = tokenScores;
+            } else {
+                for (var key in scores) {
+                    if (key in tokenScores) scores[key] += tokenScores[key]; else delete scores[key];
+                }
+            }
+        }
+        return Object.keys(scores)
+            .sort(function(a, b) { return scores[b] - scores[a]; })
+            .slice(0, limit || 20)
+            .map(function(key) {
+                return { id: data.sections[key][0], title: data.sections[key][1], score: scores[key] };
+            });
+    }
+
+    window.notesSearch = function(query, limit) {
+        return fetchIndex().then(function(data) { return search(data, query, limit); });
+    };
+
+    document.addEventListener('DOMContentLoaded', function() {
+        var input = document.querySelector('.notes-search');
+        var results = document.querySelector('.notes-search-results');
+        if (!input || !results) return;
+        input.addEventListener('focus', fetchIndex, { once: true });
+        input.addEventListener('input', function() {
+            var query = input.value;
+            window.notesSearch(query, 15).then(function(hits) {
+                if (input.value !== query) return;
+                results.innerHTML = '';
+                for (var i = 0; i < hits.length; i++) {
+                    var li = document.createElement('li');
+                    var a = document.createElement('a');
+                    a.href = '#' + hits[i].id;
+                    a.textContent = hits[i].title;
+                    li.appendChild(a);
+                    results.appendChild(li);
+                }
+            });
+        });
+    });
+})();
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Split ml_ai_notes.html into lazily loaded chapter fragments
+
+PURPOSE:
+--------
+The notes page is a single ~2 MB document, so the browser parses every
+heading, image and formula before it can show anything. This step turns the
+built page into:
+
+    ml_ai_notes.html              small shell: <head>, compacted TOC, first chapter
+    ml_ai_notes/<chapter-id>.html one fragment per <h1> chapter
+    ml_ai_notes/ids.json          {chapter-id: [every id inside that chapter]}
+
+The shell replaces each remaining chapter with an empty placeholder section;
+chapter_loader.js fetches a fragment when its placeholder is scrolled near or
+when a link/URL hash targets an id inside it (resolved through ids.json), so
+existing deep links keep working.
+
+Run this last: fragments are cut from the already pre-rendered page.
+
+USAGE:
+------
+    python tools/notes/split_chapters.py public/ml_ai_notes.html
+"""
+
+import argparse
+import gzip
+import json
+import re
+from pathlib import Path
+
+from notes_common import TOOLS_DIR, read_page, write_page
+
+CONTENT_START = '<div class="content">'
+CONTENT_END = re.compile(r'\s*</div>\s*</div>\s*</body>')
+CHAPTER_HEADING = re.compile(r'<h1 id="([^"]+)"')
+ANY_ID = re.compile(r'\sid="([^"]+)"')
+NAV = re.compile(r'<nav class="sidebar">.*?</nav>', re.S)
+# Let the desktop nav script pick up headings from chapters fetched after load
+NAV_REFRESH_ANCHOR = '            var currentActive = null;\n'
+NAV_REFRESH = NAV_REFRESH_ANCHOR + """            document.addEventListener('notes:chapterloaded', function() {
+                headingsArray = Array.prototype.slice.call(document.querySelectorAll('h1[id], h2[id], h3[id]'));
+            });
+"""
+
+# Placeholder height per byte of fragment HTML, so the scrollbar stays roughly honest
+PX_PER_BYTE = 1 / 40
+
+
+def compact_toc(nav):
+    """Drop pandoc's unused toc-* ids and indentation from the sidebar TOC."""
+    nav = re.sub(r'\s+id="toc-[^"]*"', '', nav)
+    return re.sub(r'\s+', ' ', nav)
+
+
+def split_page(page):
+    """Return (shell_head, chapters, shell_tail) with chapters as [(id, html)]."""
+    start = page.index(CONTENT_START) + len(CONTENT_START)
+    end = CONTENT_END.search(page, start).start()
+    content = page[start:end]
+
+    cuts = [m.start() for m in CHAPTER_HEADING.finditer(content)] + [len(content)]
+    chapters = [(CHAPTER_HEADING.match(content, a).group(1), content[a:b].strip())
+                for a, b in zip(cuts, cuts[1:])]
+    return page[:start] + content[:cuts[0]], chapters, page[end:]
+
+
+def split(page_path):
+    page_path = Path(page_path)
+    fragment_dir = page_path.with_suffix('')
+    head, chapters, tail = split_page(read_page(page_path))
+
+    for stale in fragment_dir.glob('*.html'):
+        stale.unlink()
+
+    loader = (TOOLS_DIR / 'chapter_loader.js').read_text(encoding='utf-8')
+    loader = loader.replace('__ID_MAP_URL__', f'{fragment_dir.name}/ids.json')
+    head = NAV.sub(lambda m: compact_toc(m.group(0)), head, count=1)
+    head = head.replace(NAV_REFRESH_ANCHOR, NAV_REFRESH, 1)
+    head = head.replace('</head>', f'<script>\n{loader}</script>\n</head>', 1)
+
+    body, ids = [], {}
+    for index, (chapter_id, html) in enumerate(chapters):
+        ids[chapter_id] = ANY_ID.findall(html)
+        if index == 0:
+            body.append(f'<section class="notes-chapter" data-chapter="{chapter_id}">\n{html}\n</section>')
+            continue
+        src = f'{fragment_dir.name}/{chapter_id}.html'
+        write_page(fragment_dir / f'{chapter_id}.html', html + '\n')
+        body.append(f'<section class="notes-chapter" data-chapter="{chapter_id}" data-src="{src}" '
+                    f'style="min-height: {int(len(html) * PX_PER_BYTE)}px"></section>')
+
+    shell = head + '\n'.join(body) + tail
+    write_page(fragment_dir / 'ids.json', json.dumps(ids, separators=(',', ':')))
+    write_page(page_path, shell)
+
+    first_paint = len(shell.encode('utf-8'))
+    print(f"✓ Split: {len(chapters)} chapters, {sum(map(len, ids.values()))} ids; shell "
+          f"{first_paint / 1024:.0f} KB ({len(gzip.compress(shell.encode('utf-8'))) / 1024:.0f} KB gzipped)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('page', help='HTML page to split in place (normally the copy in public/)')
+    args = parser.parse_args()
+    split(args.page)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Light/dark figure switching for ml_ai_notes.html
+
+PURPOSE:
+--------
+The page has a light and a dark theme, but its figures were plain <img> tags
+with white backgrounds. The figure generators also write a dark copy of
+every figure (`<name>.dark.png`, see static/figures/figure_theme.py); this
+step wraps each <img> that has one in a <picture>:
+
+    <picture><source srcset="figures/x.dark.png" media="(prefers-color-scheme: dark)"
+    data-dark-figure><img src="figures/x.png" alt="..." /></picture>
+
+and adds figure_theme.js, which points those sources at the page's theme
+toggle rather than the OS preference. Figures without a dark copy are left
+as they are.
+
+USAGE:
+------
+    python tools/notes/themed_figures.py public/ml_ai_notes.html
+"""
+
+import argparse
+import html
+import re
+from pathlib import Path
+
+from notes_common import TOOLS_DIR, read_page, write_page
+
+IMG = re.compile(r'(?<!data-dark-figure>)<img\s+src="(?P<src>[^"]+)"[^>]*>')  # not already in a <picture>
+DARK_MEDIA = '(prefers-color-scheme: dark)'
+
+
+def dark_src(src):
+    path = Path(src)
+    return str(path.with_name(f'{path.stem}.dark{path.suffix}'))
+
+
+def theme_figures(page, site_dir):
+    """Return page with every <img> that has a dark copy in site_dir wrapped in a themed <picture>."""
+    counts = {'themed': 0, 'light only': 0}
+
+    def replace(match):
+        src = html.unescape(match.group('src'))
+        dark = dark_src(src)
+        if '://' in src or not (Path(site_dir) / dark).exists():
+            counts['light only'] += 1
+            return match.group(0)
+        counts['themed'] += 1
+        return (f'<picture><source srcset="{html.escape(dark)}" media="{DARK_MEDIA}" data-dark-figure>'
+                f'{match.group(0)}</picture>')
+
+    page = IMG.sub(replace, page)
+    if counts['themed'] and 'id="figure-theme"' not in page:
+        script = (TOOLS_DIR / 'figure_theme.js').read_text(encoding='utf-8')
+        page = page.replace('</head>', f'<script id="figure-theme">\n{script}</script>\n</head>', 1)
+    print(f"✓ Figures: {counts['themed']} with a dark variant, {counts['light only']} light only")
+    return page
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('page', help='HTML page to process (normally the copy in public/)')
+    parser.add_argument('-o', '--output', help='write here instead of overwriting PAGE')
+    args = parser.parse_args()
+
+    write_page(args.output or args.page, theme_figures(read_page(args.page), Path(args.page).parent))
+
+
+if __name__ == '__main__':
+    main()